@@ -36,6 +36,7 @@ CREATE TABLE IF NOT EXISTS place (
     max_guest INTEGER NOT NULL DEFAULT 2,
     latitude FLOAT,
     longitude FLOAT,
+    geohash VARCHAR(12),
     city VARCHAR(100),
     country VARCHAR(100),
     status VARCHAR(20) NOT NULL DEFAULT 'active'
@@ -43,9 +44,22 @@ CREATE TABLE IF NOT EXISTS place (
     property_type VARCHAR(20) NOT NULL DEFAULT 'apartment'
         CHECK (property_type IN ('house', 'apartment', 'villa')),
     minimum_stay INTEGER NOT NULL DEFAULT 1,
+    amenity_mask BIGINT NOT NULL DEFAULT 0,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_avg FLOAT,
     FOREIGN KEY (owner_id) REFERENCES user(id)
 );
 
+-- Geohash prefixes are searched as ranges by Place.get_by_location
+CREATE INDEX IF NOT EXISTS ix_place_geohash ON place (geohash);
+-- Filters combined by PlaceQuery
+CREATE INDEX IF NOT EXISTS ix_place_price_by_night ON place (price_by_night);
+CREATE INDEX IF NOT EXISTS ix_place_max_guest ON place (max_guest);
+CREATE INDEX IF NOT EXISTS ix_place_status ON place (status);
+CREATE INDEX IF NOT EXISTS ix_place_property_type ON place (property_type);
+CREATE INDEX IF NOT EXISTS ix_place_rating_avg ON place (rating_avg);
+
 -- Reviews table with rating enum
 CREATE TABLE IF NOT EXISTS review (
     id VARCHAR(36) PRIMARY KEY,
@@ -58,9 +72,13 @@ CREATE TABLE IF NOT EXISTS review (
     text TEXT NOT NULL,
     rating VARCHAR(1) CHECK (rating IN ('1', '2', '3', '4', '5')),
     FOREIGN KEY (place_id) REFERENCES place(id),
-    FOREIGN KEY (user_id) REFERENCES user(id)
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    UNIQUE(user_id, place_id)
 );
 
+-- Reviews of a place (listing pages and Place.rebuild_ratings)
+CREATE INDEX IF NOT EXISTS ix_review_place_id ON review (place_id);
+
 -- Amenities table with category enum
 CREATE TABLE IF NOT EXISTS amenity (
     id VARCHAR(36) PRIMARY KEY,
@@ -71,7 +89,8 @@ CREATE TABLE IF NOT EXISTS amenity (
     name VARCHAR(120) NOT NULL UNIQUE,
     description TEXT NOT NULL,
     category VARCHAR(20) NOT NULL DEFAULT 'supernatural'
-        CHECK (category IN ('safety', 'comfort', 'entertainment', 'supernatural', 'blocked'))
+        CHECK (category IN ('safety', 'comfort', 'entertainment', 'supernatural', 'blocked')),
+    bit INTEGER UNIQUE
 );
 
 -- Place-Amenity association table
@@ -87,3 +106,6 @@ CREATE TABLE IF NOT EXISTS placeamenity (
     FOREIGN KEY (amenity_id) REFERENCES amenity(id),
     UNIQUE(place_id, amenity_id)
 );
+
+CREATE INDEX IF NOT EXISTS ix_placeamenity_amenity_id
+    ON placeamenity (amenity_id);
@@ -6,7 +6,11 @@ from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from flask_sqlalchemy import SQLAlchemy
 
+from app.utils.compression import init_compression
 from app.utils.haunted_logger import haunted_logger
+from app.utils.json_provider import HauntedJSONProvider
+from app.utils.metrics import haunted_metrics
+from app.utils.query_stats import init_query_stats
 from config import config
 
 # Preparing our mystical extensions
@@ -14,30 +18,55 @@ db = SQLAlchemy()
 bcrypt = Bcrypt()
 jwt = JWTManager()
 
-from app.cli import init_db_command
+from app.cli import (
+    gen_data_command,
+    import_data_command,
+    init_db_command,
+    rebuild_ratings_command,
+    rebuild_search_command,
+)
+from app.persistence.cache import identity_cache, query_cache
 
 
 def create_app(config_name="default"):
     """Summon our haunted API! 👻."""
     from app.api import api_bp  # NOQA : E402
 
-    # write everything in the Grimoire
-    haunted_logger.setup_logging()
-
     # Initialize our Main Spell
     app = Flask(__name__)
     app.url_map.strict_slashes = False
 
     # Preparing ingredients for our spell
     app.config.from_object(config[config_name])
+    app.json = HauntedJSONProvider(app)
+
+    # write everything in the Grimoire
+    haunted_logger.setup_logging(
+        async_mode=app.config.get("LOG_ASYNC"),
+        levels=app.config.get("LOG_LEVELS"),
+        sampling=app.config.get("LOG_SAMPLING"),
+    )
+    haunted_metrics.enabled = app.config.get("METRICS_ENABLED", True)
 
     # Adding some Dark Magic to make the RECIPES work
     db.init_app(app)
+    identity_cache.configure(
+        maxsize=app.config.get("IDENTITY_CACHE_SIZE", 1024),
+        ttl=app.config.get("IDENTITY_CACHE_TTL", 30.0),
+    )
+    query_cache.configure(
+        maxsize=app.config.get("QUERY_CACHE_SIZE", 512),
+        ttl=app.config.get("QUERY_CACHE_TTL", 30.0),
+    )
     bcrypt.init_app(app)
     jwt.init_app(app)
 
     # Adding some Dark Magic to make the RECIPES work
     app.cli.add_command(init_db_command)
+    app.cli.add_command(import_data_command)
+    app.cli.add_command(gen_data_command)
+    app.cli.add_command(rebuild_ratings_command)
+    app.cli.add_command(rebuild_search_command)
 
     # AnyOne Fool enough to summon us, will enter our realm !
     CORS(
@@ -54,5 +83,7 @@ def create_app(config_name="default"):
     # Winding Routes 🛤️ to the realm of Haunted BnB
 
     app.register_blueprint(api_bp)
+    init_compression(app)
+    init_query_stats(app)
 
     return app
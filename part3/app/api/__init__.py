@@ -1,12 +1,25 @@
 """API initialization and configuration! 👻."""
 
-from flask import Blueprint
+from flask import Blueprint, current_app, make_response
 from flask_restx import Api
 
-from app.utils import admin_only, auth_required, log_me, owner_only, user_only
+from app.utils import (
+    admin_only,
+    auth_required,
+    log_me,
+    owner_only,
+    signed_in,
+    user_only,
+)
 
+from .batch import batch_response, run_batch
+from .conditional import conditional, strong_etag, validated
+from .export import export_response
+from .fieldsets import field_args, sparse
+from .pagination import page_args, paginated
 from .v1.amenities import ns as amenities_ns
 from .v1.auth import ns as auth_ns
+from .v1.metrics import ns as metrics_ns
 from .v1.places import ns as places_ns
 from .v1.reviews import ns as reviews_ns
 from .v1.users import ns as users_ns
@@ -19,12 +32,22 @@ api = Api(
     description="A haunted vacation rental API 👻",
 )
 
+
+@api.representation("application/json")
+def output_json(data, code, headers=None):
+    """Encode API payloads with the app JSON provider! ⚡"""
+    response = make_response(f"{current_app.json.dumps(data)}\n", code)
+    response.headers.extend(headers or {})
+    return response
+
+
 # Ajout des namespaces à l'API
 api.add_namespace(auth_ns, path="/login")
 api.add_namespace(users_ns, path="/users")
 api.add_namespace(places_ns, path="/places")
 api.add_namespace(reviews_ns, path="/reviews")
 api.add_namespace(amenities_ns, path="/amenities")
+api.add_namespace(metrics_ns, path="/metrics")
 
 __all__ = [
     "api_bp",
@@ -32,6 +55,17 @@ __all__ = [
     "auth_required",
     "admin_only",
     "owner_only",
+    "signed_in",
     "user_only",
     "log_me",
+    "batch_response",
+    "run_batch",
+    "conditional",
+    "strong_etag",
+    "validated",
+    "field_args",
+    "export_response",
+    "sparse",
+    "page_args",
+    "paginated",
 ]
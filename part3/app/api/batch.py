@@ -0,0 +1,69 @@
+"""Batch helpers for our haunted bulk endpoints! 📦"""
+
+from flask import current_app, request
+from flask_restx import marshal
+
+from app.services.facade import HBnBFacade
+
+facade = HBnBFacade()
+
+
+def batch_items() -> list:
+    """Read the JSON array of a batch request! 📥"""
+    items = request.get_json(silent=True)
+    if not isinstance(items, list) or not items:
+        raise ValueError("A batch must be a non-empty JSON array of items")
+
+    max_items = current_app.config.get("BATCH_MAX_ITEMS", 1000)
+    if len(items) > max_items:
+        raise ValueError(f"A batch holds at most {max_items} items")
+    return items
+
+
+def run_batch(model_class, prepare=None) -> list:
+    """Create every item of the batch through the bulk facade path! ✨
+
+    Args:
+        model_class: The haunted model to summon
+        prepare: Optional hook turning an item into constructor kwargs,
+            raising ValueError to reject that item only
+
+    Returns:
+        One status per item, in order (see ``HBnBFacade.create_many``)
+    """
+    items = batch_items()
+    results = [None] * len(items)
+    rows, positions = [], []
+    for index, item in enumerate(items):
+        try:
+            if not isinstance(item, dict):
+                raise ValueError("Each item must be a JSON object")
+            rows.append(prepare(dict(item)) if prepare else item)
+            positions.append(index)
+        except ValueError as e:
+            results[index] = {
+                "index": index,
+                "status": "error",
+                "message": str(e),
+            }
+
+    if rows:
+        created = facade.create_many(model_class, rows)
+        for position, result in zip(positions, created):
+            results[position] = {**result, "index": position}
+    return results
+
+
+def batch_response(results: list, model):
+    """One status per item: 201 when all were created, 207 otherwise! 📤"""
+    body = []
+    for result in results:
+        entry = {"index": result["index"], "status": result["status"]}
+        if "item" in result:
+            entry["item"] = marshal(result["item"], model)
+        else:
+            entry["message"] = result["message"]
+        body.append(entry)
+
+    all_created = all(r["status"] == "created" for r in results)
+    return body, 201 if all_created else 207
@@ -0,0 +1,133 @@
+"""Conditional GET helpers: don't resend what the client already has! 🏷️"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Optional, Tuple
+
+from flask import Response, request
+from flask_restx.utils import unpack
+from sqlalchemy import func, select
+
+from app import db
+
+Validators = Tuple[str, Optional[datetime]]
+
+
+def strong_etag(data) -> str:
+    """Fingerprint a payload, byte for byte! 🔏
+
+    The payload is hashed in a canonical JSON form, so two equal
+    payloads always share the same tag.
+    """
+    canonical = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return f'"{hashlib.sha256(canonical.encode()).hexdigest()}"'
+
+
+def _utc(moment: Optional[datetime]) -> Optional[datetime]:
+    """SQLite forgets time zones: our timestamps are all UTC! 🌍"""
+    if moment is not None and moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def entity_validators(obj) -> Validators:
+    """ETag and Last-Modified of one entity, from its id and updated_at! 🏷️
+
+    The query string (``?fields=`` for one) shapes the representation,
+    so it is part of the tag as well.
+    """
+    updated_at = _utc(obj.updated_at)
+    stamp = updated_at.isoformat() if updated_at else ""
+    query = request.query_string.decode()
+    return strong_etag([obj.__tablename__, obj.id, stamp, query]), updated_at
+
+
+def table_validators(model) -> Validators:
+    """ETag and Last-Modified of a list, in one aggregate query! 📊
+
+    Any insert or update moves max(updated_at) and any hard delete moves
+    the row count; the query string is part of the tag, since each
+    filter gives a different list.
+    """
+    count, updated_at = db.session.execute(
+        select(func.count(model.id), func.max(model.updated_at))
+    ).one()
+    updated_at = _utc(updated_at)
+    stamp = updated_at.isoformat() if updated_at else ""
+    etag = strong_etag(
+        [model.__tablename__, count, stamp, request.full_path]
+    )
+    return etag, updated_at
+
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    """Does the client already hold this exact representation? 🤔
+
+    If-None-Match wins over If-Modified-Since (RFC 9110 13.2.2), and
+    tags are compared weakly as that header requires.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag.strip('"'))
+    since = request.if_modified_since
+    if since is None or last_modified is None:
+        return False
+    # Les dates HTTP s'arrêtent à la seconde
+    return last_modified.replace(microsecond=0) <= since
+
+
+def _headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    """The validator headers of a response! 📨"""
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = last_modified.strftime(
+            "%a, %d %b %Y %H:%M:%S GMT"
+        )
+    return headers
+
+
+def conditional(data, status: int = 200):
+    """Answer with an ETag, or a bodiless 304 when the client is fresh! ♻️"""
+    etag = strong_etag(data)
+    if not_modified(etag, None):
+        return "", 304, {"ETag": etag}
+    return data, status, {"ETag": etag}
+
+
+def validated(model, id_arg: Optional[str] = None):
+    """Add ETag/Last-Modified to a GET and answer 304s before any work! 🛡️
+
+    With ``id_arg``, the validators come from the entity named by that
+    view argument (through the identity cache, so the handler reloads it
+    for free); without it, from the whole table. Place this decorator
+    above ``marshal_with``: a 304 then skips serialization entirely.
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if id_arg is None:
+                etag, last_modified = table_validators(model)
+            else:
+                obj = model.get_by_id(kwargs[id_arg])
+                if obj is None:
+                    return fn(*args, **kwargs)  # Le 404 reste au handler
+                etag, last_modified = entity_validators(obj)
+
+            headers = _headers(etag, last_modified)
+            if not_modified(etag, last_modified):
+                return Response(status=304, headers=headers)
+
+            data, code, extra = unpack(fn(*args, **kwargs))
+            if code != 200:
+                return data, code, extra
+            extra = dict(extra or {})
+            extra.update(headers)
+            return data, code, extra
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,38 @@
+"""Sparse fieldsets: send only the fields a client asked for! ✂️"""
+
+from typing import List, Optional
+
+from flask import request
+
+
+def field_args(api_model, model_class) -> Optional[List[str]]:
+    """Read the ?fields=a,b,c spell from the query string! 🔖
+
+    Every name must be both a field of the API model and a column of the
+    table, so that it can be selected straight in SQL. Returns None when
+    the client wants every field.
+    """
+    raw = request.args.get("fields")
+    if raw is None:
+        return None
+    fields = list(dict.fromkeys(f.strip() for f in raw.split(",")))
+    fields = [name for name in fields if name]
+    if not fields:
+        raise ValueError("fields must name at least one field")
+
+    columns = model_class.__table__.columns
+    allowed = [name for name in api_model if name in columns]
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)} "
+            f"(choose among: {', '.join(allowed)})"
+        )
+    return fields
+
+
+def sparse(api_model, fields: Optional[List[str]]):
+    """Narrow an API model down to the requested fields! 🪶"""
+    if fields is None:
+        return api_model
+    return {name: api_model[name] for name in fields}
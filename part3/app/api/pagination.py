@@ -0,0 +1,38 @@
+"""Cursor pagination helpers for our haunted list endpoints! 📜"""
+
+from flask import current_app, request
+from flask_restx import marshal
+
+
+def page_args():
+    """Read the ?limit= and ?cursor= spells from the query string! 🔖
+
+    Returns (None, None) when the client did not ask for a page, so the
+    endpoint keeps answering with a plain list.
+    """
+    raw_limit = request.args.get("limit")
+    cursor = request.args.get("cursor") or None
+    if raw_limit is None and cursor is None:
+        return None, None
+
+    try:
+        limit = int(
+            raw_limit or current_app.config.get("PAGE_SIZE_DEFAULT", 20)
+        )
+    except ValueError:
+        raise ValueError("limit must be a positive integer")
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+
+    return min(limit, current_app.config.get("PAGE_SIZE_MAX", 100)), cursor
+
+
+def paginated(items, model, limit):
+    """Marshal spirits, wrapped in a page envelope when one was asked! 📦"""
+    data = marshal(list(items), model)
+    if limit is None:
+        return data
+    return {
+        "items": data,
+        "next_cursor": getattr(items, "next_cursor", None),
+    }
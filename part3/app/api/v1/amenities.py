@@ -1,9 +1,20 @@
 """Amenities API routes - The supernatural features catalog! 🎭."""
 
 from flask import request
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, marshal
 
-from app.api import admin_only, log_me
+from app.api import (
+    admin_only,
+    batch_response,
+    export_response,
+    field_args,
+    log_me,
+    page_args,
+    paginated,
+    run_batch,
+    sparse,
+    validated,
+)
 from app.models.amenity import Amenity
 from app.services.facade import HBnBFacade
 
@@ -71,6 +82,7 @@ class AmenityList(Resource):
     """Endpoint for managing supernatural features! 👻"""
 
     @log_me(component="api")
+    @validated(Amenity)
     @ns.doc(
         "List all amenities - Public",
         responses={
@@ -78,16 +90,24 @@ class AmenityList(Resource):
             400: "Invalid parameters",
         },
     )
-    @ns.marshal_list_with(amenity_model)
+    @ns.response(200, "Success", [amenity_model])
     @ns.param("category", "Feature category", type=str, required=False)
+    @ns.param("limit", "Page size (cursor mode)", type=int, required=False)
+    @ns.param("cursor", "next_cursor of the previous page", required=False)
+    @ns.param("fields", "Comma-separated fields to return", required=False)
     def get(self):
         """Browse our supernatural features catalog! 🎭"""
         try:
             criteria = {}
             if "category" in request.args:
                 criteria["category"] = request.args["category"]
-            amenities = facade.find(Amenity, **criteria)
-            return amenities or [], 200
+            limit, cursor = page_args()
+            fields = field_args(amenity_model, Amenity)
+            amenities = facade.find(
+                Amenity, limit=limit, cursor=cursor, fields=fields, **criteria
+            )
+            model = sparse(amenity_model, fields)
+            return paginated(amenities, model, limit), 200
         except Exception as e:
             return {
                 "message": f"A spectral error occurred: {str(e)} 👻",
@@ -120,12 +140,71 @@ class AmenityList(Resource):
             }, 400
 
 
+@ns.route("/export")
+class AmenityExport(Resource):
+    """Endpoint for streaming every supernatural feature out of our realm! 🌊"""
+
+    @log_me(component="api")
+    @admin_only
+    @ns.doc(
+        "Export all amenities as NDJSON or CSV - Admin Only",
+        security="Bearer Auth",
+        params={
+            "format": "ndjson (default) or csv",
+            "fields": "Comma-separated fields to export",
+        },
+        responses={
+            200: "Streamed export",
+            400: "Invalid parameters",
+            401: "Unauthorized",
+            403: "Forbidden - Admin privileges required",
+        },
+    )
+    def get(self):
+        """Pour every supernatural feature out, row by row! 🌊"""
+        try:
+            return export_response(
+                amenity_model,
+                Amenity,
+                where=(Amenity.is_deleted == False,),  # noqa: E712
+            )
+        except ValueError as e:
+            return {"message": str(e)}, 400
+
+
+@ns.route("/batch")
+class AmenityBatch(Resource):
+    """Endpoint for creating many supernatural features at once! 🎭"""
+
+    @log_me(component="api")
+    @admin_only
+    @ns.doc(
+        "Create amenities in bulk - Admin only",
+        security="Bearer Auth",
+        responses={
+            201: "All features created",
+            207: "Some features failed, see each item status",
+            400: "Invalid batch",
+            401: "Unauthorized",
+            403: "Forbidden - Admin only",
+        },
+    )
+    @ns.expect([amenity_model], validate=False)
+    def post(self):
+        """Stock the whole supernatural catalog! ✨"""
+        try:
+            return batch_response(run_batch(Amenity), amenity_model)
+        except ValueError as e:
+            return {"message": f"Invalid haunted batch: {str(e)} 👻"}, 400
+
+
 @ns.route("/<string:amenity_id>")
 @ns.param("amenity_id", "The supernatural feature identifier")
 class AmenityDetail(Resource):
     """Endpoint for managing individual features! 👻"""
 
     @log_me(component="api")
+    @validated(Amenity, "amenity_id")
     @ns.doc(
         "Get a specific amenity details - Public Endpoint",
         responses={
@@ -133,10 +212,15 @@ class AmenityDetail(Resource):
             404: "Amenity not found",
         },
     )
+    @ns.param("fields", "Comma-separated fields to return", required=False)
     @ns.response(200, "Success", amenity_model)
     @ns.response(404, "Not Found", error_model)
     def get(self, amenity_id):
         """Find a specific supernatural feature! 🔍"""
+        try:
+            fields = field_args(amenity_model, Amenity)
+        except ValueError as e:
+            return {"message": str(e)}, 400
         try:
             amenity = facade.get(Amenity, amenity_id)
             if not isinstance(amenity, Amenity):
@@ -144,7 +228,7 @@ class AmenityDetail(Resource):
                     "message": "This feature has vanished! 👻",
                     "amenity": None,
                 }, 404
-            return amenity, 200
+            return marshal(amenity, sparse(amenity_model, fields)), 200
         except Exception as e:
             return {
                 "message": f"Failed to find feature: {str(e)} 👻",
@@ -0,0 +1,34 @@
+"""Metrics endpoint - Where we count every haunting! 📊."""
+
+from flask import Response
+from flask_restx import Namespace, Resource
+
+from app.api import admin_only
+from app.utils import haunted_metrics
+
+ns = Namespace(
+    "metrics",
+    description="Call counts and latency of our haunted layers 📊",
+)
+
+
+@ns.route("/")
+class Metrics(Resource):
+    """Endpoint exposing the log_me metrics registry! 👻"""
+
+    @admin_only
+    @ns.doc(
+        "Get metrics - Admin only",
+        security="Bearer Auth",
+        responses={
+            200: "Prometheus text exposition",
+            401: "Unauthorized",
+            403: "Forbidden - Admin only",
+        },
+    )
+    def get(self):
+        """Read the haunted counters, Prometheus style! 📜"""
+        return Response(
+            haunted_metrics.render(),
+            mimetype="text/plain; version=0.0.4",
+        )
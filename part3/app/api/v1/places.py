@@ -1,15 +1,33 @@
 """Places API routes - The haunted real estate office! 🏚️."""
 
-from flask import request
+from flask import current_app, request
 from flask_jwt_extended import get_jwt
-from flask_restx import Namespace, Resource, fields, reqparse
+from flask_restx import Namespace, Resource, fields, marshal, reqparse
 
-from app.api import admin_only, auth_required, log_me, owner_only, user_only
+from app.api import (
+    admin_only,
+    auth_required,
+    batch_response,
+    conditional,
+    export_response,
+    field_args,
+    log_me,
+    owner_only,
+    page_args,
+    paginated,
+    run_batch,
+    signed_in,
+    sparse,
+    user_only,
+    validated,
+)
 from app.models.amenity import Amenity
 from app.models.place import Place
+from app.models.place_query import PlaceQuery
 from app.models.placeamenity import PlaceAmenity
 from app.models.review import Review
 from app.models.user import User
+from app.persistence import search
 from app.services.facade import HBnBFacade
 
 authorizations = {
@@ -105,6 +123,12 @@ place_model = ns.model(
             description="Type of haunted property",
             example="house",
         ),
+        "review_count": fields.Integer(
+            readonly=True, description="Number of rated reviews", example=12
+        ),
+        "rating_avg": fields.Float(
+            readonly=True, description="Average spooky rating", example=4.5
+        ),
     },
 )
 
@@ -162,6 +186,116 @@ place_review_model = ns.model(
     },
 )
 
+# Modèle pour la recherche des plus proches voisins
+nearby_place_model = ns.clone(
+    "NearbyPlace",
+    place_model,
+    {
+        "distance_km": fields.Float(
+            readonly=True,
+            description="Great-circle distance to the search point",
+            example=1.25,
+        ),
+    },
+)
+
+# Modèles pour la recherche plein texte
+search_hit_model = ns.clone(
+    "PlaceSearchHit",
+    place_model,
+    {
+        "score": fields.Float(
+            readonly=True,
+            description="BM25 relevance, lower is better",
+            example=-4.2,
+        ),
+        "snippet": fields.String(
+            readonly=True,
+            description="Matching excerpt, terms wrapped in <mark>",
+            example="A <mark>haunted</mark> manor by the lake",
+        ),
+    },
+)
+
+search_page_model = ns.model(
+    "PlaceSearchPage",
+    {
+        "items": fields.List(fields.Nested(search_hit_model)),
+        "next_cursor": fields.String(
+            description="Pass as ?cursor= to get the next hits"
+        ),
+    },
+)
+
+# Modèle pour les liens créés en masse
+place_amenity_link_model = ns.model(
+    "PlaceAmenityLink",
+    {
+        "id": fields.String(
+            readonly=True,
+            description="Unique identifier of the link",
+            example="123e4567-e89b-12d3-a456-426614174000",
+        ),
+        "place_id": fields.String(
+            readonly=True,
+            description="The haunted property ID",
+            example="123e4567-e89b-12d3-a456-426614174000",
+        ),
+        "amenity_id": fields.String(
+            required=True,
+            description="The supernatural feature ID",
+            example="123e4567-e89b-12d3-a456-426614174000",
+        ),
+    },
+)
+
+# Modèles pour la page complète d'une place
+user_summary_model = ns.model(
+    "UserSummary",
+    {
+        "id": fields.String(
+            readonly=True,
+            description="Ghost identifier",
+            example="123e4567-e89b-12d3-a456-426614174000",
+        ),
+        "first_name": fields.String(readonly=True, example="Casper"),
+        "last_name": fields.String(readonly=True, example="Friendly"),
+    },
+)
+
+page_review_model = ns.clone(
+    "PlacePageReview",
+    place_review_model,
+    {
+        "created_at": fields.DateTime(readonly=True),
+        "author": fields.Nested(
+            user_summary_model,
+            allow_null=True,
+            description="None once the review was anonymized",
+        ),
+    },
+)
+
+place_page_model = ns.model(
+    "PlacePage",
+    {
+        "place": fields.Nested(place_model),
+        "owner": fields.Nested(user_summary_model, allow_null=True),
+        "amenities": fields.List(fields.Nested(place_amenity_model)),
+        "reviews": fields.Nested(
+            ns.model(
+                "PlacePageReviews",
+                {
+                    "items": fields.List(fields.Nested(page_review_model)),
+                    "next_cursor": fields.String(
+                        description="Pass as ?cursor= to get more reviews"
+                    ),
+                },
+            )
+        ),
+    },
+)
+
 error_model = ns.model(
     "ErrorResponse",
     {
@@ -173,6 +307,45 @@ error_model = ns.model(
 )
 
 
+def place_query(args) -> PlaceQuery:
+    """Turn the list query string into one PlaceQuery! 🧩"""
+    # Tous les filtres se combinent en une seule requête SQL
+    query = PlaceQuery()
+    if args.price_min is not None or args.price_max is not None:
+        query.price(args.price_min, args.price_max)
+
+    if args.latitude is not None and args.longitude is not None:
+        # Valider les coordonnées
+        if not (-90 <= args.latitude <= 90):
+            ns.abort(400, "Latitude must be between -90 and 90")
+        if not (-180 <= args.longitude <= 180):
+            ns.abort(400, "Longitude must be between -180 and 180")
+        query.within(args.latitude, args.longitude, args.radius)
+
+    if args.bbox:
+        try:
+            box = [float(v) for v in args.bbox.split(",")]
+        except ValueError:
+            box = []
+        if len(box) != 4:
+            ns.abort(400, "bbox must be min_lat,min_lon,max_lat,max_lon")
+        query.bbox(*box)
+
+    if args.amenities:
+        query.amenities(args.amenities)
+    if args.property_type is not None:
+        query.property_type(args.property_type)
+    if args.capacity is not None:
+        query.capacity(args.capacity)
+    if args.status is not None:
+        query.status(args.status)
+    if args.min_rating is not None:
+        query.min_rating(args.min_rating)
+    if args.get("sort") is not None:
+        query.order_by(args.sort)
+    return query
+
+
 @ns.route("/")
 class PlaceList(Resource):
     # Créer le parser pour les query parameters
@@ -198,8 +371,32 @@ class PlaceList(Resource):
     parser.add_argument(
         "property_type", type=str, help="Type of haunted property"
     )
+    parser.add_argument(
+        "bbox", type=str, help="Bounding box: min_lat,min_lon,max_lat,max_lon"
+    )
+    parser.add_argument("capacity", type=int, help="Minimum guest capacity")
+    parser.add_argument("status", type=str, help="Haunting status")
+    parser.add_argument(
+        "min_rating", type=float, help="Minimum average rating"
+    )
+    parser.add_argument(
+        "sort",
+        type=str,
+        help=(
+            "price, capacity, name, created_at, rating, reviews "
+            "or distance (- to reverse)"
+        ),
+    )
+    parser.add_argument("limit", type=int, help="Page size (cursor mode)")
+    parser.add_argument(
+        "cursor", type=str, help="next_cursor of the previous page"
+    )
+    parser.add_argument(
+        "fields", type=str, help="Comma-separated fields to return"
+    )
 
     @log_me(component="api")
+    @validated(Place)
     @ns.doc(
         "list all places - Public endpoint",
         responses={
@@ -208,42 +405,29 @@ class PlaceList(Resource):
         },
     )
     @ns.expect(parser)  # Utiliser le parser
-    @ns.marshal_list_with(place_model)
+    @ns.response(200, "Success", [place_model])
     def get(self):
         """Browse our haunted catalog! 👻"""
         try:
             args = self.parser.parse_args()
 
-            # Vérifier les filtres de prix
-            if args.price_min is not None and args.price_max is not None:
-                places = Place.filter_by_price(args.price_min, args.price_max)
-                return places or [], 200
-
-            # Vérifier les filtres de localisation
-            if args.latitude is not None and args.longitude is not None:
-                # Valider les coordonnées
-                if not (-90 <= args.latitude <= 90):
-                    ns.abort(400, "Latitude must be between -90 and 90")
-                if not (-180 <= args.longitude <= 180):
-                    ns.abort(400, "Longitude must be between -180 and 180")
-
-                places = Place.get_by_location(
-                    args.latitude, args.longitude, args.radius
-                )
-                return places or [], 200
-
-            # Vérifier les filtres d'équipements
-            if args.amenities is not None:
-                places = Place.find_by(Amenity, args.amenities)
-                return places or [], 200
+            limit, cursor = page_args()
+            fields = field_args(place_model, Place)
 
-            if args.property_type is not None:
-                places = Place.find_by(Place, args.property_type)
-                return (places or [],)
+            query = place_query(args)
+            if fields is not None:
+                query.only(fields)
 
             # Si pas de filtres, retourner toutes les places
-            places = facade.find(Place)
-            return places or [], 200
+            if not query.filtered and args.sort is None:
+                places = facade.find(
+                    Place, limit=limit, cursor=cursor, fields=fields
+                )
+            elif limit is not None:
+                places = query.page(limit, cursor)
+            else:
+                places = query.all()
+            return paginated(places, sparse(place_model, fields), limit), 200
 
         except Exception as e:
             ns.abort(400, str(e))
@@ -279,6 +463,166 @@ class PlaceList(Resource):
             }, 400
 
 
+@ns.route("/export")
+class PlaceExport(Resource):
+    """Endpoint for streaming every haunted property out of our realm! 🌊"""
+
+    @log_me(component="api")
+    @admin_only
+    @ns.doc(
+        "Export all places as NDJSON or CSV - Admin Only",
+        security="Bearer Auth",
+        params={
+            "format": "ndjson (default) or csv",
+            "fields": "Comma-separated fields to export",
+        },
+        responses={
+            200: "Streamed export",
+            400: "Invalid parameters",
+            401: "Unauthorized",
+            403: "Forbidden - Admin privileges required",
+        },
+    )
+    def get(self):
+        """Pour the whole haunted catalog out, row by row! 🌊"""
+        try:
+            return export_response(
+                place_model,
+                Place,
+                where=(Place.is_deleted == False,),  # noqa: E712
+            )
+        except ValueError as e:
+            return {"message": str(e)}, 400
+
+
+@ns.route("/batch")
+class PlaceBatch(Resource):
+    """Endpoint for summoning many haunted properties at once! 🏘️.
+
+    Each item gets its own status, so one bad ghost house
+    does not send the whole neighbourhood back to the void.
+    Non-admins can only create properties they own."""
+
+    @log_me(component="api")
+    @user_only
+    @ns.doc(
+        "Create places in bulk - Authenticated endpoint",
+        security="Bearer Auth",
+        responses={
+            201: "All places created",
+            207: "Some places failed, see each item status",
+            400: "Invalid batch",
+            401: "Unauthorized",
+        },
+    )
+    @ns.expect([place_model], validate=False)
+    def post(self):
+        """Summon a whole haunted neighbourhood! 🏗️"""
+        claims = get_jwt()
+
+        def prepare(row):
+            if not claims.get("is_admin"):
+                owner_id = row.setdefault("owner_id", claims.get("user_id"))
+                if owner_id != claims.get("user_id"):
+                    raise ValueError("This isn't your haunt! 👻")
+            return row
+
+        try:
+            return batch_response(run_batch(Place, prepare), place_model)
+        except ValueError as e:
+            return {"message": f"Invalid haunted batch: {str(e)} 👻"}, 400
+
+
+@ns.route("/search")
+class PlaceSearch(Resource):
+    """Endpoint for searching haunted properties by their words! 🔍"""
+
+    parser = PlaceList.parser.copy()
+    parser.add_argument("q", type=str, required=True, help="Words to look for")
+    parser.remove_argument("sort")  # Hits come best match first
+
+    @log_me(component="api")
+    @validated(Place)
+    @ns.doc(
+        "Search places by name, description, city or country "
+        "- Public endpoint",
+        responses={200: "Success", 400: "Invalid parameters"},
+    )
+    @ns.expect(parser)
+    @ns.response(200, "Success", search_page_model)
+    def get(self):
+        """Whisper a few words, the right haunts answer! 🔮"""
+        args = self.parser.parse_args()
+        try:
+            limit, cursor = page_args()
+            limit = limit or current_app.config.get("PAGE_SIZE_DEFAULT", 20)
+            offset = search.decode_offset(cursor)
+            query = place_query(args).matching(args.q)
+            hits = query.search(limit=limit + 1, offset=offset)
+        except ValueError as e:
+            ns.abort(400, str(e))
+
+        next_cursor = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            next_cursor = search.encode_offset(offset + limit)
+        return {
+            "items": [
+                {
+                    **marshal(hit.place, place_model),
+                    "score": hit.score,
+                    "snippet": hit.snippet,
+                }
+                for hit in hits
+            ],
+            "next_cursor": next_cursor,
+        }, 200
+
+
+@ns.route("/nearest")
+class PlaceNearest(Resource):
+    """Endpoint for finding the closest haunted properties! 🧭"""
+
+    parser = reqparse.RequestParser()
+    parser.add_argument(
+        "lat", type=float, required=True, help="Latitude of the point"
+    )
+    parser.add_argument(
+        "lon", type=float, required=True, help="Longitude of the point"
+    )
+    parser.add_argument(
+        "k", type=int, default=10, help="How many places to return"
+    )
+
+    @log_me(component="api")
+    @validated(Place)
+    @ns.doc(
+        "List the k nearest active places - Public endpoint",
+        responses={200: "Success", 400: "Invalid parameters"},
+    )
+    @ns.expect(parser)
+    @ns.response(200, "Success", [nearby_place_model])
+    def get(self):
+        """Find the haunts closest to you! 👣"""
+        args = self.parser.parse_args()
+        if not (-90 <= args.lat <= 90):
+            ns.abort(400, "Latitude must be between -90 and 90")
+        if not (-180 <= args.lon <= 180):
+            ns.abort(400, "Longitude must be between -180 and 180")
+        if args.k < 1:
+            ns.abort(400, "k must be a positive integer")
+
+        k = min(args.k, current_app.config.get("PAGE_SIZE_MAX", 100))
+        places = Place.nearest(args.lat, args.lon, k)
+        return [
+            {
+                **marshal(place, place_model),
+                "distance_km": round(place.distance_to(args.lat, args.lon), 3),
+            }
+            for place in places
+        ], 200
+
+
 @ns.route("/<string:place_id>")
 @ns.param("place_id", "The haunted property identifier")
 class PlaceResource(Resource):
@@ -291,16 +635,22 @@ class PlaceResource(Resource):
     """
 
     @log_me(component="api")
+    @validated(Place, "place_id")
     @ns.doc(
         "Get a place details - Public endpoint",
         responses={200: "Success", 400: "Bad Request", 404: "Place not found"},
     )
+    @ns.param("fields", "Comma-separated fields to return")
     @ns.response(200, "Success", place_model)
     @ns.response(404, "Not Found", error_model)
     def get(self, place_id):
+        try:
+            fields = field_args(place_model, Place)
+        except ValueError as e:
+            return {"message": str(e)}, 400
         try:
             place = facade.get(Place, place_id)
-            return place, 200
+            return marshal(place, sparse(place_model, fields)), 200
         except ValueError:
             return {
                 "message": "This ghost house has vanished! 👻",
@@ -388,6 +738,68 @@ class PlaceResource(Resource):
             ns.abort(404, str(e))
 
 
+@ns.route("/<string:place_id>/page")
+@ns.param("place_id", "The haunted property identifier")
+class PlacePage(Resource):
+    """Endpoint for everything a place page shows, in one request! 📰.
+
+    The place, its owner, its amenities and a page of reviews with their
+    authors come back together, in three SQL queries whatever the
+    number of reviews. A strong ETag lets browsers revalidate for free.
+    Names of the owner and of the authors are for signed-in ghosts only.
+    """
+
+    @log_me(component="api")
+    @ns.doc(
+        "Get a place with its owner, amenities and reviews "
+        "- Public endpoint, names need a token",
+        params={
+            "limit": "Reviews per page",
+            "cursor": "next_cursor of the previous reviews page",
+        },
+        responses={
+            200: "Success",
+            304: "Not modified since the ETag sent in If-None-Match",
+            400: "Invalid parameters",
+            404: "Place not found",
+        },
+    )
+    @ns.response(200, "Success", place_page_model)
+    def get(self, place_id):
+        """Open the whole haunted brochure at once! 📰"""
+        try:
+            limit, cursor = page_args()
+            limit = limit or current_app.config.get("PAGE_SIZE_DEFAULT", 20)
+            place = Place.get_with_details(place_id)
+            if place is None:
+                ns.abort(404, "This ghost house has vanished! 👻")
+            reviews = place.reviews_page(limit, cursor)
+        except ValueError as e:
+            ns.abort(400, str(e))
+
+        page = marshal(
+            {
+                "place": place,
+                "owner": place.owner,
+                "amenities": place.amenities,
+                "reviews": {
+                    "items": reviews,
+                    "next_cursor": reviews.next_cursor,
+                },
+            },
+            place_page_model,
+        )
+        if not signed_in():
+            people = [page["owner"]] + [
+                review["author"] for review in page["reviews"]["items"]
+            ]
+            for person in filter(None, people):
+                person["first_name"] = person["last_name"] = None
+        body, status, headers = conditional(page)
+        headers["Vary"] = "Authorization"  # Deux pages pour une même URL
+        return body, status, headers
+
+
 @ns.route("/<string:place_id>/amenities")
 @ns.param("place_id", "The haunted property identifier")
 class PlaceAmenities(Resource):
@@ -488,6 +900,41 @@ class PlaceAmenities(Resource):
             ns.abort(404, str(e))
 
 
+@ns.route("/<string:place_id>/amenities/batch")
+@ns.param("place_id", "The haunted property identifier")
+class PlaceAmenitiesBatch(Resource):
+    """Endpoint for installing many supernatural features at once! ✨"""
+
+    @log_me(component="api")
+    @owner_only
+    @ns.doc(
+        "Link amenities to a place in bulk - Authenticated endpoint",
+        security="Bearer Auth",
+        responses={
+            201: "All amenities linked",
+            207: "Some links failed, see each item status",
+            400: "Invalid batch",
+            401: "Unauthorized",
+            403: "Forbidden",
+            404: "Place not found",
+        },
+    )
+    @ns.expect([place_amenity_link_model], validate=False)
+    def post(self, place_id):
+        """Furnish a haunted property in one go! 🕯️"""
+
+        def prepare(row):
+            row["place_id"] = place_id
+            return row
+
+        try:
+            return batch_response(
+                run_batch(PlaceAmenity, prepare), place_amenity_link_model
+            )
+        except ValueError as e:
+            return {"message": f"Invalid haunted batch: {str(e)} 👻"}, 400
+
+
 @ns.route("/<string:place_id>/reviews")
 @ns.param("place_id", "The haunted property identifier")
 class PlaceReviews(Resource):
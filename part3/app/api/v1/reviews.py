@@ -1,10 +1,24 @@
 """Where our beloved Haunted Spirit speaks to us! 🏚️."""
 
 from flask import request
-from flask_jwt_extended import get_jwt_identity
-from flask_restx import Namespace, Resource, fields
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from flask_restx import Namespace, Resource, fields, marshal
 
-from app.api import admin_only, auth_required, log_me, owner_only, user_only
+from app.api import (
+    admin_only,
+    auth_required,
+    batch_response,
+    export_response,
+    field_args,
+    log_me,
+    owner_only,
+    page_args,
+    paginated,
+    run_batch,
+    sparse,
+    user_only,
+    validated,
+)
 from app.models.place import Place
 from app.models.review import Review
 from app.models.user import User
@@ -116,6 +130,7 @@ class ReviewList(Resource):
     Supports filtering by user, place, and rating."""
 
     @log_me(component="api")
+    @validated(Review)
     @ns.doc(
         "List all_reviews - Public endpoint",
         responses={
@@ -128,6 +143,9 @@ class ReviewList(Resource):
     @ns.param("user_id", "Ghost reviewer ID", type=str, required=False)
     @ns.param("place_id", "Haunted place ID", type=str, required=False)
     @ns.param("rating", "Spooky rating", type=int, required=False)
+    @ns.param("limit", "Page size (cursor mode)", type=int, required=False)
+    @ns.param("cursor", "next_cursor of the previous page", required=False)
+    @ns.param("fields", "Comma-separated fields to return", required=False)
     def get(self):
         """List all haunted reviews with optional filtering! 👻"""
         try:
@@ -136,10 +154,15 @@ class ReviewList(Resource):
                 if field in request.args and request.args[field]:
                     criteria[field] = request.args[field]
 
-            reviews = facade.find(Review, **criteria)
+            limit, cursor = page_args()
+            fields = field_args(output_review_model, Review)
+            reviews = facade.find(
+                Review, limit=limit, cursor=cursor, fields=fields, **criteria
+            )
 
             # Retourner une liste vide avec 200 si pas de reviews
-            return reviews or [], 200
+            model = sparse(output_review_model, fields)
+            return paginated(reviews, model, limit), 200
 
         except Exception as e:
             return {
@@ -189,20 +212,99 @@ class ReviewList(Resource):
             ns.abort(400, str(e))
 
 
+@ns.route("/export")
+class ReviewExport(Resource):
+    """Endpoint for streaming every spectral review out of our realm! 🌊"""
+
+    @log_me(component="api")
+    @admin_only
+    @ns.doc(
+        "Export all reviews as NDJSON or CSV - Admin Only",
+        security="Bearer Auth",
+        params={
+            "format": "ndjson (default) or csv",
+            "fields": "Comma-separated fields to export",
+        },
+        responses={
+            200: "Streamed export",
+            400: "Invalid parameters",
+            401: "Unauthorized",
+            403: "Forbidden - Admin privileges required",
+        },
+    )
+    def get(self):
+        """Pour the whole ghostly guestbook out, row by row! 🌊"""
+        try:
+            return export_response(
+                output_review_model,
+                Review,
+                where=(Review.is_deleted == False,),  # noqa: E712
+            )
+        except ValueError as e:
+            return {"message": str(e)}, 400
+
+
+@ns.route("/batch")
+class ReviewBatch(Resource):
+    """Endpoint for writing many haunted reviews at once! 📚.
+
+    Every review is signed by the authenticated ghost,
+    whatever user_id the items carry."""
+
+    @log_me(component="api")
+    @user_only
+    @ns.doc(
+        "Create reviews in bulk - Authenticated endpoint",
+        security="Bearer Auth",
+        responses={
+            201: "All reviews created",
+            207: "Some reviews failed, see each item status",
+            400: "Invalid batch",
+            401: "Unauthorized",
+        },
+    )
+    @ns.expect([input_review_model], validate=False)
+    def post(self):
+        """Fill the ghostly guestbooks in one go! ✍️"""
+        claims = get_jwt()
+        reviewed = set()
+
+        def prepare(row):
+            row["user_id"] = claims.get("user_id")
+            # The database only knows the reviews of earlier requests
+            if row.get("place_id") in reviewed:
+                raise ValueError("User already reviewed this place!")
+            reviewed.add(row.get("place_id"))
+            return row
+
+        try:
+            return batch_response(
+                run_batch(Review, prepare), output_review_model
+            )
+        except ValueError as e:
+            return {"message": f"Invalid haunted batch: {str(e)} 👻"}, 400
+
+
 @ns.route("/<string:review_id>")
 @ns.param("review_id", "The haunted review identifier")
 class ReviewDetail(Resource):
     """Endpoint for managing individual haunted reviews! 👻"""
 
     @log_me(component="api")
+    @validated(Review, "review_id")
     @ns.doc(
         "Get a specific review - Public endpoint",
         responses={200: "Success", 404: "Not Found"},
     )
+    @ns.param("fields", "Comma-separated fields to return", required=False)
     @ns.response(200, "Success", output_review_model)
     @ns.response(404, "Not Found", error_model)
     def get(self, review_id):
         """Find a specific haunted review! 🔍"""
+        try:
+            fields = field_args(output_review_model, Review)
+        except ValueError as e:
+            return {"message": str(e)}, 400
         try:
             review = facade.get(Review, review_id)
             if not isinstance(review, Review) or review.rating is None:
@@ -210,7 +312,7 @@ class ReviewDetail(Resource):
                     "message": "This review has vanished! 👻",
                     "review": None,
                 }, 404
-            return review, 200
+            return marshal(review, sparse(output_review_model, fields)), 200
         except ValueError as e:
             return {
                 "message": f"Failed to find review: {str(e)} 👻",
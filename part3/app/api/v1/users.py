@@ -2,9 +2,21 @@
 
 from flask import request
 from flask_jwt_extended import get_jwt
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, marshal
 
-from app.api import admin_only, auth_required, log_me, owner_only, user_only
+from app.api import (
+    admin_only,
+    auth_required,
+    export_response,
+    field_args,
+    log_me,
+    owner_only,
+    page_args,
+    paginated,
+    sparse,
+    user_only,
+    validated,
+)
 from app.models.user import User
 from app.services.facade import HBnBFacade
 
@@ -173,6 +185,7 @@ class UserList(Resource):
 
     @log_me(component="api")
     @admin_only
+    @validated(User)
     @ns.doc(
         "list All Users - Admin Only",
         security="Bearer Auth",
@@ -183,11 +196,14 @@ class UserList(Resource):
             404: "No spirits found in the ethereal plane",
         },
     )
-    @ns.marshal_list_with(output_user_model)
+    @ns.response(200, "Success", [output_user_model])
     @ns.param("username", "Ghost name", type=str, required=False)
     @ns.param("email", "Spirit contact", type=str, required=False)
     @ns.param("first_name", "First haunting name", type=str, required=False)
     @ns.param("last_name", "Last haunting name", type=str, required=False)
+    @ns.param("limit", "Page size (cursor mode)", type=int, required=False)
+    @ns.param("cursor", "next_cursor of the previous page", required=False)
+    @ns.param("fields", "Comma-separated fields to return", required=False)
     def get(self):
         """Browse Lilith's List of Lost Souls! 📖"""
         try:
@@ -196,14 +212,20 @@ class UserList(Resource):
                 if field in request.args and request.args[field]:
                     criteria[field] = request.args[field]
 
-            users = facade.find(User, **criteria)
-
-            # Retourner une liste vide si pas d'utilisateurs
-            if not users:
-                return [], 200
+            # Seuls les utilisateurs actifs, filtrés directement en SQL
+            limit, cursor = page_args()
+            fields = field_args(output_user_model, User)
+            users = facade.find(
+                User,
+                limit=limit,
+                cursor=cursor,
+                fields=fields,
+                is_active=True,
+                **criteria,
+            )
 
-            # Filtrer les utilisateurs actifs
-            return [user for user in users if user.is_active], 200
+            model = sparse(output_user_model, fields)
+            return paginated(users, model, limit), 200
 
         except Exception as e:
             return {"message": str(e)}, 400
@@ -231,6 +253,38 @@ class UserList(Resource):
             return {"message": str(e)}, 400
 
 
+@ns.route("/export")
+class UserExport(Resource):
+    """Endpoint for streaming every lost soul out of our realm! 🌊"""
+
+    @log_me(component="api")
+    @admin_only
+    @ns.doc(
+        "Export all users as NDJSON or CSV - Admin Only",
+        security="Bearer Auth",
+        params={
+            "format": "ndjson (default) or csv",
+            "fields": "Comma-separated fields to export",
+        },
+        responses={
+            200: "Streamed export",
+            400: "Invalid parameters",
+            401: "Unauthorized",
+            403: "Forbidden - Admin privileges required",
+        },
+    )
+    def get(self):
+        """Pour Lilith's whole list out, row by row! 🌊"""
+        try:
+            return export_response(
+                output_user_model,
+                User,
+                where=(User.is_deleted == False,),  # noqa: E712
+            )
+        except ValueError as e:
+            return {"message": str(e)}, 400
+
+
 @ns.route("/<string:user_id>")
 @ns.param("user_id", "Spectral identifier")
 class UserDetail(Resource):
@@ -238,6 +292,7 @@ class UserDetail(Resource):
 
     @log_me(component="api")
     @user_only
+    @validated(User, "user_id")
     @ns.doc(
         "Get a user details - Authenticated User Only",
         security="Bearer Auth",
@@ -247,9 +302,14 @@ class UserDetail(Resource):
             404: "Spirit not found in this realm",
         },
     )
-    @ns.marshal_with(output_user_model, code=200)
+    @ns.param("fields", "Comma-separated fields to return", required=False)
+    @ns.response(200, "Success", output_user_model)
     def get(self, user_id):
         """Contact a specific spirit in our realm! 👻"""
+        try:
+            fields = field_args(output_user_model, User)
+        except ValueError as e:
+            return {"message": str(e)}, 400
         try:
             user = facade.get(User, user_id)
             if not isinstance(user, User):
@@ -257,7 +317,7 @@ class UserDetail(Resource):
                     "message": "This spirit has crossed over! 👻",
                     "user": None,
                 }, 404
-            return user, 200
+            return marshal(user, sparse(output_user_model, fields)), 200
         except Exception as e:
             return {
                 "message": f"Spirit not found: {str(e)} 👻",
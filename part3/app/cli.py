@@ -13,6 +13,7 @@ from sqlalchemy import text
 def init_db_command():
     """Initialize the haunted database! 👻"""
     from app import db
+    from app.persistence import importer
 
     # Chemin relatif depuis le dossier de l'app
     sql_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "SQL")
@@ -21,18 +22,170 @@ def init_db_command():
     db.create_all()
 
     click.echo("Executing schema.sql...")
-    with open(os.path.join(sql_dir, "schema.sql")) as f:
-        sql_commands = f.read().split(";")
-        for command in sql_commands:
-            if command.strip():
-                db.session.execute(text(command))
-
-    click.echo("Executing seed.sql...")
-    with open(os.path.join(sql_dir, "seed.sql")) as f:
-        sql_commands = f.read().split(";")
-        for command in sql_commands:
-            if command.strip():
-                db.session.execute(text(command))
-
+    for statement in importer.sql_statements(
+        os.path.join(sql_dir, "schema.sql")
+    ):
+        db.session.execute(text(statement))
     db.session.commit()
+
+    click.echo("Importing seed data...")
+    seed_dir = os.path.join(sql_dir, "seed")
+    reports = {}
+    for kind in importer.KINDS:
+        path = os.path.join(seed_dir, f"{kind}.ndjson")
+        if os.path.exists(path):
+            reports[kind] = importer.import_file(kind, path)
+            _echo_report(reports[kind])
+    importer.finish(reports)
     click.echo("Database initialized! 👻")
+
+
+def _echo_report(report) -> None:
+    """Tell how an import went, rejected rows included! 📋"""
+    for number, message in report.errors:
+        click.echo(f"  {report.kind} line {number}: {message}", err=True)
+    click.echo(
+        f"{report.kind}: {report.inserted} inserted, "
+        f"{len(report.errors)} rejected, {report.skipped} skipped "
+        f"in {report.seconds:.2f}s ({report.rate:,.0f} rows/s)"
+    )
+
+
+@click.command("import-data")
+@click.option("--users", type=click.Path(exists=True, dir_okay=False))
+@click.option("--amenities", type=click.Path(exists=True, dir_okay=False))
+@click.option("--places", type=click.Path(exists=True, dir_okay=False))
+@click.option("--reviews", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--links",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Place-amenity links.",
+)
+@click.option("--chunk-size", type=int, help="Rows per transaction.")
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip the rows committed by an interrupted run.",
+)
+@with_appcontext
+def import_data_command(chunk_size, resume, **files):
+    """Stream NDJSON/CSV files into the haunted tables! 📥
+
+    Files are imported in dependency order (users, amenities, places,
+    reviews, links), whatever the order of the options.
+    """
+    from app.persistence import importer
+
+    files = {kind: files[kind] for kind in importer.KINDS if files[kind]}
+    if not files:
+        raise click.UsageError("Give at least one file to import.")
+
+    def progress(report):
+        click.echo(
+            f"  {report.kind}: {report.skipped + report.read} rows read "
+            f"({report.rate:,.0f} rows/s)"
+        )
+
+    reports = {}
+    for kind, path in files.items():
+        try:
+            reports[kind] = importer.import_file(
+                kind, path, chunk_size, resume=resume, progress=progress
+            )
+        except Exception as e:
+            importer.finish(reports)
+            raise click.ClickException(
+                f"{kind} import failed: {e}\n"
+                "Committed chunks are kept: run again with --resume."
+            )
+        _echo_report(reports[kind])
+    importer.finish(reports)
+    click.echo("Data imported! 👻")
+
+
+@click.command("gen-data")
+@click.option("--users", type=click.IntRange(min=0), default=100)
+@click.option("--places", type=click.IntRange(min=0), default=200)
+@click.option(
+    "--reviews-per-place", type=click.FloatRange(min=0), default=5.0
+)
+@click.option("--amenities", type=click.IntRange(min=0), default=20)
+@click.option("--seed", type=int, default=0, help="Same seed, same data.")
+@click.option("--chunk-size", type=int, help="Rows per transaction.")
+@click.option(
+    "--validate/--no-validate",
+    default=True,
+    help="Run the model validators (rows are valid by construction).",
+)
+@with_appcontext
+def gen_data_command(
+    users, places, reviews_per_place, amenities, seed, chunk_size, validate
+):
+    """Summon a deterministic synthetic realm for scale tests! 🎲
+
+    Places cluster around a few cities with log-normal prices; hosts,
+    reviews and amenities follow power laws. Every user logs in with
+    the password Haunted123.
+    """
+    from app import bcrypt
+    from app.persistence import importer, synthetic
+
+    if places and not users:
+        raise click.UsageError("Places need at least one user.")
+    shape = synthetic.Shape(
+        users=users,
+        places=places,
+        reviews_per_place=reviews_per_place,
+        amenities=amenities,
+        seed=seed,
+    )
+    password_hash = bcrypt.generate_password_hash(
+        "Haunted123",
+        rounds=current_app.config.get("BCRYPT_LOG_ROUNDS", 12),
+    ).decode("utf-8")
+    owner_of = synthetic.owners(shape)
+    rows = {
+        "users": synthetic.users(shape, password_hash),
+        "amenities": synthetic.amenities(shape),
+        "places": synthetic.places(shape, owner_of),
+        "reviews": synthetic.reviews(
+            shape, owner_of, synthetic.review_counts(shape)
+        ),
+        "links": synthetic.links(shape),
+    }
+
+    def progress(report):
+        click.echo(
+            f"  {report.kind}: {report.read} rows ({report.rate:,.0f} rows/s)"
+        )
+
+    reports = {}
+    for kind in importer.KINDS:
+        reports[kind] = importer.import_rows(
+            kind, rows[kind], chunk_size, validate=validate, progress=progress
+        )
+        _echo_report(reports[kind])
+    importer.finish(reports)
+    click.echo(f"Realm generated from seed {seed}! 👻")
+
+
+@click.command("rebuild-ratings")
+@with_appcontext
+def rebuild_ratings_command():
+    """Recompute the rating aggregates of every place! ⭐"""
+    from app.models.place import Place
+
+    click.echo("Recounting reviews...")
+    Place.rebuild_ratings()
+    click.echo("Rating aggregates rebuilt! 👻")
+
+
+@click.command("rebuild-search")
+@with_appcontext
+def rebuild_search_command():
+    """Reindex every place for full-text search! 🔍"""
+    from app.persistence import search
+
+    click.echo("Reindexing places...")
+    search.rebuild()
+    click.echo("Search index rebuilt! 👻")
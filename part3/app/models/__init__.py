@@ -3,8 +3,16 @@
 """Initialize our haunted models! 👻."""
 from app.models.amenity import Amenity
 from app.models.place import Place
+from app.models.place_query import PlaceQuery
 from app.models.placeamenity import PlaceAmenity
 from app.models.review import Review
 from app.models.user import User
 
-__all__ = ["User", "Place", "Amenity", "Review", "PlaceAmenity"]
+__all__ = [
+    "User",
+    "Place",
+    "PlaceQuery",
+    "Amenity",
+    "Review",
+    "PlaceAmenity",
+]
@@ -4,7 +4,8 @@ import re
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List
 
-from sqlalchemy.orm import relationship
+from sqlalchemy import event
+from sqlalchemy.orm import Session, relationship
 
 from app import db
 from app.models.basemodel import BaseModel
@@ -27,6 +28,9 @@ class AmenityCategory(str, Enum):
 class Amenity(BaseModel):
     """Amenity: A supernatural feature for our haunted places! 🎭."""
 
+    # Bits available in Place.amenity_mask (a signed 64-bit integer)
+    MASK_BITS = 63
+
     # SQLAlchemy columns
     name = db.Column(db.String(120), unique=True, nullable=False)
     description = db.Column(db.Text, nullable=False)
@@ -37,6 +41,11 @@ class Amenity(BaseModel):
         default=AmenityCategory.SUPERNATURAL,
         nullable=False,
     )
+    # Position in Place.amenity_mask, given on first flush (None when the
+    # mask is full: such amenities are matched through the link table)
+    bit = db.Column(db.Integer, unique=True)
+
+    __serialize_plan__ = {"places": "selectin"}
 
     def __init__(
         self,
@@ -52,6 +61,11 @@ class Amenity(BaseModel):
         self.description = self._validate_description(description)
         self.category = self._validate_category(category)
 
+    @property
+    def mask(self) -> int:
+        """This amenity's bit in a place mask, 0 if it has none! 🔢"""
+        return 0 if self.bit is None else 1 << self.bit
+
     @log_me(component="business")
     def _validate_name(self, name: str) -> str:
         """Validate amenity name! 🏷️."""
@@ -142,19 +156,63 @@ class Amenity(BaseModel):
             if not place.is_deleted and place.status != "blocked"
         ]
 
-    @log_me(component="business")
-    def to_dict(self) -> Dict[str, Any]:
-        """Transform amenity into dictionary! 📚."""
-        base_dict = super().to_dict()
+    def _columns_dict(self) -> Dict[str, Any]:
+        """Transform amenity columns into dictionary! 📚."""
+        base_dict = super()._columns_dict()
         amenity_dict = {
             "name": self.name,
             "description": self.description,
             "category": self.category.value if self.category else None,
-            # Optionnellement, inclure les places liées
-            "places": [
-                place.to_dict()
+        }
+        return {**base_dict, **amenity_dict}
+
+    def _related(self, name: str) -> Any:
+        """Only show the places that are still haunted! 🏰."""
+        if name == "places":
+            return [
+                place
                 for place in self.places
                 if not place.is_deleted and place.status != "blocked"
-            ],
+            ]
+        return super()._related(name)
+
+
+def next_bits(session, count: int) -> List[int]:
+    """Reserve the lowest free mask bits, banished ones included! 🔢"""
+    with session.no_autoflush:
+        taken = {
+            bit
+            for (bit,) in session.query(Amenity.bit).filter(
+                Amenity.bit.isnot(None)
+            )
         }
-        return {**base_dict, **amenity_dict}
+    # Bits donnés à la main, pas encore en base
+    taken.update(
+        obj.bit
+        for obj in session.new
+        if isinstance(obj, Amenity) and obj.bit is not None
+    )
+    free = [bit for bit in range(Amenity.MASK_BITS) if bit not in taken]
+    return free[:count]
+
+
+@event.listens_for(Session, "before_flush")
+def _assign_bits(session, flush_context, instances) -> None:
+    """Give each new amenity its own bit in the place masks! ✨"""
+    new = [
+        obj
+        for obj in session.new
+        if isinstance(obj, Amenity) and obj.bit is None
+    ]
+    if new:
+        for amenity, bit in zip(new, next_bits(session, len(new))):
+            amenity.bit = bit
+
+
+@event.listens_for(Amenity, "after_delete")
+def _clear_bit(mapper, connection, target: Amenity) -> None:
+    """Wipe a banished amenity from every mask, so its bit can be reused! 🧹"""
+    if target.bit is not None:
+        from app.models.place import Place
+
+        Place.flip_amenity_bits(connection, target.mask, on=False)
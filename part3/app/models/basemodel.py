@@ -1,16 +1,33 @@
 """Base model module: The dark foundation of our haunted kingdom! 👻."""
 
 from datetime import datetime
-from typing import Any, List, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, selectinload
 
 from app import db
 from app.models.mixins import SQLAlchemyMixin
+from app.persistence.cache import identity_cache
 from app.persistence.repository import SQLAlchemyRepository
-from app.utils import log_me
+from app.utils import log_me, serialize
 
 # Create a generic type for our supernatural entities
 T = TypeVar("T", bound="BaseModel")
 
+# How each relation of a serialization plan is summoned up front
+LOADERS = {"joined": joinedload, "selectin": selectinload}
+
 
 class BaseModel(db.Model, SQLAlchemyMixin):
     """BaseModel: The supernatural ancestor of all our haunted models! 🏰."""
@@ -18,12 +35,21 @@ class BaseModel(db.Model, SQLAlchemyMixin):
     __abstract__ = True
     repository = None
 
+    # Serialization plan: relations embedded in our payloads, and the
+    # loader strategy ("joined" or "selectin") used to fetch them
+    __serialize_plan__: Dict[str, str] = {}
+
+    # Columns the model keeps up to date itself, never set by callers
+    __derived__: FrozenSet[str] = frozenset()
+
     def __init__(self, **kwargs):
         """Initialize a new haunted instance! ✨."""
         super().__init__()
 
         for key, value in kwargs.items():
-            if key in ["created_at", "updated_at"]:
+            if key in self.__derived__:
+                continue  # Recalculé par le modèle, quoi qu'on lui envoie
+            if key in ["created_at", "updated_at"] and isinstance(value, str):
                 setattr(self, key, datetime.fromisoformat(value))
             else:
                 setattr(self, key, value)
@@ -35,6 +61,27 @@ class BaseModel(db.Model, SQLAlchemyMixin):
             cls.repository = SQLAlchemyRepository(cls)
         return cls.repository
 
+    @classmethod
+    def eager_options(cls, _path: tuple = ()) -> list:
+        """Turn the serialization plan into SQLAlchemy loader options! 🔮
+
+        Nested plans are followed, except for relations leading back to a
+        model already on the path: those are resolved from the identity
+        map without any extra query.
+        """
+        path = _path + (cls,)
+        relations = inspect(cls).relationships  # Configures the backrefs
+        options = []
+        for name, strategy in cls.__serialize_plan__.items():
+            relation = relations[name]
+            target = relation.mapper.class_
+            if target in path:
+                continue
+            loader = LOADERS[strategy](relation.class_attribute)
+            nested = target.eager_options(path)
+            options.append(loader.options(*nested) if nested else loader)
+        return options
+
     @log_me(component="business")
     def can_be_managed_by(self, user_id: str, is_admin: bool = False) -> bool:
         """Check if a user can manage (modify/delete) this resource! 🔑"""
@@ -77,6 +124,14 @@ class BaseModel(db.Model, SQLAlchemyMixin):
         except Exception as e:
             raise ValueError(f"Failed to save: {str(e)}")
 
+    @classmethod
+    @log_me(component="business")
+    def save_many(
+        cls, instances: List[T], chunk_size: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """Save a horde of haunted entities in chunked transactions! 💾"""
+        return cls._get_repo().save_many(instances, chunk_size=chunk_size)
+
     @log_me(component="business")
     def update(self, data: dict) -> T:
         """Update this haunted entity! 🌟"""
@@ -84,7 +139,7 @@ class BaseModel(db.Model, SQLAlchemyMixin):
             if not isinstance(data, dict):
                 raise ValueError("Update data must be a dictionary")
 
-            protected = {"id", "created_at", "is_deleted"}
+            protected = {"id", "created_at", "is_deleted"} | self.__derived__
             if any(attr in data for attr in protected):
                 raise ValueError(
                     f"Cannot modify protected attributes: \
@@ -118,10 +173,72 @@ class BaseModel(db.Model, SQLAlchemyMixin):
     @classmethod
     @log_me(component="business")
     def find_by(
-        cls, multiple: bool = False, **kwargs
+        cls,
+        multiple: bool = False,
+        eager: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        **kwargs,
     ) -> Union[Optional[T], List[T]]:
         """Find entities by their attributes! 🔮"""
-        return cls._get_repo().get_by_attribute(multiple=multiple, **kwargs)
+        return cls._get_repo().get_by_attribute(
+            multiple=multiple, eager=eager, fields=fields, **kwargs
+        )
+
+    @classmethod
+    @log_me(component="business")
+    def find_where(
+        cls,
+        *conditions,
+        eager: bool = False,
+        order_by: Sequence = (),
+        limit: Optional[int] = None,
+        options: Sequence = (),
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[T]:
+        """Find entities matching SQL expressions! 🔮"""
+        return cls._get_repo().get_where(
+            *conditions,
+            eager=eager,
+            order_by=order_by,
+            limit=limit,
+            options=options,
+            fields=fields,
+        )
+
+    @classmethod
+    @log_me(component="business")
+    def find_page(
+        cls,
+        limit: int,
+        cursor: Optional[str] = None,
+        eager: bool = False,
+        where: Sequence = (),
+        options: Sequence = (),
+        fields: Optional[Sequence[str]] = None,
+        **kwargs,
+    ) -> List[T]:
+        """Find entities one page at a time! 📜"""
+        return cls._get_repo().get_page(
+            limit,
+            cursor=cursor,
+            eager=eager,
+            where=where,
+            options=options,
+            fields=fields,
+            **kwargs,
+        )
+
+    @classmethod
+    def stream(
+        cls,
+        fields: Sequence[str],
+        chunk_size: Optional[int] = None,
+        where: Sequence = (),
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream the rows of this table in chunks of plain dicts! 🌊"""
+        return cls._get_repo().stream(
+            fields, chunk_size=chunk_size, where=where
+        )
 
     @classmethod
     @log_me(component="business")
@@ -131,21 +248,47 @@ class BaseModel(db.Model, SQLAlchemyMixin):
 
     @classmethod
     @log_me(component="business")
-    def get_by_id(cls, id: str) -> Optional[T]:
-        """Summon an entity by its ID! 🔍"""
-        return cls._get_repo().get(id)
+    def get_by_id(cls, id: str, eager: bool = False) -> Optional[T]:
+        """Summon an entity by its ID! 🔍
+
+        Plain lookups read through the identity cache first.
+        """
+        if eager or not identity_cache.cacheable(cls):
+            return cls._get_repo().get(id, eager=eager)
+
+        instance = identity_cache.get(cls, id)
+        if instance is None:
+            generation = identity_cache.generation(cls)
+            instance = cls._get_repo().get(id)
+            if instance is not None:
+                identity_cache.put(cls, instance, generation)
+        return instance
 
     @classmethod
     @log_me(component="business")
-    def get_all(cls) -> List[T]:
+    def get_all(
+        cls, eager: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
         """Summon all entities of this type! 👻"""
-        return cls._get_repo().get_all()
+        return cls._get_repo().get_all(eager=eager, fields=fields)
 
-    @log_me(component="business")
-    def to_dict(self) -> dict:
-        """Transform this entity into a dictionary! 📚"""
+    def _columns_dict(self) -> dict:
+        """Transform the columns of this entity into a dictionary! 🗂️"""
         return {
             column.name: getattr(self, column.name)
             for column in self.__table__.columns
             if not column.name.startswith("_")
         }
+
+    def _related(self, name: str) -> Any:
+        """Fetch a relation of the serialization plan! 🔗"""
+        return getattr(self, name)
+
+    @log_me(component="business")
+    def to_dict(self, max_depth: Optional[int] = None) -> dict:
+        """Transform this entity into a dictionary! 📚
+
+        Relations of the serialization plan are embedded down to
+        ``max_depth`` (``SERIALIZE_MAX_DEPTH`` by default).
+        """
+        return serialize(self, max_depth)
@@ -19,15 +19,16 @@ class SQLAlchemyMixin:
     id = db.Column(
         db.String(36), primary_key=True, default=lambda: str(uuid.uuid4())
     )
+    # Callables, so that every row gets its own timestamp
     created_at = db.Column(
         db.DateTime(timezone=True),
-        default=datetime.now(timezone.utc),
+        default=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
     updated_at = db.Column(
         db.DateTime(timezone=True),
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
     is_active = db.Column(db.Boolean, default=True)
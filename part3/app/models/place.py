@@ -3,9 +3,14 @@
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from sqlalchemy import and_, case, event, func, inspect, or_, select, update
+from sqlalchemy.orm import joinedload, selectinload
+
 from app import db
 from app.models.basemodel import BaseModel
-from app.utils import log_me
+from app.persistence import search
+from app.persistence.cache import identity_cache, note_write, query_cache
+from app.utils import geo, log_me
 
 if TYPE_CHECKING:
     from app.models.amenity import Amenity  # noqa: F401
@@ -52,21 +57,46 @@ class Place(BaseModel):
     owner_id = db.Column(
         db.String(36), db.ForeignKey("user.id"), nullable=False
     )
-    price_by_night = db.Column(db.Float, nullable=False)
+    price_by_night = db.Column(db.Float, nullable=False, index=True)
     number_rooms = db.Column(db.Integer, default=1)
     number_bathrooms = db.Column(db.Integer, default=1)
-    max_guest = db.Column(db.Integer, default=2)
+    max_guest = db.Column(db.Integer, default=2, index=True)
     latitude = db.Column(db.Float)
     longitude = db.Column(db.Float)
+    # Kept in sync with latitude/longitude on every flush (see below)
+    geohash = db.Column(db.String(12), index=True)
     city = db.Column(db.String(100))
     country = db.Column(db.String(100))
     status = db.Column(
-        db.Enum(PlaceStatus), default=PlaceStatus.ACTIVE, nullable=False
+        db.Enum(PlaceStatus),
+        default=PlaceStatus.ACTIVE,
+        nullable=False,
+        index=True,
     )
     property_type = db.Column(
-        db.Enum(PropertyType), default=PropertyType.APARTMENT, nullable=False
+        db.Enum(PropertyType),
+        default=PropertyType.APARTMENT,
+        nullable=False,
+        index=True,
     )
     minimum_stay = db.Column(db.Integer, default=1)
+    # One bit per linked amenity (see Amenity.bit): "has all" is a mask test
+    amenity_mask = db.Column(db.BigInteger, default=0, nullable=False)
+    # Rated, non-deleted reviews, kept up to date by the Review events
+    review_count = db.Column(db.Integer, default=0, nullable=False)
+    rating_sum = db.Column(db.Integer, default=0, nullable=False)
+    rating_avg = db.Column(db.Float, index=True)
+
+    # Maintained by the Review and amenity events, and the rebuilds, only
+    __derived__ = frozenset(
+        {"review_count", "rating_sum", "rating_avg", "amenity_mask"}
+    )
+
+    __serialize_plan__ = {
+        "owner": "joined",
+        "reviews": "selectin",
+        "amenities": "selectin",
+    }
 
     # Relationships simplifiés avec backref
     reviews = db.relationship(
@@ -230,61 +260,110 @@ class Place(BaseModel):
                 {', '.join(s.value for s in PropertyType)}"
             raise ValueError(error_msg)
 
-    @log_me(component="business")
     @classmethod
+    @log_me(component="business")
     def filter_by_price(
         cls, min_price: float, max_price: float
     ) -> List["Place"]:
         """Filter places by price range! 💰"""
-        return cls.find_by(
-            multiple=True,
-            filters=[
-                cls.price_by_night >= min_price,
-                cls.price_by_night <= max_price,
-                cls.is_deleted == False,  # noqa: E712
-                cls.status != PlaceStatus.BLOCKED.value,
-            ],
-        )
+        from app.models.place_query import PlaceQuery
+
+        return PlaceQuery().price(min_price, max_price).all()
 
-    @log_me(component="business")
     @classmethod
+    @log_me(component="business")
     def filter_by_capacity(cls, min_guests: int) -> List["Place"]:
         """Filter places by guest capacity! 👻"""
-        return cls.find_by(
-            multiple=True,
-            filters=[
-                cls.max_guest >= min_guests,
-                cls.is_deleted == False,  # noqa: E712
-                cls.status != PlaceStatus.BLOCKED.value,
-            ],
-        )
+        from app.models.place_query import PlaceQuery
+
+        return PlaceQuery().capacity(min_guests).all()
 
-    @log_me(component="business")
     @classmethod
+    @log_me(component="business")
     def get_by_location(
-        cls, lat: float, lon: float, radius: float
+        cls,
+        lat: float,
+        lon: float,
+        radius: float,
+        limit: Optional[int] = None,
     ) -> List["Place"]:
-        """Find places within a radius! 🗺️"""
-        from math import cos, radians
-
-        lat_range = radius / 111.0
-        lon_range = radius / (111.0 * cos(radians(lat)))
-
-        return cls.find_by(
-            multiple=True,
-            filters=[
-                cls.latitude.between(lat - lat_range, lat + lat_range),
-                cls.longitude.between(lon - lon_range, lon + lon_range),
-                cls.is_deleted == False,  # noqa: E712
-                cls.status != PlaceStatus.BLOCKED.value,
-            ],
+        """Find places within a radius, nearest first! 🗺️
+
+        The geohash cells covering the circle are read as B-tree ranges,
+        then the exact haversine distance weeds out the cell corners.
+
+        Args:
+            lat: Latitude of the search center
+            lon: Longitude of the search center
+            radius: Search radius in kilometers
+            limit: Keep only the closest places
+        """
+        from app.models.place_query import PlaceQuery
+
+        query = PlaceQuery().within(lat, lon, radius)
+        if limit is not None:
+            query.limit(limit)
+        return query.all()
+
+    @classmethod
+    @log_me(component="business")
+    def nearest(cls, lat: float, lon: float, k: int = 10) -> List["Place"]:
+        """Find the k closest active places, nearest first! 🧭
+
+        Search blocks grow ring by ring around the point until k places
+        lie within the radius the block is sure to cover, so the cost
+        follows k rather than the size of the realm.
+        """
+        conditions = [
+            cls.is_deleted == False,  # noqa: E712
+            cls.status == PlaceStatus.ACTIVE,
+        ]
+        for cells, safe in geo.rings(lat, lon):
+            ranked = cls._rank(
+                cls.find_where(*conditions, cls._in_cells(cells)), lat, lon
+            )
+            if len(ranked) >= k and ranked[k - 1][0] <= safe:
+                return [place for _, place in ranked[:k]]
+
+        # Even the coarsest block is not enough: scan every located place
+        ranked = cls._rank(
+            cls.find_where(*conditions, cls.geohash.isnot(None)), lat, lon
+        )
+        return [place for _, place in ranked[:k]]
+
+    @classmethod
+    def _in_cells(cls, cells: List[str]):
+        """Match geohashes inside any of the cells, as B-tree ranges! 🕸️"""
+        return or_(
+            *(
+                and_(cls.geohash >= cell, cls.geohash < cell + "~")
+                for cell in cells
+            )
         )
 
+    @staticmethod
+    def _rank(places: List["Place"], lat: float, lon: float) -> List:
+        """Pair located places with their distance, nearest first! 📏"""
+        ranked = [
+            (place.distance_to(lat, lon), place)
+            for place in places
+            if place.latitude is not None and place.longitude is not None
+        ]
+        ranked.sort(key=lambda pair: pair[0])
+        return ranked
+
+    def distance_to(self, lat: float, lon: float) -> Optional[float]:
+        """Great-circle distance to a point, in kilometers! 📐"""
+        if self.latitude is None or self.longitude is None:
+            return None
+        return geo.haversine(self.latitude, self.longitude, lat, lon)
+
     @log_me(component="business")
     def add_amenity(self, amenity: "Amenity") -> None:
         """Add an amenity to this haunted place! ✨"""
         if amenity not in self.amenities:
             self.amenities.append(amenity)
+            self._set_amenity_bit(amenity, on=True)
             db.session.commit()
 
     @log_me(component="business")
@@ -292,12 +371,192 @@ class Place(BaseModel):
         """Remove an amenity from this haunted place! 🗑️"""
         if amenity in self.amenities:
             self.amenities.remove(amenity)
+            self._set_amenity_bit(amenity, on=False)
             db.session.commit()
         else:
             raise ValueError(
                 f"This place doesn't have the amenity {amenity.name}! 👻"
             )
 
+    def _set_amenity_bit(self, amenity: "Amenity", on: bool) -> None:
+        """Flip one amenity bit of our mask, atomically in SQL! 🔢"""
+        if amenity.bit is None:
+            return
+        if not inspect(self).persistent:
+            mask = self.amenity_mask or 0
+            self.amenity_mask = (
+                mask | amenity.mask if on else mask & ~amenity.mask
+            )
+            return
+        Place.flip_amenity_bits(
+            db.session.connection(), amenity.mask, on=on, place_id=self.id
+        )
+        db.session.expire(self, ["amenity_mask"])
+
+    @classmethod
+    def flip_amenity_bits(
+        cls,
+        connection,
+        mask: int,
+        on: bool = True,
+        place_id: Optional[str] = None,
+    ) -> None:
+        """Set or clear amenity bits straight in SQL, mid-flush! 🔢
+
+        Args:
+            connection: The connection of the running flush
+            mask: The amenity bits to flip
+            on: Set the bits (True) or clear them (False)
+            place_id: Only touch this place, instead of all of them
+        """
+        if not mask:
+            return
+        table = cls.__table__
+        column = table.c.amenity_mask
+        statement = update(table).values(
+            amenity_mask=column.op("|")(mask) if on else column.op("&")(~mask)
+        )
+        if place_id is not None:
+            statement = statement.where(table.c.id == place_id)
+        connection.execute(statement)
+
+        # The ORM did not see this write: warn the caches ourselves
+        note_write(db.session, table.name, cls.__name__, place_id)
+
+    @classmethod
+    @log_me(component="business")
+    def rebuild_amenity_masks(cls) -> int:
+        """Recompute every mask from the link table! 🔧
+
+        Amenities created outside the ORM (seed scripts, imports) get
+        their bit first. Returns the number of amenities with a bit.
+        """
+        from app.models.amenity import Amenity, next_bits
+        from app.models.placeamenity import PlaceAmenity
+
+        missing = Amenity.find_where(Amenity.bit.is_(None))
+        for amenity, bit in zip(missing, next_bits(db.session, len(missing))):
+            amenity.bit = bit
+        db.session.flush()
+
+        table = cls.__table__
+        db.session.execute(update(table).values(amenity_mask=0))
+        amenities = Amenity.find_where(Amenity.bit.isnot(None))
+        column = table.c.amenity_mask
+        for amenity in amenities:
+            linked = db.select(PlaceAmenity.place_id).where(
+                PlaceAmenity.amenity_id == amenity.id
+            )
+            db.session.execute(
+                update(table)
+                .where(table.c.id.in_(linked))
+                .values(amenity_mask=column.op("|")(amenity.mask))
+            )
+        db.session.commit()
+        identity_cache.clear()
+        query_cache.bump(table.name)
+        return len(amenities)
+
+    @classmethod
+    def adjust_ratings(
+        cls, connection, place_id: str, count: int, points: int
+    ) -> None:
+        """Shift the rating aggregates of a place, mid-flush! ⭐
+
+        Args:
+            connection: The connection of the running flush
+            place_id: The place whose reviews changed
+            count: Reviews gained (or lost, when negative)
+            points: Rating points gained (or lost)
+        """
+        if place_id is None or (not count and not points):
+            return
+        table = cls.__table__
+        new_count = table.c.review_count + count
+        new_sum = table.c.rating_sum + points
+        connection.execute(
+            update(table)
+            .where(table.c.id == place_id)
+            .values(
+                review_count=new_count,
+                rating_sum=new_sum,
+                rating_avg=case(
+                    (new_count > 0, new_sum * 1.0 / new_count), else_=None
+                ),
+            )
+        )
+
+        # The ORM did not see this write: warn the caches ourselves
+        note_write(db.session, table.name, cls.__name__, place_id)
+
+    @classmethod
+    @log_me(component="business")
+    def rebuild_ratings(cls) -> None:
+        """Recompute every rating aggregate from the reviews! 🔧"""
+        from app.models.review import Review, ReviewRating
+
+        table = cls.__table__
+        points = case(
+            *((Review.rating == r, int(r.value)) for r in ReviewRating)
+        )
+        counted = and_(
+            Review.place_id == table.c.id,
+            Review.rating.isnot(None),
+            Review.is_deleted == False,  # noqa: E712
+        )
+        db.session.execute(
+            update(table).values(
+                review_count=select(func.count(Review.id))
+                .where(counted)
+                .scalar_subquery(),
+                rating_sum=select(func.coalesce(func.sum(points), 0))
+                .where(counted)
+                .scalar_subquery(),
+            )
+        )
+        db.session.execute(
+            update(table).values(
+                rating_avg=case(
+                    (
+                        table.c.review_count > 0,
+                        table.c.rating_sum * 1.0 / table.c.review_count,
+                    ),
+                    else_=None,
+                )
+            )
+        )
+        db.session.commit()
+        identity_cache.clear()
+        query_cache.bump(table.name)
+
+    @classmethod
+    @log_me(component="business")
+    def get_with_details(cls, place_id: str) -> Optional["Place"]:
+        """Summon a place with its owner and amenities, in two queries! 🏚️
+
+        The owner rides along in a join; the amenities follow in one
+        select. Deleted places stay in the void.
+        """
+        places = cls.find_where(
+            cls.id == place_id,
+            cls.is_deleted == False,  # noqa: E712
+            options=(joinedload(cls.owner), selectinload(cls.amenities)),
+        )
+        return places[0] if places else None
+
+    @log_me(component="business")
+    def reviews_page(self, limit: int, cursor: Optional[str] = None):
+        """Read one page of the guestbook, authors included, in one query! 📖"""
+        from app.models.review import Review
+
+        return Review.find_page(
+            limit,
+            cursor=cursor,
+            where=(Review.is_deleted == False,),  # noqa: E712
+            options=(joinedload(Review.author),),
+            place_id=self.id,
+        )
+
     @log_me(component="business")
     def get_amenities(self) -> List["Amenity"]:
         """Get all amenities of this haunted place! 🎭"""
@@ -362,10 +621,9 @@ class Place(BaseModel):
         except Exception as e:
             raise ValueError(f"Failed to delete Place: {str(e)}")
 
-    @log_me(component="business")
-    def to_dict(self) -> Dict[str, Any]:
-        """Transform place into dictionary! 📚"""
-        base_dict = super().to_dict()
+    def _columns_dict(self) -> Dict[str, Any]:
+        """Transform place columns into dictionary! 📚"""
+        base_dict = super()._columns_dict()
         place_dict = {
             "name": self.name,
             "description": self.description,
@@ -383,8 +641,21 @@ class Place(BaseModel):
                 self.property_type.value if self.property_type else None
             ),
             "minimum_stay": self.minimum_stay,
-            "owner": self.owner.to_dict() if self.owner else None,
-            "reviews": [review.to_dict() for review in self.reviews],
-            "amenities": [amenity.to_dict() for amenity in self.amenities],
+            "review_count": self.review_count,
+            "rating_avg": self.rating_avg,
         }
         return {**base_dict, **place_dict}
+
+
+# Full-text index over name, description, city and country
+search.install(Place.__table__)
+
+
+@event.listens_for(Place, "before_insert")
+@event.listens_for(Place, "before_update")
+def _sync_geohash(mapper, connection, target: Place) -> None:
+    """Keep the geohash in step with the coordinates! 🧭"""
+    if target.latitude is None or target.longitude is None:
+        target.geohash = None
+    else:
+        target.geohash = geo.encode(target.latitude, target.longitude)
@@ -0,0 +1,280 @@
+"""PlaceQuery: every haunted search filter in one SQL statement! 🔎"""
+
+from typing import Iterable, List, Optional
+
+from sqlalchemy import distinct, func, or_, select
+
+from app.models.amenity import Amenity
+from app.models.place import Place, PlaceStatus, PropertyType
+from app.models.placeamenity import PlaceAmenity
+from app.persistence import search
+from app.persistence.repository import Page
+from app.utils import geo, log_me
+
+# Sort keys accepted by PlaceQuery.order_by ("-key" sorts descending)
+SORTS = {
+    "price": Place.price_by_night,
+    "capacity": Place.max_guest,
+    "name": Place.name,
+    "created_at": Place.created_at,
+    "rating": Place.rating_avg,
+    "reviews": Place.review_count,
+}
+DISTANCE = "distance"
+
+
+class PlaceQuery:
+    """Build a place search filter by filter, run it in one round trip! 🔎
+
+    Every call narrows the search and returns the builder, so filters
+    chain freely::
+
+        PlaceQuery().price(50, 150).capacity(4).order_by("-price").all()
+
+    Blocked and deleted places are left out unless a status is given.
+    """
+
+    def __init__(self):
+        """Start a search over every place of our realm! 🌍"""
+        self._conditions = [Place.is_deleted == False]  # noqa: E712
+        self._status: Optional[PlaceStatus] = None
+        self._near = None  # (lat, lon, radius) for the exact distance check
+        self._sort: Optional[str] = None
+        self._limit: Optional[int] = None
+        self._text: Optional[str] = None
+        self._fields: Optional[List[str]] = None
+
+    @property
+    def filtered(self) -> bool:
+        """Did any filter narrow the search? 🤔"""
+        return len(self._conditions) > 1 or self._status is not None
+
+    def matching(self, query: str) -> "PlaceQuery":
+        """Keep places whose name, description, city or country match! 🔍
+
+        Only used by ``search``, which ranks the hits by relevance.
+        """
+        search.terms(query)  # Refuse empty queries right away
+        self._text = query
+        return self
+
+    def price(
+        self,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> "PlaceQuery":
+        """Keep places within a price range per night! 💰"""
+        if min_price is not None:
+            self._conditions.append(Place.price_by_night >= float(min_price))
+        if max_price is not None:
+            self._conditions.append(Place.price_by_night <= float(max_price))
+        return self
+
+    def capacity(self, min_guests: int) -> "PlaceQuery":
+        """Keep places welcoming at least this many guests! 👻"""
+        self._conditions.append(Place.max_guest >= int(min_guests))
+        return self
+
+    def min_rating(self, rating: float) -> "PlaceQuery":
+        """Keep places rated at least this well on average! ⭐"""
+        self._conditions.append(Place.rating_avg >= float(rating))
+        return self
+
+    def property_type(self, property_type: str) -> "PlaceQuery":
+        """Keep one type of haunted property! 🏠"""
+        try:
+            self._conditions.append(
+                Place.property_type == PropertyType(property_type)
+            )
+        except ValueError:
+            raise ValueError(
+                "Property type must be one of: "
+                f"{', '.join(t.value for t in PropertyType)}"
+            )
+        return self
+
+    def status(self, status: str) -> "PlaceQuery":
+        """Keep places in one haunting status! 📊"""
+        try:
+            self._status = PlaceStatus(status)
+        except ValueError:
+            raise ValueError(
+                "Status must be one of: "
+                f"{', '.join(s.value for s in PlaceStatus)}"
+            )
+        return self
+
+    def bbox(
+        self, min_lat: float, min_lon: float, max_lat: float, max_lon: float
+    ) -> "PlaceQuery":
+        """Keep places inside a box, which may cross the antimeridian! 📦"""
+        if not -90 <= min_lat <= max_lat <= 90:
+            raise ValueError("Latitudes must satisfy -90 <= min <= max <= 90")
+        if not (-180 <= min_lon <= 180 and -180 <= max_lon <= 180):
+            raise ValueError("Longitudes must be between -180 and 180")
+
+        self._conditions.append(Place.latitude.between(min_lat, max_lat))
+        if min_lon <= max_lon:
+            self._conditions.append(Place.longitude.between(min_lon, max_lon))
+        else:
+            self._conditions.append(
+                or_(Place.longitude >= min_lon, Place.longitude <= max_lon)
+            )
+        return self
+
+    def within(self, lat: float, lon: float, radius: float) -> "PlaceQuery":
+        """Keep places within a radius, in kilometers! 🗺️
+
+        The covering geohash cells narrow the search in SQL; the exact
+        haversine distance is checked once the rows are back.
+        """
+        if radius <= 0:
+            raise ValueError("Radius must be a positive number")
+        span = radius / geo.KM_PER_DEGREE
+        self._conditions.append(Place.latitude.between(lat - span, lat + span))
+        cells = geo.cover(lat, lon, radius)
+        if cells is not None:
+            self._conditions.append(Place._in_cells(cells))
+        self._near = (lat, lon, radius)
+        return self
+
+    def amenities(self, amenity_ids: Iterable[str]) -> "PlaceQuery":
+        """Keep places offering every one of these amenities! ✨
+
+        Amenities owning a mask bit are matched with a single bitwise
+        test on the place row; the others (unknown, or past the mask
+        size) fall back to counting links.
+        """
+        wanted, mask = set(), 0
+        for amenity_id in set(amenity_ids):
+            amenity = Amenity.get_by_id(amenity_id)
+            if amenity is not None and amenity.bit is not None:
+                mask |= amenity.mask
+            else:
+                wanted.add(amenity_id)
+
+        if mask:
+            self._conditions.append(Place.amenity_mask.op("&")(mask) == mask)
+        if wanted:
+            owners = (
+                select(PlaceAmenity.place_id)
+                .where(PlaceAmenity.amenity_id.in_(wanted))
+                .group_by(PlaceAmenity.place_id)
+                .having(
+                    func.count(distinct(PlaceAmenity.amenity_id))
+                    == len(wanted)
+                )
+            )
+            self._conditions.append(Place.id.in_(owners))
+        return self
+
+    def order_by(self, sort: str) -> "PlaceQuery":
+        """Sort by price, capacity, name, rating, reviews... or distance! 📶"""
+        if sort.lstrip("-") not in SORTS and sort != DISTANCE:
+            raise ValueError(
+                f"Sort must be one of: {', '.join([*SORTS, DISTANCE])}"
+                " (prefix with - to reverse)"
+            )
+        self._sort = sort
+        return self
+
+    def limit(self, limit: int) -> "PlaceQuery":
+        """Keep only the first places! ✂️"""
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        self._limit = limit
+        return self
+
+    def only(self, fields: Iterable[str]) -> "PlaceQuery":
+        """Load only these columns, and no relation at all! ✂️"""
+        self._fields = list(fields)
+        return self
+
+    def _projection(self) -> Optional[List[str]]:
+        """Columns to load, coordinates included for the radius check! 📐"""
+        if self._fields is None or self._near is None:
+            return self._fields
+        return [*self._fields, "latitude", "longitude"]
+
+    def _where(self) -> List:
+        """Every condition, status included! 📜"""
+        if self._status is None:
+            status = Place.status != PlaceStatus.BLOCKED
+        else:
+            status = Place.status == self._status
+        return [*self._conditions, status]
+
+    def _order(self) -> List:
+        """SQL ordering, with the id as a stable tie-breaker! 📶"""
+        if self._sort is None or self._sort == DISTANCE:
+            return [Place.created_at, Place.id]
+        column = SORTS[self._sort.lstrip("-")]
+        return [column.desc() if self._sort[0] == "-" else column, Place.id]
+
+    @log_me(component="business")
+    def all(self) -> List[Place]:
+        """Run the search in a single SQL statement! 🔮"""
+        if self._near is None:
+            if self._sort == DISTANCE:
+                raise ValueError("Sorting by distance needs a location")
+            return Place.find_where(
+                *self._where(),
+                order_by=self._order(),
+                limit=self._limit,
+                fields=self._projection(),
+            )
+
+        # The exact distance check happens here, so limit after it
+        lat, lon, radius = self._near
+        rows = Place.find_where(
+            *self._where(), order_by=self._order(), fields=self._projection()
+        )
+        if self._sort in (None, DISTANCE):
+            ranked = Place._rank(rows, lat, lon)
+        else:
+            ranked = [
+                (place.distance_to(lat, lon), place)
+                for place in rows
+                if place.longitude is not None
+            ]
+        nearby = [place for distance, place in ranked if distance <= radius]
+        return nearby[: self._limit]
+
+    @log_me(component="business")
+    def page(self, limit: int, cursor: Optional[str] = None) -> Page:
+        """Run the search one keyset page at a time! 📜
+
+        Pages follow the (created_at, id) order, so neither a sort nor a
+        radius can be combined with them.
+        """
+        if self._sort is not None or self._near is not None:
+            raise ValueError("Pagination cannot follow a sort or a radius")
+        return Place.find_page(
+            limit, cursor=cursor, where=self._where(), fields=self._fields
+        )
+
+    @log_me(component="business")
+    def search(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[search.SearchHit]:
+        """Run a text search under every filter, best matches first! 🎯
+
+        Hits are ranked by relevance, so any sort order is ignored.
+        """
+        if self._text is None:
+            raise ValueError("Nothing to search for: call matching() first")
+        if self._near is None:
+            return search.search_places(
+                self._text, self._where(), limit=limit, offset=offset
+            )
+
+        # The exact distance check happens here, so paginate after it
+        lat, lon, radius = self._near
+        hits = [
+            hit
+            for hit in search.search_places(self._text, self._where())
+            if hit.place.longitude is not None
+            and hit.place.distance_to(lat, lon) <= radius
+        ]
+        end = None if limit is None else offset + limit
+        return hits[offset:end]
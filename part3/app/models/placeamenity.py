@@ -2,6 +2,8 @@
 
 from typing import Any, Dict
 
+from sqlalchemy import event, select
+
 from app import db
 from app.models.basemodel import BaseModel
 from app.utils import log_me
@@ -30,6 +32,7 @@ class PlaceAmenity(BaseModel):
         db.ForeignKey("amenity.id"),
         primary_key=True,
         nullable=False,
+        index=True,  # "Places offering this amenity" lookups
     )
 
     def __init__(self, place_id: str, amenity_id: str, **kwargs):
@@ -64,9 +67,44 @@ class PlaceAmenity(BaseModel):
 
         return amenity_id
 
-    @log_me(component="business")
-    def to_dict(self) -> Dict[str, Any]:
-        """Transform link into dictionary! 📚"""
-        base_dict = super().to_dict()
+    def _columns_dict(self) -> Dict[str, Any]:
+        """Transform link columns into dictionary! 📚"""
+        base_dict = super()._columns_dict()
         link_dict = {"place_id": self.place_id, "amenity_id": self.amenity_id}
         return {**base_dict, **link_dict}
+
+
+def _amenity_mask(connection, amenity_id: str) -> int:
+    """Read the mask bit of an amenity, 0 if it has none! 🔢"""
+    from app.models.amenity import Amenity
+
+    bit = connection.execute(
+        select(Amenity.bit).where(Amenity.id == amenity_id)
+    ).scalar()
+    return 0 if bit is None else 1 << bit
+
+
+@event.listens_for(PlaceAmenity, "after_insert")
+def _set_place_bit(mapper, connection, target: PlaceAmenity) -> None:
+    """A new link lights the amenity bit of its place! 💡"""
+    from app.models.place import Place
+
+    Place.flip_amenity_bits(
+        connection,
+        _amenity_mask(connection, target.amenity_id),
+        on=True,
+        place_id=target.place_id,
+    )
+
+
+@event.listens_for(PlaceAmenity, "after_delete")
+def _clear_place_bit(mapper, connection, target: PlaceAmenity) -> None:
+    """A broken link puts the amenity bit of its place out! 🌑"""
+    from app.models.place import Place
+
+    Place.flip_amenity_bits(
+        connection,
+        _amenity_mask(connection, target.amenity_id),
+        on=False,
+        place_id=target.place_id,
+    )
@@ -1,8 +1,9 @@
 """Review model module: Where ghosts share their haunting experiences! 👻."""
 
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
+from sqlalchemy import event, select
 from sqlalchemy.orm import relationship
 
 from app import db
@@ -20,12 +21,24 @@ class ReviewRating(str, Enum):
     FIVE = "5"
 
 
+class _ImportedAuthor(str):
+    """An author id the importer checked with its whole chunk! 📥"""
+
+
 class Review(BaseModel):
     """Review: A spectral critique in our haunted realm! 📝."""
 
+    __table_args__ = (
+        # Un fantôme, une critique par lieu (NULL après anonymisation)
+        db.UniqueConstraint("user_id", "place_id", name="unique_user_place"),
+    )
+
     # SQLAlchemy columns
     place_id = db.Column(
-        db.String(36), db.ForeignKey("place.id"), nullable=False
+        db.String(36),
+        db.ForeignKey("place.id"),
+        nullable=False,
+        index=True,  # Reviews of a place, rating rebuilds
     )
     user_id = db.Column(
         db.String(36),
@@ -37,6 +50,8 @@ class Review(BaseModel):
         db.Enum(ReviewRating), nullable=True  # Pour permettre le soft delete
     )
 
+    __serialize_plan__ = {"place": "joined", "author": "joined"}
+
     def __init__(
         self, place_id: str, user_id: str, text: str, rating: int, **kwargs
     ):
@@ -46,7 +61,10 @@ class Review(BaseModel):
             from app.models.place import Place  # noqa: F811
 
             place = Place.get_by_id(place_id)
-            if place.owner_id == user_id:
+            if (
+                not isinstance(user_id, _ImportedAuthor)
+                and place.owner_id == user_id
+            ):
                 error_msg = "Cannot review your own place"
                 raise ValueError(error_msg)
         except ImportError:
@@ -61,6 +79,19 @@ class Review(BaseModel):
         self.text = self._validate_text(text)
         self.rating = self._validate_rating(rating)
 
+    @classmethod
+    @log_me(component="business")
+    def from_import(cls, **row) -> "Review":
+        """Summon a review from an import row the importer checked! 📥
+
+        The importer checks the author, the owner of the place and the
+        past reviews for a whole chunk at once, so they are not looked up
+        again row by row. Never for rows that skipped those checks.
+        """
+        if isinstance(row.get("user_id"), str):
+            row["user_id"] = _ImportedAuthor(row["user_id"])
+        return cls(**row)
+
     @log_me(component="business")
     def _validate_place_id(self, place_id: str) -> str:
         """Validate place ID! 🏰."""
@@ -80,6 +111,9 @@ class Review(BaseModel):
         """Validate user ID! 👤."""
         if not isinstance(user_id, str) or not user_id.strip():
             raise ValueError("User ID must be a non-empty string!")
+        if isinstance(user_id, _ImportedAuthor):
+            # Auteur, lieu et doublons déjà vérifiés par l'import
+            return str(user_id)
 
         # Vérifier que l'user existe
         from app.models.place import Place
@@ -142,12 +176,10 @@ class Review(BaseModel):
     def delete(self) -> bool:
         """Soft delete this review! 🌙."""
         try:
+            # is_deleted is protected from update(): flag it directly
+            self.is_deleted = True
             return self.update(
-                {
-                    "rating": None,
-                    "text": "[This review has been deleted]",
-                    "is_deleted": True,
-                }
+                {"rating": None, "text": "[This review has been deleted]"}
             )
         except Exception as error:
             raise ValueError(f"Failed to soft delete Review: {str(error)}")
@@ -163,17 +195,77 @@ class Review(BaseModel):
             db.session.rollback()
             raise ValueError(f"Failed to anonymize Review: {str(error)}")
 
-    @log_me(component="business")
-    def to_dict(self) -> Dict[str, Any]:
-        """Transform review into dictionary! 📚."""
-        base_dict = super().to_dict()
+    def _columns_dict(self) -> Dict[str, Any]:
+        """Transform review columns into dictionary! 📚."""
+        base_dict = super()._columns_dict()
         review_dict = {
             "place_id": self.place_id,
             "user_id": self.user_id,
             "text": self.text,
             "rating": self.rating.value if self.rating else None,
-            # Ajout des relations
-            "place": self.place.to_dict() if self.place else None,
-            "author": self.author.to_dict() if self.author else None,
         }
         return {**base_dict, **review_dict}
+
+
+def _weight(rating, is_deleted) -> Tuple[int, int]:
+    """What a review adds to its place: (count, rating points)! ⚖️"""
+    if rating is None or is_deleted:
+        return 0, 0
+    return 1, int(ReviewRating(rating).value)
+
+
+def _stored_weight(
+    connection, review_id: str
+) -> Tuple[Optional[str], int, int]:
+    """The place and weight of a review as the database holds it! 🗄️"""
+    table = Review.__table__
+    row = connection.execute(
+        select(table.c.place_id, table.c.rating, table.c.is_deleted).where(
+            table.c.id == review_id
+        )
+    ).first()
+    if row is None:
+        return None, 0, 0
+    return (row.place_id, *_weight(row.rating, row.is_deleted))
+
+
+@event.listens_for(Review, "after_insert")
+def _count_review(mapper, connection, target: Review) -> None:
+    """A new review joins its place aggregates! ⭐"""
+    from app.models.place import Place
+
+    Place.adjust_ratings(
+        connection,
+        target.place_id,
+        *_weight(target.rating, target.is_deleted),
+    )
+
+
+@event.listens_for(Review, "before_update")
+def _recount_review(mapper, connection, target: Review) -> None:
+    """Move an edited review between aggregates (anonymizing keeps it)! 🔄"""
+    from app.models.place import Place
+
+    old_place, old_count, old_points = _stored_weight(connection, target.id)
+    new_count, new_points = _weight(target.rating, target.is_deleted)
+    if old_place == target.place_id:
+        Place.adjust_ratings(
+            connection,
+            target.place_id,
+            new_count - old_count,
+            new_points - old_points,
+        )
+    else:
+        Place.adjust_ratings(connection, old_place, -old_count, -old_points)
+        Place.adjust_ratings(
+            connection, target.place_id, new_count, new_points
+        )
+
+
+@event.listens_for(Review, "before_delete")
+def _discount_review(mapper, connection, target: Review) -> None:
+    """A banished review leaves its place aggregates! ⚰️"""
+    from app.models.place import Place
+
+    place_id, count, points = _stored_weight(connection, target.id)
+    Place.adjust_ratings(connection, place_id, -count, -points)
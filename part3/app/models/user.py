@@ -10,6 +10,12 @@ from app import bcrypt, db
 from app.models.basemodel import BaseModel
 from app.utils import log_me
 
+BCRYPT_HASH = re.compile(r"^\$2[aby]?\$\d{2}\$[./A-Za-z0-9]{53}$")
+
+
+class _ImportedHash(str):
+    """A bcrypt hash handed over by User.from_import, never rehashed! 🔏"""
+
 
 class User(BaseModel):
     """User: A spectral entity in our haunted realm! 👻."""
@@ -52,9 +58,12 @@ class User(BaseModel):
         self.email = self._validate_email(email)
         self.first_name = self._validate_name(first_name, "First name")
         self.last_name = self._validate_name(last_name, "Last name")
-        self.password_hash = self._hash_password(
-            self._validate_password(password)
-        )  # Hash password before saving
+        if isinstance(password, _ImportedHash):
+            self.password_hash = self._validate_password_hash(password)
+        else:
+            self.password_hash = self._hash_password(
+                self._validate_password(password)
+            )  # Hash password before saving
         self.is_admin = is_admin
 
         # Optional attributes
@@ -100,6 +109,15 @@ class User(BaseModel):
             raise ValueError("Password must contain at least one number!")
         return password
 
+    @log_me(component="business")
+    def _validate_password_hash(self, password_hash: str) -> str:
+        """Validate an already hashed secret (bcrypt only)! 🔏."""
+        if not isinstance(password_hash, str) or not BCRYPT_HASH.match(
+            password_hash
+        ):
+            raise ValueError("Password hash must be a bcrypt hash!")
+        return password_hash
+
     @log_me(component="business")
     def _validate_name(self, name: str, field: str) -> str:
         """Validate name fields! 👤."""
@@ -125,6 +143,21 @@ class User(BaseModel):
             return False
         return bcrypt.check_password_hash(self.password_hash, password)
 
+    @classmethod
+    @log_me(component="business")
+    def from_import(cls, **row) -> "User":
+        """Summon a user from an import row! 📥
+
+        Rows may carry a ready-made bcrypt ``password_hash`` instead of a
+        password, so dumps and seeds are not hashed twice.
+        """
+        password_hash = row.pop("password_hash", None)
+        if password_hash is not None:
+            if "password" in row:
+                raise ValueError("Give a password or a hash, not both!")
+            row["password"] = _ImportedHash(password_hash)
+        return cls(**row)
+
     @classmethod
     @log_me(component="business")
     def authenticate(cls, email: str, password: str) -> Optional["User"]:
@@ -232,10 +265,9 @@ class User(BaseModel):
         except Exception as e:
             raise ValueError(f"Reactivate operation failed: {str(e)}")
 
-    @log_me(component="business")
-    def to_dict(self) -> Dict[str, Any]:
-        """Transform user into dictionary! 📚."""
-        base_dict = super().to_dict()
+    def _columns_dict(self) -> Dict[str, Any]:
+        """Transform user columns into dictionary! 📚."""
+        base_dict = super()._columns_dict()
         if "password_hash" in base_dict:
             del base_dict["password_hash"]
         user_dict = {
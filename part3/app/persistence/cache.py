@@ -0,0 +1,416 @@
+"""Caches for our haunted entities and queries! 🧠"""
+
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from flask import g, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from app import db
+
+FLUSHED_KEYS = "haunted_flushed_keys"
+FLUSHED_TABLES = "haunted_flushed_tables"
+MISSING = object()
+
+
+class SnapshotShelf:
+    """Detached copies of entities, safe to share between requests! 🗄️
+
+    Snapshots live in a session never bound to an engine. Their relations
+    are expired so that, once merged back, they load fresh. Callers must
+    hold their own lock around every shelf operation.
+    """
+
+    def __init__(self):
+        self.session = Session()
+        self.session.info["haunted_shelf"] = True
+
+    def store(self, obj):
+        """Copy a clean, committed entity onto the shelf! 📸"""
+        state = inspect(obj)
+        if not state.persistent or state.modified or state.expired_attributes:
+            return None
+        # Écrit mais pas encore commité : pas de partage entre requêtes
+        key = (type(obj).__name__, obj.id)
+        flushed = db.session.info.get(FLUSHED_KEYS, ())
+        if key in flushed or (key[0], None) in flushed:
+            return None
+        try:
+            snapshot = self.session.merge(obj, load=False)
+        except InvalidRequestError:
+            return None  # Une relation chargée est en cours de modification
+        self.session.expire(
+            snapshot, [rel.key for rel in state.mapper.relationships]
+        )
+        return snapshot
+
+    @staticmethod
+    def attach(snapshot):
+        """Bring a snapshot into the current session, without SQL! 🔗"""
+        existing = db.session.identity_map.get(inspect(snapshot).key)
+        if existing is not None:
+            return existing
+        return db.session.merge(snapshot, load=False)
+
+    def discard(self, snapshot):
+        """Take a snapshot off the shelf! 🗑️"""
+        if snapshot is not None and snapshot in self.session:
+            self.session.expunge(snapshot)
+
+    def clear(self):
+        """Empty the whole shelf! 🌪️"""
+        self.session.expunge_all()
+
+
+class IdentityCache:
+    """Two-level read-through cache keyed by (model, id)! 🏰
+
+    Level one is a per-request identity map kept in ``flask.g``. Level two
+    is a process-wide LRU with a TTL holding detached snapshots, merged
+    back into the current session without any SQL on a hit. Any flush
+    touching an entity invalidates both levels, whatever path wrote it.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # Invalidations per model, and clears: both only ever grow
+        self._generations: Dict[str, int] = {}
+        self._cleared = 0
+        self._entries: "OrderedDict[Tuple[str, str], tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._shelf = SnapshotShelf()
+
+    def configure(self, maxsize: int, ttl: float):
+        """Resize the process-wide level! ⚙️"""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clear()
+
+    @staticmethod
+    def cacheable(model) -> bool:
+        """Only single-column primary keys fit in our cache! 🔑"""
+        return len(inspect(model).primary_key) == 1
+
+    @staticmethod
+    def _request_map() -> dict:
+        """Get the identity map of the current request! 📌"""
+        if not has_app_context():
+            return {}
+        if "haunted_identity_map" not in g:
+            g.haunted_identity_map = {}
+        return g.haunted_identity_map
+
+    def get(self, model, obj_id: str):
+        """Find a cached entity, attached to the current session! 🔮"""
+        key = (model.__name__, obj_id)
+        request_map = self._request_map()
+        obj = request_map.get(key)
+        if obj is not None:
+            self.hits += 1
+            return obj
+
+        # Déjà présent dans la session ? Aucun SQL nécessaire
+        obj = db.session.identity_map.get(identity_key(model, obj_id))
+        if obj is None and self.maxsize > 0:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] < time.monotonic():
+                    self._drop(key)
+                    entry = None
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    obj = self._shelf.attach(entry[1])
+
+        if obj is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        request_map[key] = obj
+        return obj
+
+    def generation(self, model) -> int:
+        """Token to read before loading an entity of this model! 🔢"""
+        return self._generations.get(model.__name__, 0) + self._cleared
+
+    def put(self, model, obj, generation: int):
+        """Remember an entity freshly loaded from the database! ✍️
+
+        ``generation`` is the token read before the load: if an entity
+        of the model was invalidated since, the load may predate that
+        write, and it is kept for this request only.
+        """
+        key = (model.__name__, obj.id)
+        self._request_map()[key] = obj
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            if generation != self.generation(model):
+                return
+            self._drop(key)
+            snapshot = self._shelf.store(obj)
+            if snapshot is None:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, snapshot)
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, model_name: str, obj_id: Optional[str] = None):
+        """Forget one entity, or all those of a model, in both levels! 🧹"""
+        request_map = self._request_map()
+        with self._lock:
+            self._generations[model_name] = (
+                self._generations.get(model_name, 0) + 1
+            )
+            if obj_id is None:
+                keys = [key for key in self._entries if key[0] == model_name]
+                keys += [key for key in request_map if key[0] == model_name]
+            else:
+                keys = [(model_name, obj_id)]
+            for key in keys:
+                request_map.pop(key, None)
+                self._drop(key)
+
+    def clear(self):
+        """Forget everything! 🌪️"""
+        self._request_map().clear()
+        with self._lock:
+            self._cleared += 1
+            self._entries.clear()
+            self._shelf.clear()
+
+    def _drop(self, key):
+        """Evict one snapshot, the lock being held! ⚰️"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._shelf.discard(entry[1])
+
+
+class QueryCache:
+    """Result cache for repository reads, keyed on (model, criteria)! 📚
+
+    Each table carries a version counter bumped by every flush writing to
+    it. An entry remembers the version it was computed at, so a write
+    invalidates all the cached queries of its table in O(1).
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._versions: Dict[str, int] = {}
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._shelf = SnapshotShelf()
+
+    def configure(self, maxsize: int, ttl: float):
+        """Resize the cache! ⚙️"""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clear()
+
+    @staticmethod
+    def key(model, kind: str, criteria: Dict[str, Any]) -> Optional[tuple]:
+        """Normalize the criteria, or None if they cannot be cached! 🔑"""
+        items = []
+        for name, value in sorted(criteria.items()):
+            if isinstance(value, Enum):
+                value = value.value
+            if value is not None and not isinstance(
+                value, (str, int, float, bool)
+            ):
+                return None
+            items.append((name, value))
+        return (model.__tablename__, kind, tuple(items))
+
+    def version(self, table: str) -> int:
+        """Current version of a table! 🔢"""
+        return self._versions.get(table, 0)
+
+    def bump(self, table: str):
+        """A table was written: every cached query on it is stale! ⚡"""
+        with self._lock:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+    def get(self, key: tuple):
+        """Find a cached result, or MISSING! 🔮"""
+        if self.maxsize <= 0 or key is None:
+            return MISSING
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry[0] != self._versions.get(key[0], 0)
+                or entry[1] < time.monotonic()
+            ):
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self.hits += 1
+            self._entries.move_to_end(key)
+            result = entry[2]
+            if isinstance(result, list):
+                return [self._shelf.attach(s) for s in result]
+            return result if result is None else self._shelf.attach(result)
+
+    def put(self, key: tuple, result, version: int):
+        """Remember a result computed at a table version! ✍️
+
+        ``version`` must be read before running the query: a write landing
+        in between bumps the table, and the result is then not stored.
+        """
+        if self.maxsize <= 0 or key is None:
+            return
+        # Table modifiée dans la transaction en cours : rien à partager
+        if key[0] in db.session.info.get(FLUSHED_TABLES, ()):
+            return
+
+        with self._lock:
+            if version != self._versions.get(key[0], 0):
+                return
+            self._drop(key)
+            if isinstance(result, list):
+                snapshots = [self._shelf.store(obj) for obj in result]
+                if any(s is None for s in snapshots):
+                    return
+            elif result is not None:
+                snapshots = self._shelf.store(result)
+                if snapshots is None:
+                    return
+            else:
+                snapshots = None
+            self._entries[key] = (
+                version,
+                time.monotonic() + self.ttl,
+                snapshots,
+            )
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+
+    def stats(self) -> Dict[str, int]:
+        """How well is our cache doing? 📊"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """Forget every entry! 🌪️
+
+        Versions are kept: they only ever grow, so a token read before
+        the clear still tells a later write apart.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._shelf.clear()
+
+    def _drop(self, key):
+        """Evict one entry, the lock being held! ⚰️"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        snapshots = entry[2]
+        for snapshot in (
+            snapshots if isinstance(snapshots, list) else [snapshots]
+        ):
+            self._shelf.discard(snapshot)
+
+
+def _keys(objects):
+    """Cache keys of the entities a flush touched! 🗝️"""
+    return {
+        (type(obj).__name__, obj.id)
+        for obj in objects
+        if getattr(obj, "id", None) is not None
+    }
+
+
+def _tables(objects):
+    """Tables a flush wrote to, association tables included! 🗃️"""
+    tables = set()
+    for obj in objects:
+        mapper = inspect(obj).mapper
+        tables.update(table.name for table in mapper.tables)
+        tables.update(
+            rel.secondary.name
+            for rel in mapper.relationships
+            if rel.secondary is not None
+        )
+    return tables
+
+
+def note_write(
+    session, table: str, model_name: str, obj_id: Optional[str] = None
+):
+    """Warn the caches of a write the ORM did not see! 📣
+
+    Core statements run mid-flush are invisible to after_flush: the
+    caches are invalidated now, and the write is recorded so that the
+    commit (or the rollback) invalidates it once more. Without
+    ``obj_id``, every entity of the model is forgotten.
+    """
+    session.info.setdefault(FLUSHED_KEYS, set()).add((model_name, obj_id))
+    session.info.setdefault(FLUSHED_TABLES, set()).add(table)
+    identity_cache.invalidate(model_name, obj_id)
+    query_cache.bump(table)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed(session, flush_context):
+    """Every write goes through a flush: forget what it touched! ⚡"""
+    if session.info.get("haunted_shelf"):
+        return  # Nos étagères ne flushent jamais
+    touched = set(session.new) | set(session.dirty) | set(session.deleted)
+
+    keys = _keys(touched)
+    session.info.setdefault(FLUSHED_KEYS, set()).update(keys)
+    for model_name, obj_id in keys:
+        identity_cache.invalidate(model_name, obj_id)
+
+    tables = _tables(touched)
+    session.info.setdefault(FLUSHED_TABLES, set()).update(tables)
+    for table in tables:
+        query_cache.bump(table)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_flushed(session):
+    """Committed entities can be shared again! ✅
+
+    Readers between the flush and the commit still saw the old rows:
+    invalidating once more keeps what they load off the shared levels.
+    """
+    for model_name, obj_id in session.info.pop(FLUSHED_KEYS, None) or ():
+        identity_cache.invalidate(model_name, obj_id)
+    for table in session.info.pop(FLUSHED_TABLES, None) or ():
+        query_cache.bump(table)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _rollback_flushed(session, previous_transaction):
+    """Rolled back writes must not survive in our caches! ↩️"""
+    keys = session.info.pop(FLUSHED_KEYS, None)
+    if keys:
+        for model_name, obj_id in keys:
+            identity_cache.invalidate(model_name, obj_id)
+        identity_cache._request_map().clear()
+    for table in session.info.pop(FLUSHED_TABLES, None) or ():
+        query_cache.bump(table)
+
+
+# Créer les instances globales
+identity_cache = IdentityCache()
+query_cache = QueryCache()
@@ -0,0 +1,438 @@
+"""Streaming bulk imports: NDJSON/CSV files into the haunted tables! 📥"""
+
+import csv
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from flask import current_app
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import lazyload
+
+from app import db
+from app.persistence.cache import query_cache
+from app.utils import geo
+
+# Import order: every table comes after the ones it points to
+KINDS = ("users", "amenities", "places", "reviews", "links")
+FORMATS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv"}
+TRUE = {"1", "true", "yes", "on"}
+# Rows of one run repeating these columns are rejected before insert
+UNIQUE_KEYS = {"reviews": ("user_id", "place_id")}
+
+
+def model_for(kind: str):
+    """The model class behind an import kind! 🗂️"""
+    from app.models.amenity import Amenity
+    from app.models.place import Place
+    from app.models.placeamenity import PlaceAmenity
+    from app.models.review import Review
+    from app.models.user import User
+
+    models = {
+        "users": User,
+        "amenities": Amenity,
+        "places": Place,
+        "reviews": Review,
+        "links": PlaceAmenity,
+    }
+    if kind not in models:
+        raise ValueError(f"kind must be one of: {', '.join(KINDS)}")
+    return models[kind]
+
+
+def file_format(path: str) -> str:
+    """ndjson or csv, from the file extension! 🔖"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(
+            f"{path}: extension must be one of: {', '.join(FORMATS)}"
+        )
+    return FORMATS[extension]
+
+
+def read_rows(path: str) -> Iterator[Tuple[int, dict]]:
+    """Stream (line number, row) pairs, one line in memory at a time! 🌊"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if file_format(path) == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        loads = current_app.json.loads
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = loads(line)
+            except ValueError as e:
+                row = ValueError(f"Invalid JSON: {e}")
+            yield number, row
+
+
+def sql_statements(path: str) -> Iterator[str]:
+    """Stream the statements of a SQL script, one by one! 📜
+
+    A statement ends at a semicolon only when SQLite agrees it is
+    complete, so semicolons in string literals and trigger bodies are
+    left alone.
+    """
+    buffer = ""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            buffer += line
+            if sqlite3.complete_statement(buffer):
+                yield buffer.strip()
+                buffer = ""
+    if buffer.strip() and not _only_comments(buffer):
+        yield buffer.strip()
+
+
+def _only_comments(sql: str) -> bool:
+    """Is this leftover only comments and blanks? 💬"""
+    return all(
+        not line.strip() or line.strip().startswith("--")
+        for line in sql.splitlines()
+    )
+
+
+def _coerce(table, row: dict) -> dict:
+    """Turn CSV strings back into the column types! 🔧
+
+    Empty cells are left out, so the model defaults apply.
+    """
+    values = {}
+    for key, value in row.items():
+        if value == "" or key is None:
+            continue
+        column = table.columns.get(key)
+        if column is not None and isinstance(value, str):
+            try:
+                kind = column.type.python_type
+            except NotImplementedError:
+                kind = str
+            if kind is bool:
+                value = value.strip().lower() in TRUE
+            elif kind is datetime:
+                value = datetime.fromisoformat(value)
+            elif kind in (int, float):
+                value = kind(value)
+        values[key] = value
+    return values
+
+
+def _values(obj, table) -> dict:
+    """Column values of an entity (or a raw row), defaults filled in! 🧱
+
+    executemany needs the same keys in every row, so each column gets a
+    value here rather than at flush time.
+    """
+    if isinstance(obj, dict):
+        obj = SimpleNamespace(**obj)
+    values = {}
+    for column in table.columns:
+        value = getattr(obj, column.key, None)
+        if value is None and column.default is not None:
+            default = column.default
+            value = default.arg(None) if default.is_callable else default.arg
+        values[column.key] = value
+    if table.name == "place":
+        # Ce que ferait _sync_geohash au flush
+        values["geohash"] = (
+            None
+            if values["latitude"] is None or values["longitude"] is None
+            else geo.encode(values["latitude"], values["longitude"])
+        )
+    return values
+
+
+@dataclass
+class ImportReport:
+    """What an import did, row by row! 📋"""
+
+    kind: str
+    skipped: int = 0
+    read: int = 0
+    inserted: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Rows read per second, by this run! ⏱️"""
+        return self.read / self.seconds if self.seconds else 0.0
+
+
+def checkpoint_path(path: str) -> str:
+    """Where the progress of an import is kept! 🔖"""
+    return f"{path}.progress"
+
+
+def read_checkpoint(path: str) -> int:
+    """Rows of this file already committed by an earlier run! 🔖"""
+    try:
+        with open(checkpoint_path(path)) as f:
+            return int(json.load(f)["rows"])
+    except FileNotFoundError:
+        return 0
+
+
+def _write_checkpoint(path: str, rows: int) -> None:
+    """Record committed rows, atomically! 💾"""
+    temporary = f"{checkpoint_path(path)}.tmp"
+    with open(temporary, "w") as f:
+        json.dump({"rows": rows}, f)
+    os.replace(temporary, checkpoint_path(path))
+
+
+def _insert(table, rows: List[Tuple[int, dict]], report: ImportReport):
+    """Insert a chunk with executemany, in one transaction! 💾
+
+    When a constraint fails, the chunk is retried row by row so that
+    only the faulty rows are left out. Any other error is fatal.
+    """
+    if not rows:
+        return
+    statement = insert(table)
+    try:
+        db.session.execute(statement, [values for _, values in rows])
+        db.session.commit()
+        report.inserted += len(rows)
+        return
+    except IntegrityError:
+        db.session.rollback()
+
+    # On isole les lignes maudites
+    for number, values in rows:
+        try:
+            db.session.execute(statement, [values])
+            db.session.commit()
+            report.inserted += 1
+        except IntegrityError as e:
+            db.session.rollback()
+            report.errors.append((number, str(e.orig)))
+
+
+def _check_unique(values: dict, columns: Tuple[str, ...], seen: set):
+    """Reject a row repeating an earlier row of the same run! 🚫
+
+    The model checks only see committed rows, and a whole chunk is
+    inserted at once.
+    """
+    key = tuple(values[column] for column in columns)
+    if None in key:
+        return
+    if key in seen:
+        raise ValueError(f"Duplicate {', '.join(columns)} in this import")
+    seen.add(key)
+
+
+@dataclass
+class References:
+    """What the rows of a chunk point to, fetched once per chunk! 🔗"""
+
+    ids: Dict[str, Set[str]] = field(default_factory=dict)
+    owners: Dict[str, str] = field(default_factory=dict)
+    reviewed: Set[Tuple[str, str]] = field(default_factory=set)
+    # Garde les entités dans l'identity map le temps du chunk
+    loaded: list = field(default_factory=list)
+
+
+def _references(kind: str, table, rows: List[Tuple[int, dict]]):
+    """Fetch the entities a chunk points to, one query per table! 🔗
+
+    Once loaded, the per-row lookups of the model constructors are
+    answered by the session identity map instead of the database.
+    """
+    models = {
+        model.__tablename__: model for model in map(model_for, KINDS)
+    }
+    references = References()
+    for key in table.foreign_keys:
+        column = key.parent.key
+        model = models[key.column.table.name]
+        wanted = {
+            row[column]
+            for _, row in rows
+            if isinstance(row.get(column), str)
+        }
+        found = (
+            model.query.options(lazyload("*"))
+            .filter(model.id.in_(wanted))
+            .all()
+            if wanted
+            else []
+        )
+        references.loaded.extend(found)
+        references.ids[column] = {entity.id for entity in found}
+        if kind == "reviews" and column == "place_id":
+            references.owners = {
+                place.id: place.owner_id for place in found
+            }
+    if kind == "reviews" and references.ids["place_id"]:
+        review = model_for(kind)
+        references.reviewed = set(
+            db.session.execute(
+                select(review.user_id, review.place_id).where(
+                    review.place_id.in_(references.ids["place_id"]),
+                    review.user_id.in_(references.ids["user_id"]),
+                )
+            ).all()
+        )
+    return references
+
+
+def _check_references(kind: str, row: dict, references: References):
+    """Reject a row pointing to nothing, or reviewing twice! 🚫"""
+    for column, known in references.ids.items():
+        value = row.get(column)
+        if isinstance(value, str) and value not in known:
+            raise ValueError(f"Invalid {column}: {value} does not exist!")
+    if kind == "reviews":
+        pair = (row.get("user_id"), row.get("place_id"))
+        if references.owners.get(pair[1]) == pair[0]:
+            raise ValueError("Cannot review your own place")
+        if pair in references.reviewed:
+            raise ValueError("User already reviewed this place!")
+
+
+def _import_chunk(
+    kind: str,
+    pending: List[Tuple[int, object]],
+    report: ImportReport,
+    validate: bool,
+    seen: set,
+):
+    """Coerce, check, build and insert one chunk of rows! 📦
+
+    References are fetched for the whole chunk before any row is built,
+    so a chunk costs the same handful of queries whatever its size.
+    """
+    model_class = model_for(kind)
+    # Un modèle peut offrir son propre constructeur d'import
+    build = getattr(model_class, "from_import", model_class)
+    table = model_class.__table__
+    unique = UNIQUE_KEYS.get(kind)
+
+    rows = []
+    for number, row in pending:
+        try:
+            if isinstance(row, Exception):
+                raise row
+            if not isinstance(row, dict):
+                raise ValueError("Row must be an object")
+            rows.append((number, _coerce(table, row)))
+        except Exception as e:
+            report.errors.append((number, str(e)))
+    references = _references(kind, table, rows) if validate else None
+
+    chunk: List[Tuple[int, dict]] = []
+    for number, row in rows:
+        try:
+            if validate:
+                _check_references(kind, row, references)
+            obj = build(**row) if validate else row
+            values = _values(obj, table)
+            if unique:
+                _check_unique(values, unique, seen)
+            chunk.append((number, values))
+        except Exception as e:
+            report.errors.append((number, str(e)))
+    _insert(table, chunk, report)
+    query_cache.bump(table.name)
+
+
+def import_rows(
+    kind: str,
+    rows: Iterable[Tuple[int, dict]],
+    chunk_size: Optional[int] = None,
+    validate: bool = True,
+    skip: int = 0,
+    progress: Optional[Callable[[ImportReport], None]] = None,
+    committed: Optional[Callable[[int], None]] = None,
+) -> ImportReport:
+    """Import (line number, row) pairs, chunk after chunk! 📥
+
+    Each chunk is checked against the rows it points to, fetched in one
+    query per table, then validated through the model constructors (or
+    their ``from_import`` classmethod, when they have one), inserted
+    with a single executemany and committed. Rejected rows are
+    reported, not fatal. Without ``validate``, rows go straight to the
+    table: only for rows valid by construction.
+
+    Args:
+        skip: Leading rows already imported by an earlier run
+        committed: Called with the rows consumed after every commit
+    """
+    size = model_for(kind)._get_repo()._chunk_size(chunk_size)
+    report = ImportReport(kind=kind, skipped=skip)
+    seen = set()
+
+    started = time.perf_counter()
+    pending: List[Tuple[int, object]] = []
+    for index, (number, row) in enumerate(rows):
+        if index < skip:
+            continue
+        report.read += 1
+        pending.append((number, row))
+        if report.read % size == 0:
+            _import_chunk(kind, pending, report, validate, seen)
+            pending = []
+            report.seconds = time.perf_counter() - started
+            if committed:
+                committed(skip + report.read)
+            if progress:
+                progress(report)
+    _import_chunk(kind, pending, report, validate, seen)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def import_file(
+    kind: str,
+    path: str,
+    chunk_size: Optional[int] = None,
+    resume: bool = False,
+    progress: Optional[Callable[[ImportReport], None]] = None,
+) -> ImportReport:
+    """Import one NDJSON/CSV file, resumably! 📥
+
+    After every commit, the rows consumed are recorded next to the
+    file, so that ``resume`` picks up after the last committed chunk.
+    """
+    report = import_rows(
+        kind,
+        read_rows(path),
+        chunk_size,
+        skip=read_checkpoint(path) if resume else 0,
+        progress=progress,
+        committed=lambda rows: _write_checkpoint(path, rows),
+    )
+    if os.path.exists(checkpoint_path(path)):
+        os.remove(checkpoint_path(path))  # Terminé : rien à reprendre
+    return report
+
+
+def finish(kinds: Dict[str, ImportReport]) -> None:
+    """Rebuild what the ORM events would have kept up to date! 🔧"""
+    from app.models.place import Place
+
+    if kinds.keys() & {"amenities", "links"}:
+        Place.rebuild_amenity_masks()
+    if "reviews" in kinds:
+        Place.rebuild_ratings()
@@ -1,7 +1,42 @@
 """Repository pattern for our haunted database! 👻"""
 
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from flask import current_app, g
+from sqlalchemy import and_, or_, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import lazyload, load_only
+
 from app import db
-from app.utils import log_me
+from app.persistence.cache import MISSING, query_cache
+from app.utils import haunted_logger, log_me
+
+
+class Page(list):
+    """A slice of spirits, with a bookmark to the next one! 🔖"""
+
+    def __init__(self, items=(), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(obj) -> str:
+    """Seal the (created_at, id) position of a spirit! 🔒"""
+    payload = json.dumps([obj.created_at.isoformat(), obj.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Break the seal of an opaque cursor! 🔓"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, obj_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(obj_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor! 🔮")
 
 
 class SQLAlchemyRepository:
@@ -11,6 +46,59 @@ class SQLAlchemyRepository:
         """Initialize with a specific model class! 🎭"""
         self.model = model
 
+    def _cached(self, kind: str, criteria: dict, run):
+        """Read through the query cache! 📚"""
+        key = query_cache.key(self.model, kind, criteria)
+        result = query_cache.get(key)
+        if result is MISSING:
+            # Lue avant la requête : une écriture concurrente l'invalide
+            version = query_cache.version(key[0]) if key else 0
+            result = run()
+            query_cache.put(key, result, version)
+        return result
+
+    def _query(
+        self,
+        eager: bool = False,
+        options: Sequence = (),
+        fields: Optional[Sequence[str]] = None,
+    ):
+        """Open a query, following the serialization plan if asked! 🔮
+
+        Explicit loader ``options`` come on top of the plan, for callers
+        that know exactly which relations they are about to walk. With
+        ``fields``, only those columns are selected and no relation is
+        loaded at all, the plan included.
+        """
+        query = self.model.query
+        if fields is not None:
+            return query.options(*self.projection(fields), *options)
+        if eager:
+            query = query.options(*self.model.eager_options())
+        if options:
+            query = query.options(*options)
+        return query
+
+    def projection(self, fields: Sequence[str]) -> list:
+        """Loader options selecting only some columns! ✂️
+
+        The id and created_at always come along: they name the entity and
+        place it in keyset pages.
+        """
+        columns = self.model.__table__.columns
+        unknown = [
+            name
+            for name in fields
+            if name not in columns or name.startswith("_")
+        ]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        names = dict.fromkeys(["id", "created_at", *fields])
+        return [
+            load_only(*(getattr(self.model, name) for name in names)),
+            lazyload("*"),
+        ]
+
     @log_me(component="persistence")
     def add(self, obj):
         """Summon a new spirit into our database! ✨"""
@@ -18,14 +106,18 @@ class SQLAlchemyRepository:
         db.session.commit()
 
     @log_me(component="persistence")
-    def get(self, obj_id):
+    def get(self, obj_id, eager: bool = False):
         """Channel a specific spirit from the beyond! 🔮"""
-        return self.model.query.get(obj_id)
+        return self._query(eager).get(obj_id)
 
     @log_me(component="persistence")
-    def get_all(self):
+    def get_all(
+        self, eager: bool = False, fields: Optional[Sequence[str]] = None
+    ):
         """Summon ALL the spirits! 👻"""
-        return self.model.query.all()
+        if eager or fields is not None:
+            return self._query(eager, fields=fields).all()
+        return self._cached("all", {}, lambda: self.model.query.all())
 
     @log_me(component="persistence")
     def get_by_email(self, email):
@@ -50,15 +142,219 @@ class SQLAlchemyRepository:
             db.session.commit()
 
     @log_me(component="persistence")
-    def get_by_attribute(self, multiple: bool = False, **kwargs):
+    def get_by_attribute(
+        self,
+        multiple: bool = False,
+        eager: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        **kwargs,
+    ):
         """Find spirits by their spectral signatures! 🔍
 
         Args:
             multiple: Want one ghost or a whole haunted house? 🏚️
+            eager: Load the serialization plan relations up front
+            fields: Only load these columns (partial rows skip the cache)
             **kwargs: The dark specifications for our search
         """
-        query = self.model.query.filter_by(**kwargs)
-        return query.all() if multiple else query.first()
+        if eager or fields is not None:
+            query = self._query(eager, fields=fields).filter_by(**kwargs)
+            return query.all() if multiple else query.first()
+
+        def run():
+            query = self.model.query.filter_by(**kwargs)
+            return query.all() if multiple else query.first()
+
+        return self._cached("many" if multiple else "one", kwargs, run)
+
+    @log_me(component="persistence")
+    def get_where(
+        self,
+        *conditions,
+        eager: bool = False,
+        order_by: Sequence = (),
+        limit: Optional[int] = None,
+        options: Sequence = (),
+        fields: Optional[Sequence[str]] = None,
+    ) -> List:
+        """Find spirits matching SQL expressions! 🔍
+
+        Expressions cannot be keyed reliably, so this path skips the
+        query cache.
+        """
+        query = self._query(eager, options, fields).filter(*conditions)
+        if order_by:
+            query = query.order_by(*order_by)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @log_me(component="persistence")
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        eager: bool = False,
+        where: Sequence = (),
+        options: Sequence = (),
+        fields: Optional[Sequence[str]] = None,
+        **kwargs,
+    ) -> Page:
+        """Summon spirits one page at a time, keyset style! 📜
+
+        Args:
+            limit: How many ghosts fit on one page
+            cursor: Opaque bookmark returned with the previous page
+            eager: Load the serialization plan relations up front
+            where: Extra SQL expressions the spirits must match
+            options: Extra SQLAlchemy loader options
+            fields: Only load these columns
+            **kwargs: The dark specifications for our search
+        """
+        model = self.model
+        query = (
+            self._query(eager, options, fields)
+            .filter_by(**kwargs)
+            .filter(*where)
+        )
+        if cursor:
+            created_at, last_id = decode_cursor(cursor)
+            query = query.filter(
+                or_(
+                    model.created_at > created_at,
+                    and_(model.created_at == created_at, model.id > last_id),
+                )
+            )
+        rows: List = (
+            query.order_by(model.created_at, model.id).limit(limit + 1).all()
+        )
+        if len(rows) > limit:
+            return Page(rows[:limit], encode_cursor(rows[limit - 1]))
+        return Page(rows)
+
+    @log_me(component="persistence")
+    def stream(
+        self,
+        fields: Sequence[str],
+        chunk_size: Optional[int] = None,
+        where: Sequence = (),
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream plain rows, one chunk at a time, whatever the table size! 🌊
+
+        Rows are read through a server-side cursor (``yield_per``) as
+        plain column values: no entity ever reaches the identity map, so
+        memory stays flat.
+
+        Args:
+            fields: The columns to read
+            chunk_size: Rows fetched per round trip
+            where: SQL expressions the rows must match
+        """
+        size = self._chunk_size(chunk_size)
+        table = self.model.__table__
+        statement = (
+            select(*(table.c[name] for name in fields))
+            .where(*where)
+            .order_by(table.c.created_at, table.c.id)
+            .execution_options(yield_per=size)
+        )
+        result = db.session.execute(statement)
+        try:
+            for rows in result.partitions():
+                yield [dict(row._mapping) for row in rows]
+        finally:
+            result.close()  # Client gone mid-stream: free the cursor
+
+    @staticmethod
+    def _chunk_size(chunk_size: Optional[int]) -> int:
+        """How many spirits per transaction? 📦"""
+        size = chunk_size or current_app.config.get("BULK_CHUNK_SIZE", 500)
+        if size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return size
+
+    @staticmethod
+    def _commit_chunk(chunk: List):
+        """Insert a chunk in one transaction (executemany batches)! 💾"""
+        try:
+            db.session.add_all(chunk)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+    @log_me(component="persistence")
+    def add_many(self, objs: List, chunk_size: Optional[int] = None):
+        """Summon a whole horde of spirits, one commit per chunk! 👻
+
+        Stops at the first failing chunk; earlier chunks stay committed.
+        """
+        size = self._chunk_size(chunk_size)
+        for start in range(0, len(objs), size):
+            end = start + size
+            try:
+                self._commit_chunk(objs[start:end])
+            except Exception as e:
+                raise ValueError(
+                    f"Failed to save chunk starting at row {start}: {str(e)}"
+                )
+
+    @log_me(component="persistence")
+    def save_many(
+        self, objs: List, chunk_size: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """Save a horde of spirits, reporting the cursed ones! 💾
+
+        Each chunk is committed at once. When a chunk fails, its rows are
+        retried one by one so that only the faulty ones are left out.
+
+        Returns:
+            One error message per object, None when it was saved
+        """
+        size = self._chunk_size(chunk_size)
+        errors: List[Optional[str]] = [None] * len(objs)
+        for start in range(0, len(objs), size):
+            end = start + size
+            chunk = objs[start:end]
+            try:
+                self._commit_chunk(chunk)
+                continue
+            except Exception:
+                pass
+
+            # On isole les lignes maudites
+            for offset, obj in enumerate(chunk):
+                try:
+                    self._commit_chunk([obj])
+                except Exception as e:
+                    errors[start + offset] = self._row_error(obj, e)
+        return errors
+
+    @staticmethod
+    def _row_error(obj, error: Exception) -> str:
+        """A message fit for clients; the raw error stays in our logs! 🤐
+
+        Database errors carry the SQL and its bound parameters, so only
+        validation messages (ValueError) are passed on as they are.
+        """
+        if isinstance(error, ValueError):
+            return f"Failed to save: {str(error)}"
+        haunted_logger.loggers["persistence"].error(
+            "💀 Row of %s rejected: %s",
+            type(obj).__name__,
+            error,
+            extra={
+                "function_name": "save_many",
+                "module_name": __name__,
+                "user_id": getattr(g, "user_id", "anonymous"),
+                "request_id": getattr(g, "request_id", "-"),
+            },
+        )
+        if isinstance(error, IntegrityError):
+            return "Failed to save: constraint violated"
+        if isinstance(error, SQLAlchemyError):
+            return "Failed to save: database error"
+        return "Failed to save: unexpected error"
 
     @log_me(component="persistence")
     def save(self, obj):
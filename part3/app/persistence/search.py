@@ -0,0 +1,185 @@
+"""Full-text search over our haunted places! 🔍
+
+On SQLite, an FTS5 index (``place_fts``) mirrors the searchable place
+columns. Triggers keep it in step with every write, ORM or not, and
+results are ranked with BM25. Other databases fall back to LIKE
+matching, unranked.
+"""
+
+import base64
+import json
+import re
+from typing import List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import DDL, and_, column, event, literal_column, or_, table
+from sqlalchemy import text as sql_text
+
+from app import db
+from app.utils import log_me
+
+COLUMNS = ("name", "description", "city", "country")
+# BM25 weight of each column, in COLUMNS order: names matter most
+WEIGHTS = (10.0, 1.0, 3.0, 3.0)
+SNIPPET_TOKENS = 12
+
+place_fts = table("place_fts", column("rowid"))
+
+_FIELDS = ", ".join(COLUMNS)
+_NEW = ", ".join(f"new.{name}" for name in COLUMNS)
+_OLD = ", ".join(f"old.{name}" for name in COLUMNS)
+_UNINDEX = (
+    f"INSERT INTO place_fts(place_fts, rowid, {_FIELDS}) "
+    f"VALUES ('delete', old.rowid, {_OLD});"
+)
+_INDEX = f"INSERT INTO place_fts(rowid, {_FIELDS}) VALUES (new.rowid, {_NEW});"
+
+STATEMENTS = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS place_fts USING fts5({_FIELDS}, "
+    "content='place', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS place_fts_insert AFTER INSERT ON place "
+    f"BEGIN {_INDEX} END",
+    "CREATE TRIGGER IF NOT EXISTS place_fts_delete AFTER DELETE ON place "
+    f"BEGIN {_UNINDEX} END",
+    f"CREATE TRIGGER IF NOT EXISTS place_fts_update AFTER UPDATE OF {_FIELDS} "
+    f"ON place BEGIN {_UNINDEX} {_INDEX} END",
+)
+
+
+class SearchHit(NamedTuple):
+    """A place found by a search, with its rank and matching excerpt! 🎯"""
+
+    place: object
+    score: float
+    snippet: str
+
+
+def install(place_table) -> None:
+    """Create the FTS5 index along with the place table (SQLite only)! 🏗️"""
+    for statement in STATEMENTS:
+        event.listen(
+            place_table,
+            "after_create",
+            DDL(statement).execute_if(dialect="sqlite"),
+        )
+    event.listen(
+        place_table,
+        "before_drop",
+        DDL("DROP TABLE IF EXISTS place_fts").execute_if(dialect="sqlite"),
+    )
+
+
+def available() -> bool:
+    """Can this database rank with FTS5? 🤔"""
+    return db.engine.dialect.name == "sqlite"
+
+
+def terms(query: str) -> List[str]:
+    """Split a user query into plain words! ✂️"""
+    words = re.findall(r"\w+", query or "")
+    if not words:
+        raise ValueError("Search query must contain at least one word")
+    return words
+
+
+def match_expression(query: str) -> str:
+    """Turn a user query into a safe FTS5 MATCH expression! 🔮
+
+    Every word is quoted, so FTS5 operators typed by users are matched
+    literally, and the last one also matches as a prefix.
+    """
+    quoted = [f'"{word}"' for word in terms(query)]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def encode_offset(offset: int) -> str:
+    """Seal a search position into an opaque cursor! 🔒"""
+    payload = json.dumps({"offset": offset}).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_offset(cursor: Optional[str]) -> int:
+    """Break the seal of a search cursor! 🔓"""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        offset = int(json.loads(base64.urlsafe_b64decode(padded))["offset"])
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid pagination cursor! 🔮")
+    if offset < 0:
+        raise ValueError("Invalid pagination cursor! 🔮")
+    return offset
+
+
+@log_me(component="persistence")
+def search_places(
+    query: str,
+    conditions: Sequence = (),
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[SearchHit]:
+    """Find places matching a text query, best matches first! 🔍
+
+    Args:
+        query: What the user typed
+        conditions: Extra SQL filters on the place table
+        limit: How many hits to return (all when None)
+        offset: How many hits to skip
+    """
+    from app.models.place import Place
+
+    if not available():
+        return _like_search(Place, query, conditions, limit, offset)
+
+    weights = ", ".join(str(weight) for weight in WEIGHTS)
+    score = literal_column(f"bm25(place_fts, {weights})")
+    snippet = literal_column(
+        "snippet(place_fts, -1, '<mark>', '</mark>', '…', "
+        f"{SNIPPET_TOKENS})"
+    )
+    rows = (
+        db.session.query(Place, score, snippet)
+        .join(place_fts, place_fts.c.rowid == literal_column("place.rowid"))
+        .filter(
+            sql_text("place_fts MATCH :match").bindparams(
+                match=match_expression(query)
+            ),
+            *conditions,
+        )
+        .order_by(score, Place.id)
+        .offset(offset)
+        .limit(limit)
+    )
+    return [SearchHit(place, score, text) for place, score, text in rows]
+
+
+def _like_search(Place, query, conditions, limit, offset):
+    """Unranked fallback for databases without FTS5! 🐢"""
+    words = [
+        or_(*(getattr(Place, name).ilike(f"%{word}%") for name in COLUMNS))
+        for word in terms(query)
+    ]
+    places = Place.find_where(
+        and_(*words),
+        *conditions,
+        order_by=(Place.created_at, Place.id),
+    )
+    end = None if limit is None else offset + limit
+    return [
+        SearchHit(place, 0.0, (place.description or "")[:120])
+        for place in places[offset:end]
+    ]
+
+
+@log_me(component="persistence")
+def rebuild() -> None:
+    """Recreate the FTS5 index from the place table! 🔧"""
+    if not available():
+        return
+    for statement in STATEMENTS:
+        db.session.execute(sql_text(statement))
+    db.session.execute(
+        sql_text("INSERT INTO place_fts(place_fts) VALUES ('rebuild')")
+    )
+    db.session.commit()
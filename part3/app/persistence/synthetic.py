@@ -0,0 +1,237 @@
+"""Synthetic haunted data, deterministic and realistically skewed! 🎲"""
+
+import math
+import random
+import uuid
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Tuple
+
+from app.models.amenity import AmenityCategory
+from app.models.place import PropertyType
+
+# Every timestamp is drawn from the two years before this fixed date
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SPAN = timedelta(days=730).total_seconds()
+
+# Hotspots: (latitude, longitude, spread in degrees, weight)
+CLUSTERS = (
+    (48.8566, 2.3522, 0.08, 10),  # Paris
+    (51.5074, -0.1278, 0.10, 9),  # London
+    (40.7128, -74.0060, 0.12, 8),  # New York
+    (29.9511, -90.0715, 0.05, 6),  # New Orleans
+    (42.5195, -70.8967, 0.03, 4),  # Salem
+    (55.9533, -3.1883, 0.04, 4),  # Edinburgh
+    (50.0755, 14.4378, 0.05, 4),  # Prague
+    (45.7640, 4.8357, 0.05, 3),  # Lyon
+    (35.6762, 139.6503, 0.15, 5),  # Tokyo
+    (-33.8688, 151.2093, 0.10, 3),  # Sydney
+)
+# fmt: off
+FIRST_NAMES = (
+    "Casper", "Morticia", "Vlad", "Elvira", "Boris", "Lenore", "Igor",
+    "Wednesday", "Edgar", "Carmilla", "Lucius", "Raven", "Damien", "Luna",
+)
+LAST_NAMES = (
+    "Blackwood", "Graves", "Ashford", "Crowley", "Hallow", "Mortimer",
+    "Nightshade", "Ravenscroft", "Thorne", "Vane", "Wraith", "Duskmere",
+)
+ADJECTIVES = (
+    "Haunted", "Cursed", "Forgotten", "Whispering", "Shadowy", "Creaking",
+    "Misty", "Eerie", "Silent", "Crooked", "Gloomy", "Spectral",
+)
+NOUNS = (
+    "Manor", "Crypt", "Cottage", "Tower", "Chapel", "Mill", "Asylum",
+    "Lighthouse", "Abbey", "Inn", "Villa", "Loft",
+)
+FEATURES = (
+    "Ectoplasm Shower", "Moaning Pipes", "Secret Passage", "Ouija Board",
+    "Candelabra", "Cobweb Canopy", "Crystal Ball", "Coffin Bed",
+    "Fog Machine", "Talking Portrait", "Bat Belfry", "Cauldron Kitchen",
+)
+# fmt: on
+REVIEWS = (
+    "The chains rattled all night, exactly as advertised!",
+    "Cozy, but the portrait kept following me around.",
+    "Cold spots everywhere, great for a summer stay.",
+    "Our host was very discreet, we never saw them.",
+    "Lovely view of the cemetery from the bedroom.",
+    "Some doors opened on their own. Ten out of ten.",
+)
+# Ratings lean positive, as on every booking site
+RATING_WEIGHTS = (3, 5, 12, 35, 45)
+PROPERTY_WEIGHTS = (5, 8, 2)
+
+
+@dataclass
+class Shape:
+    """How much data to summon, and from which seed! 📐"""
+
+    users: int
+    places: int
+    reviews_per_place: float
+    amenities: int
+    seed: int = 0
+    # Exponent of the power laws (1.0 is classic Zipf)
+    skew: float = 1.1
+
+
+def _rng(shape: Shape, kind: str) -> random.Random:
+    """One generator per kind: a table never shifts another one! 🎲"""
+    return random.Random(f"{shape.seed}:{kind}")
+
+
+def entity_id(shape: Shape, kind: str, index: int) -> str:
+    """The id of the n-th entity of a kind, the same on every run! 🔑"""
+    return str(
+        uuid.uuid5(uuid.NAMESPACE_URL, f"hbnb:{shape.seed}:{kind}:{index}")
+    )
+
+
+def _stamp(rng: random.Random) -> str:
+    """A creation date within the two years before EPOCH! 📅"""
+    return (EPOCH - timedelta(seconds=rng.random() * SPAN)).isoformat()
+
+
+def _zipf_weights(count: int, skew: float) -> List[float]:
+    """Power-law weights: rank r weighs 1 / r^skew! 📉"""
+    return [1.0 / (rank**skew) for rank in range(1, count + 1)]
+
+
+def users(shape: Shape, password_hash: str) -> Iterator[Tuple[int, dict]]:
+    """Stream user rows; they all share one password hash! 👻"""
+    rng = _rng(shape, "users")
+    for i in range(shape.users):
+        yield i + 1, {
+            "id": entity_id(shape, "users", i),
+            "username": f"ghost_{shape.seed}_{i}",
+            "email": f"ghost{i}.{shape.seed}@haunted.test",
+            "password_hash": password_hash,
+            "first_name": rng.choice(FIRST_NAMES),
+            "last_name": rng.choice(LAST_NAMES),
+            "created_at": _stamp(rng),
+        }
+
+
+def amenities(shape: Shape) -> Iterator[Tuple[int, dict]]:
+    """Stream amenity rows, numbered past the feature list! 🎭"""
+    rng = _rng(shape, "amenities")
+    categories = [c.value for c in AmenityCategory if c.value != "blocked"]
+    for i in range(shape.amenities):
+        feature = FEATURES[i % len(FEATURES)]
+        lap = i // len(FEATURES)
+        yield i + 1, {
+            "id": entity_id(shape, "amenities", i),
+            "name": f"{feature} {shape.seed}-{lap}",
+            "description": f"A {feature.lower()} for discerning spirits",
+            "category": rng.choice(categories),
+        }
+
+
+def owners(shape: Shape) -> array:
+    """Owner index of every place: a few hosts own most places! 🏘️
+
+    Hosts are drawn with power-law weights over a shuffled user order.
+    """
+    rng = _rng(shape, "owners")
+    hosts = list(range(shape.users))
+    rng.shuffle(hosts)
+    weights = _zipf_weights(shape.users, shape.skew)
+    return array("l", rng.choices(hosts, weights, k=shape.places))
+
+
+def places(shape: Shape, owner_of: array) -> Iterator[Tuple[int, dict]]:
+    """Stream place rows around a few hotspots, with skewed prices! 🏰
+
+    Coordinates are gaussian around weighted city centres, and nightly
+    prices follow a log-normal law (median 120, long tail of palaces).
+    """
+    rng = _rng(shape, "places")
+    cluster_weights = [cluster[3] for cluster in CLUSTERS]
+    types = [t.value for t in PropertyType]
+    for i in range(shape.places):
+        lat, lon, spread, _ = rng.choices(CLUSTERS, cluster_weights)[0]
+        guests = min(12, 1 + int(rng.expovariate(0.35)))
+        yield i + 1, {
+            "id": entity_id(shape, "places", i),
+            "name": f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {i}",
+            "description": "A generated haunted place, perfect for tests",
+            "owner_id": entity_id(shape, "users", owner_of[i]),
+            "price_by_night": round(
+                max(10.0, rng.lognormvariate(math.log(120), 0.6)), 2
+            ),
+            "latitude": round(max(-90, min(90, rng.gauss(lat, spread))), 6),
+            "longitude": round(max(-180, min(180, rng.gauss(lon, spread))), 6),
+            "max_guest": guests,
+            "number_rooms": max(1, (guests + 1) // 2),
+            "number_bathrooms": max(1, guests // 4),
+            "property_type": rng.choices(types, PROPERTY_WEIGHTS)[0],
+            "created_at": _stamp(rng),
+        }
+
+
+def review_counts(shape: Shape) -> array:
+    """Reviews per place: Zipfian, averaging reviews_per_place! 📊
+
+    Popularity ranks are shuffled over the places; nobody can review
+    the same place twice, nor their own.
+    """
+    rng = _rng(shape, "popularity")
+    ranks = list(range(shape.places))
+    rng.shuffle(ranks)
+    weights = _zipf_weights(shape.places, shape.skew)
+    total = shape.places * shape.reviews_per_place
+    scale = total / sum(weights) if weights else 0
+    ceiling = max(0, shape.users - 1)
+    counts = array("l")
+    for rank in ranks:
+        # Arrondi aléatoire : la longue traîne garde sa part
+        expected = weights[rank] * scale
+        whole = int(expected)
+        counts.append(min(ceiling, whole + (rng.random() < expected - whole)))
+    return counts
+
+
+def reviews(
+    shape: Shape, owner_of: array, counts: array
+) -> Iterator[Tuple[int, dict]]:
+    """Stream review rows, with ratings leaning positive! ⭐"""
+    rng = _rng(shape, "reviews")
+    ratings = [str(r) for r in range(1, 6)]
+    number = 0
+    for i, count in enumerate(counts):
+        if not count:
+            continue
+        owner = owner_of[i]
+        authors = [
+            u for u in rng.sample(range(shape.users), count + 1) if u != owner
+        ][:count]
+        for author in authors:
+            number += 1
+            yield number, {
+                "id": entity_id(shape, "reviews", number),
+                "place_id": entity_id(shape, "places", i),
+                "user_id": entity_id(shape, "users", author),
+                "text": rng.choice(REVIEWS),
+                "rating": rng.choices(ratings, RATING_WEIGHTS)[0],
+                "created_at": _stamp(rng),
+            }
+
+
+def links(shape: Shape) -> Iterator[Tuple[int, dict]]:
+    """Stream place-amenity links: popular amenities are everywhere! 🔗"""
+    if not shape.amenities:
+        return
+    rng = _rng(shape, "links")
+    weights = _zipf_weights(shape.amenities, shape.skew)
+    number = 0
+    for i in range(shape.places):
+        wanted = min(shape.amenities, int(rng.expovariate(0.3)))
+        chosen = set(rng.choices(range(shape.amenities), weights, k=wanted))
+        for amenity in sorted(chosen):
+            number += 1
+            yield number, {
+                "place_id": entity_id(shape, "places", i),
+                "amenity_id": entity_id(shape, "amenities", amenity),
+            }
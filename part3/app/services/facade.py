@@ -1,6 +1,6 @@
 """The haunted gateway to our supernatural kingdom! 👻"""
 
-from typing import List, Type, TypeVar, Union
+from typing import List, Optional, Sequence, Type, TypeVar, Union
 
 from app.models import *  # On importe tous nos modèles d'un coup !
 from app.models.basemodel import BaseModel
@@ -43,14 +43,67 @@ class HBnBFacade:
             raise ValueError(f"Failed to create: {str(e)}")
 
     @log_me(component="business")
-    def get(self, model_class: Type[T], id: str) -> T:
+    def create_many(
+        self,
+        model_class: Type[T],
+        rows: List[dict],
+        chunk_size: Optional[int] = None,
+    ) -> List[dict]:
+        """Create a horde of haunted entities at once! ✨✨
+
+        Every row goes through the model validators first; the valid ones
+        are then inserted in chunked transactions. A faulty row never
+        aborts the others.
+
+        Returns:
+            One status per row, in order: ``{"index", "status": "created",
+            "item"}`` or ``{"index", "status": "error", "message"}``
+        """
+        if not issubclass(model_class, BaseModel):
+            raise ValueError("Invalid model class")
+        if not isinstance(rows, list):
+            raise ValueError("Rows must be a list")
+
+        results: List[dict] = [None] * len(rows)
+        instances, positions = [], []
+        for index, row in enumerate(rows):
+            try:
+                if not row or not isinstance(row, dict):
+                    raise ValueError("No data provided for creation")
+                instances.append(model_class(**row))
+                positions.append(index)
+            except Exception as e:
+                results[index] = {
+                    "index": index,
+                    "status": "error",
+                    "message": f"Failed to create: {str(e)}",
+                }
+
+        errors = model_class.save_many(instances, chunk_size=chunk_size)
+        for index, instance, error in zip(positions, instances, errors):
+            if error:
+                results[index] = {
+                    "index": index,
+                    "status": "error",
+                    "message": f"Failed to create: {error}",
+                }
+            else:
+                results[index] = {
+                    "index": index,
+                    "status": "created",
+                    "item": instance,
+                }
+        return results
+
+    @log_me(component="business")
+    def get(self, model_class: Type[T], id: str, eager: bool = False) -> T:
         """Find an entity by its spectral ID! 🔍"""
         if not id:
             raise ValueError("No ID provided")
         if not issubclass(model_class, BaseModel):
             raise ValueError("Invalid model class")
 
-        instance = model_class.get_by_id(id)
+        instance = model_class.get_by_id(id, eager=eager)
         if not instance:
             raise ValueError(f"{model_class.__name__} not found with ID: {id}")
         return instance
@@ -100,18 +153,41 @@ class HBnBFacade:
         return instance.hard_delete() if hard else instance.delete()
 
     @log_me(component="business")
-    def find(self, model_class: Type[T], **criteria) -> List[T]:
-        """Search for entities in our realm! 🔮"""
+    def find(
+        self,
+        model_class: Type[T],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        eager: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        **criteria,
+    ) -> List[T]:
+        """Search for entities in our realm! 🔮
+
+        With a ``limit`` the result is a ``Page`` whose ``next_cursor``
+        summons the following page. With ``eager`` the relations of the
+        model serialization plan are loaded in a fixed number of queries.
+        With ``fields`` only those columns are loaded, and no relation.
+        """
         if not issubclass(model_class, BaseModel):
             raise ValueError("Invalid model class")
 
+        if limit is not None or cursor is not None:
+            if limit is None or limit < 1:
+                raise ValueError("limit must be a positive integer")
+            return model_class.find_page(
+                limit, cursor=cursor, eager=eager, fields=fields, **criteria
+            )
+
         # Si pas de critères, on retourne tout
         if not criteria:
             # Debug print
-            return model_class.get_all()
+            return model_class.get_all(eager=eager, fields=fields)
 
         # Sinon on cherche avec les critères
-        return model_class.find_by(multiple=True, **criteria)
+        return model_class.find_by(
+            multiple=True, eager=eager, fields=fields, **criteria
+        )
 
     @log_me(component="business")
     def link_place_amenity(
@@ -1,14 +1,26 @@
 # app/utils/__init__.py
 """Utility functions and decorators for our haunted app! 👻"""
 
-from app.utils.auth import admin_only, auth_required, owner_only, user_only
+from app.utils.auth import (
+    admin_only,
+    auth_required,
+    owner_only,
+    signed_in,
+    user_only,
+)
 from app.utils.haunted_logger import haunted_logger, log_me
+from app.utils.metrics import haunted_metrics
+from app.utils.serializer import HauntedSerializer, serialize
 
 __all__ = [
     "auth_required",
     "admin_only",
     "owner_only",
+    "signed_in",
     "user_only",
     "haunted_logger",
     "log_me",
+    "haunted_metrics",
+    "HauntedSerializer",
+    "serialize",
 ]
@@ -81,6 +81,16 @@ def auth_required(check_property: bool = False, admin_only: bool = False):
     return actual_decorator
 
 
+def signed_in() -> bool:
+    """Is an active ghost behind this request? Never refuses anyone! 🔑"""
+    try:
+        verify_jwt_in_request(optional=True)
+        claims = get_jwt()
+    except Exception:
+        return False  # Jeton absent, expiré ou maudit : visiteur anonyme
+    return bool(claims.get("is_active") and claims.get("user_id"))
+
+
 # Alias pratiques
 user_only = auth_required()  # Authentification simple
 admin_only = auth_required(admin_only=True)  # Vérification admin
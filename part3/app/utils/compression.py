@@ -0,0 +1,91 @@
+"""Negotiated response compression: fewer bytes through the veil! 🗜️"""
+
+import gzip
+from typing import Callable, Dict
+
+from flask import Flask, request
+
+try:
+    import brotli
+except ImportError:  # Optional codec
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional codec
+    zstandard = None
+
+# Only text compresses well; images and archives already are compressed
+COMPRESSIBLE = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def codecs(level: int = 6) -> Dict[str, Callable[[bytes], bytes]]:
+    """The codecs this process can speak, best ratio first! 📚"""
+    available = {}
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=3)
+        available["zstd"] = compressor.compress
+    if brotli is not None:
+        available["br"] = lambda data: brotli.compress(data, quality=4)
+    available["gzip"] = lambda data: gzip.compress(data, level, mtime=0)
+    return available
+
+
+def _compressible(response, min_size: int) -> bool:
+    """Is this response worth squeezing? 🤔"""
+    if response.status_code < 200 or response.status_code in (204, 304):
+        return False
+    if response.direct_passthrough or response.is_streamed:
+        return False
+    if "Content-Encoding" in response.headers:
+        return False
+    mimetype = response.mimetype or ""
+    if not (mimetype.startswith("text/") or mimetype in COMPRESSIBLE):
+        return False
+    return (response.content_length or 0) >= min_size
+
+
+def init_compression(app: Flask) -> None:
+    """Compress the responses of an app, per Accept-Encoding! 🗜️
+
+    The codec is the client's favourite among ``COMPRESS_ALGORITHMS``,
+    ties going to the server order. Bodies under ``COMPRESS_MIN_SIZE``
+    bytes are left alone: the headers would cost more than the savings.
+    """
+    if not app.config.get("COMPRESS_ENABLED", True):
+        return
+    available = codecs(app.config.get("COMPRESS_LEVEL", 6))
+    preferred = [
+        name
+        for name in app.config.get(
+            "COMPRESS_ALGORITHMS", ("zstd", "br", "gzip")
+        )
+        if name in available
+    ]
+    min_size = app.config.get("COMPRESS_MIN_SIZE", 500)
+
+    @app.after_request
+    def compress(response):
+        """Squeeze the response on its way out! 🗜️"""
+        if not preferred:
+            return response
+        response.vary.add("Accept-Encoding")
+        if not _compressible(response, min_size):
+            return response
+
+        encoding = request.accept_encodings.best_match(preferred)
+        if encoding is None:
+            return response
+
+        response.set_data(available[encoding](response.get_data()))
+        response.headers["Content-Encoding"] = encoding
+        # Other bytes, same content: the tag can only stay weak (RFC 9110)
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
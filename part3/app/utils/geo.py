@@ -0,0 +1,132 @@
+"""Geohash helpers: mapping our haunted realm cell by cell! 🗺️"""
+
+from math import asin, cos, radians, sin, sqrt
+from typing import Iterator, List, Optional, Tuple
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.195  # One degree of latitude, on average
+
+# Stored precision: ~5 m cells, sharp enough to find any front door
+PRECISION = 9
+
+
+def encode(lat: float, lon: float, precision: int = PRECISION) -> str:
+    """Turn coordinates into a geohash! 🔮
+
+    Bits alternate between longitude and latitude, each one halving
+    the remaining range, and every 5 bits make one base32 character.
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+    while len(chars) < precision:
+        bounds_, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (bounds_[0] + bounds_[1]) / 2
+        if value >= mid:
+            bits = bits * 2 + 1
+            bounds_[0] = mid
+        else:
+            bits = bits * 2
+            bounds_[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """Get the (lat_min, lat_max, lon_min, lon_max) box of a cell! 📦"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        bits = BASE32.index(char)
+        for shift in range(4, -1, -1):
+            bounds_ = lon_range if even else lat_range
+            mid = (bounds_[0] + bounds_[1]) / 2
+            if bits >> shift & 1:
+                bounds_[0] = mid
+            else:
+                bounds_[1] = mid
+            even = not even
+    return lat_range[0], lat_range[1], lon_range[0], lon_range[1]
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """Height and width, in degrees, of the cells at a precision! 📏"""
+    bits = 5 * precision
+    return 180.0 / 2 ** (bits // 2), 360.0 / 2 ** ((bits + 1) // 2)
+
+
+def neighbours(geohash: str) -> List[str]:
+    """The (up to) 8 cells around a cell, wrapping at the antimeridian! 🧭"""
+    lat_min, lat_max, lon_min, lon_max = bounds(geohash)
+    height, width = lat_max - lat_min, lon_max - lon_min
+    lat, lon = (lat_min + lat_max) / 2, (lon_min + lon_max) / 2
+    cells = []
+    for dlat in (-1, 0, 1):
+        for dlon in (-1, 0, 1):
+            n_lat = lat + dlat * height
+            if (dlat, dlon) == (0, 0) or not -90 < n_lat < 90:
+                continue
+            n_lon = (lon + dlon * width + 180) % 360 - 180
+            cell = encode(n_lat, n_lon, len(geohash))
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points, in kilometers! 📐"""
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = (
+        sin(dlat / 2) ** 2
+        + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+def safe_radius(lat: float, precision: int) -> float:
+    """Radius, in km, always held by the 3x3 block around a point! 🛡️
+
+    Any point of the center cell is at least one cell height and one
+    cell width away from the edge of the block. Cells get narrower
+    towards the poles, so the width is measured on the worst edge.
+    """
+    height, width = cell_size(precision)
+    height_km = height * KM_PER_DEGREE
+    radius = min(height_km, width * KM_PER_DEGREE * cos(radians(abs(lat))))
+    edge = min(90.0, abs(lat) + radius / KM_PER_DEGREE)
+    return max(
+        0.0, min(height_km, width * KM_PER_DEGREE * cos(radians(edge)))
+    )
+
+
+def rings(lat: float, lon: float) -> Iterator[Tuple[List[str], float]]:
+    """Expand search blocks around a point, from fine to coarse! 🌀
+
+    Yields:
+        The cells of each block, with the radius it is sure to cover
+    """
+    for precision in range(PRECISION, 0, -1):
+        center = encode(lat, lon, precision)
+        yield [center] + neighbours(center), safe_radius(lat, precision)
+
+
+def cover(lat: float, lon: float, radius_km: float) -> Optional[List[str]]:
+    """Find the cells holding every point within a radius! 🕸️
+
+    Returns:
+        The geohash prefixes of the finest block covering the circle, or
+        None when the circle is too large (or too close to a pole) to be
+        covered this way
+    """
+    for precision in range(PRECISION, 0, -1):
+        if safe_radius(lat, precision) >= radius_km:
+            center = encode(lat, lon, precision)
+            return [center] + neighbours(center)
+    return None
@@ -1,14 +1,33 @@
 """Spooky spells module for our haunted logging system! 👻."""
 
+import atexit
 import logging
 import os  # noqa: F401
+import queue
+import random
 from datetime import datetime  # noqa: F401
 from functools import wraps
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from time import perf_counter
+from typing import Dict, Optional
 
 from flask import g, request  # noqa: F401
 
+from app.utils.metrics import haunted_metrics
+
+
+class LazyRepr:
+    """Render call arguments only when a record is really written! 💤."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return str(self.value)
+
 
 class HauntedLogger:
     """Notre système de logging hanté amélioré ! 👻."""
@@ -17,14 +36,32 @@ class HauntedLogger:
         "DEBUG": logging.DEBUG,
         "INFO": logging.INFO,
         "ERROR": logging.ERROR,
+        "OFF": logging.CRITICAL + 10,
     }
+    COMPONENTS = ["api", "business", "persistence"]
 
     def __init__(self):
         """Opening the book of spells! 📖."""
+        self.listeners = []
         self.setup_logging()
+        atexit.register(self.stop)
+
+    def setup_logging(
+        self,
+        async_mode: bool = False,
+        levels: Optional[Dict[str, str]] = None,
+        sampling: Optional[Dict[str, float]] = None,
+    ):
+        """Logging configuration.
+
+        With ``async_mode`` each component logger only pushes records on a
+        queue; a background QueueListener thread owns the file handlers, so
+        request threads never wait on the disk. ``levels`` and ``sampling``
+        are handed to ``configure``.
+        """
+        # On arrête les anciens listeners avant de tout reconfigurer
+        self.stop()
 
-    def setup_logging(self):
-        """Logging configuration."""
         # Nettoyage des handlers existants
         for logger in logging.root.manager.loggerDict.values():
             if isinstance(logger, logging.Logger):
@@ -34,14 +71,53 @@ class HauntedLogger:
         logging.basicConfig(level=logging.DEBUG)
 
         # Configuration des loggers par composant
+        self.levels = dict.fromkeys(self.COMPONENTS, logging.DEBUG)
+        self.sampling = {}
         self.loggers = {}
-        for component in ["api", "business", "persistence"]:
-            self.loggers[component] = self._setup_component_logger(component)
+        for component in self.COMPONENTS:
+            self.loggers[component] = self._setup_component_logger(
+                component, async_mode
+            )
+        self.configure(levels, sampling)
 
-    def _setup_component_logger(self, component: str):
+    def configure(
+        self,
+        levels: Optional[Dict[str, str]] = None,
+        sampling: Optional[Dict[str, float]] = None,
+    ):
+        """Tune how loud each component is, and how often we listen! 🎚️.
+
+        Args:
+            levels: Component name -> DEBUG, INFO, ERROR or OFF
+            sampling: Function qualname -> share of calls logged (0 to 1)
+        """
+        for component, level_name in (levels or {}).items():
+            if component not in self.COMPONENTS:
+                raise ValueError(f"Unknown log component: {component}")
+            level = self.LOG_LEVELS.get(str(level_name).upper())
+            if level is None:
+                raise ValueError(f"Unknown log level: {level_name}")
+            self.levels[component] = level
+            self.loggers[component].setLevel(level)
+
+        rates = {}
+        for name, rate in (sampling or {}).items():
+            rate = float(rate)
+            if not 0 <= rate <= 1:
+                raise ValueError(f"Sampling rate must be in [0, 1]: {name}")
+            rates[name] = rate
+        self.sampling = rates
+
+    def stop(self):
+        """Flush the queues and send the listener threads to rest! 🌙."""
+        for listener in self.listeners:
+            listener.stop()
+        self.listeners = []
+
+    def _setup_component_logger(self, component: str, async_mode: bool):
         """Setup specific logger for each componant."""
         logger = logging.getLogger(f"hbnb.{component}")
-        logger.setLevel(logging.DEBUG)
+        logger.setLevel(self.levels[component])
         logger.propagate = False  # Évite la duplication
 
         # Format commun
@@ -70,6 +146,7 @@ class HauntedLogger:
             "ERROR": (logging.ERROR, log_dir / "error.log"),
         }
 
+        file_handlers = []
         for level_name, (level, filepath) in handlers.items():
             handler = RotatingFileHandler(
                 filepath, maxBytes=1_048_576, backupCount=5
@@ -77,53 +154,115 @@ class HauntedLogger:
             handler.setFormatter(formatter)
             handler.addFilter(LevelFilter(level))  # Filtre strict par niveau
             handler.setLevel(level)
-            logger.addHandler(handler)
+            file_handlers.append(handler)
+
+        if not async_mode:
+            for handler in file_handlers:
+                logger.addHandler(handler)
+            return logger
+
+        # Le thread de la requête ne fait que déposer dans la file
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(
+            log_queue, *file_handlers, respect_handler_level=True
+        )
+        listener.start()
+        self.listeners.append(listener)
 
         return logger
 
     def log_me(self, component="api"):
-        """Décorateur de logging amélioré."""
+        """Décorateur de logging amélioré.
+
+        The component level and the function sampling rate are read from
+        two cached dictionaries on every call: a muted component costs a
+        single lookup before calling straight through. Calls, errors and
+        latency are recorded in ``haunted_metrics`` whatever the level.
+        """
 
         def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                logger = self.loggers[component]
+            name = getattr(func, "__qualname__", func.__name__)
 
-                # Contexte enrichi
-                extra = {
+            def _extra(args, kwargs):
+                # Contexte enrichi, les arguments ne sont rendus
+                # que si un record est vraiment écrit
+                return {
                     "function_name": func.__name__,
                     "module_name": func.__module__,
                     "user_id": getattr(g, "user_id", "anonymous"),
                     "request_id": getattr(g, "request_id", "-"),
-                    "call_args": str(args),
-                    "call_kwargs": str(kwargs),
+                    "call_args": LazyRepr(args),
+                    "call_kwargs": LazyRepr(kwargs),
                 }
 
+            def _log_error(logger, error, extra):
+                logger.error(
+                    "💀 Error in %s: %s | Args: %s",
+                    func.__name__,
+                    error,
+                    extra["call_args"],
+                    exc_info=True,
+                    extra=extra,
+                )
+
+            def logged(*args, **kwargs):
+                level = self.levels[component]
+                if level > logging.ERROR:
+                    return func(*args, **kwargs)
+
+                logger = self.loggers[component]
+                rate = self.sampling.get(name)
+                if level > logging.INFO or (
+                    rate is not None and random.random() >= rate
+                ):
+                    # Seules les erreurs méritent d'être écrites
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception as e:
+                        _log_error(logger, e, _extra(args, kwargs))
+                        raise
+
+                extra = _extra(args, kwargs)
                 try:
-                    logger.debug(
-                        f"🎭 Starting {func.__name__} | \
-                            Args: {extra['call_args']} | \
-                            Kwargs: {extra['call_kwargs']}",
-                        extra=extra,
-                    )
+                    if level <= logging.DEBUG:
+                        logger.debug(
+                            "🎭 Starting %s | Args: %s | Kwargs: %s",
+                            func.__name__,
+                            extra["call_args"],
+                            extra["call_kwargs"],
+                            extra=extra,
+                        )
 
                     result = func(*args, **kwargs)
 
                     logger.info(
-                        f"✨ {func.__name__} completed | \
-                            Result type: {type(result)}",
+                        "✨ %s completed | Result type: %s",
+                        func.__name__,
+                        type(result),
                         extra=extra,
                     )
                     return result
 
                 except Exception as e:
-                    logger.error(
-                        f"💀 Error in {func.__name__}: {str(e)} | \
-                            Args: {extra['call_args']}",
-                        exc_info=True,
-                        extra=extra,
-                    )
+                    _log_error(logger, e, extra)
+                    raise
+
+            stats = haunted_metrics.stats(component, name)
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not haunted_metrics.enabled:
+                    return logged(*args, **kwargs)
+
+                start = perf_counter()
+                try:
+                    result = logged(*args, **kwargs)
+                except Exception:
+                    stats.observe(perf_counter() - start, error=True)
                     raise
+                stats.observe(perf_counter() - start)
+                return result
 
             return wrapper
 
@@ -0,0 +1,85 @@
+"""Fast JSON for our haunted payloads: orjson when we can, stdlib if not! ⚡"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up
+    orjson = None
+
+ENGINES = ("auto", "orjson", "json")
+
+
+def _default(obj: Any) -> Any:
+    """Teach the encoders our supernatural types! 🔮"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable"
+    )
+
+
+class HauntedJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, with a stdlib fallback! 🚀
+
+    Datetimes come out in ISO 8601, enums as their value, and entities
+    through ``to_dict``. The engine is picked by ``JSON_ENGINE``:
+    "orjson", "json", or "auto" for orjson whenever it is installed.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        engine = app.config.get("JSON_ENGINE", "auto")
+        if engine not in ENGINES:
+            raise ValueError(
+                f"JSON_ENGINE must be one of: {', '.join(ENGINES)}"
+            )
+        if engine == "orjson" and orjson is None:
+            raise ValueError(
+                "JSON_ENGINE is orjson, but orjson is not installed"
+            )
+        self.engine = (
+            "json" if orjson is None or engine == "json" else "orjson"
+        )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Encode a payload into a JSON string! ✍️"""
+        if self.engine == "orjson" and not kwargs:
+            try:
+                return orjson.dumps(
+                    obj, default=_default, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except TypeError:
+                pass  # Entiers géants et autres cas limites : stdlib
+        kwargs.setdefault("default", _default)
+        kwargs.setdefault("ensure_ascii", False)
+        kwargs.setdefault("separators", (",", ":"))
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Decode a JSON document! 📖"""
+        if self.engine == "orjson" and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Build a JSON response, as ``jsonify`` does! 📨"""
+        data = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            f"{self.dumps(data)}\n", mimetype="application/json"
+        )
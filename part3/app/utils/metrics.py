@@ -0,0 +1,152 @@
+"""In-process metrics for our haunted functions! 📊"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, Tuple
+
+# Latency bucket upper bounds, in seconds (Prometheus style)
+BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencyStats:
+    """Call count, error count and latency histogram of one function! ⏱️"""
+
+    __slots__ = ("calls", "errors", "total", "buckets", "lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # Last one is +Inf
+        self.lock = threading.Lock()
+
+    def observe(self, seconds: float, error: bool = False):
+        """Record one call! ✍️"""
+        index = bisect_left(BUCKETS, seconds)
+        with self.lock:
+            self.calls += 1
+            self.errors += error
+            self.total += seconds
+            self.buckets[index] += 1
+
+    def snapshot(self) -> Tuple[int, int, float, list]:
+        """Copy the counters without holding the lock for long! 📸"""
+        with self.lock:
+            return self.calls, self.errors, self.total, list(self.buckets)
+
+
+def quantile(buckets: list, calls: int, q: float) -> float:
+    """Estimate a latency quantile from the histogram buckets! 🎯"""
+    if not calls:
+        return 0.0
+    target, seen = q * calls, 0
+    for bound, count in zip(BUCKETS, buckets):
+        seen += count
+        if seen >= target:
+            return bound
+    return float("inf")
+
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value! 🏷️"""
+    return (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+class HauntedMetrics:
+    """Registry of LatencyStats, keyed by (component, function)! 📚
+
+    Each function gets its own stats object, created once when it is
+    decorated, so recording a call only contends on that function's lock.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self._stats: Dict[Tuple[str, str], LatencyStats] = {}
+
+    def stats(self, component: str, function: str) -> LatencyStats:
+        """Get or create the stats of a function! 🔍"""
+        key = (component, function)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats.setdefault(key, LatencyStats())
+        return stats
+
+    def reset(self):
+        """Forget everything we measured! 🧹"""
+        for stats in list(self._stats.values()):
+            with stats.lock:
+                stats.calls = stats.errors = 0
+                stats.total = 0.0
+                stats.buckets = [0] * (len(BUCKETS) + 1)
+
+    def render(self) -> str:
+        """Render the registry in Prometheus text format! 📜"""
+        calls_lines, errors_lines, hist_lines, quantile_lines = [], [], [], []
+        for (component, function), stats in sorted(self._stats.items()):
+            calls, errors, total, buckets = stats.snapshot()
+            if not calls:
+                continue
+            labels = (
+                f'component="{_label(component)}",'
+                f'function="{_label(function)}"'
+            )
+            calls_lines.append(f"hbnb_calls_total{{{labels}}} {calls}")
+            errors_lines.append(f"hbnb_errors_total{{{labels}}} {errors}")
+
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ("+Inf",), buckets):
+                cumulative += count
+                hist_lines.append(
+                    f'hbnb_latency_seconds_bucket{{{labels},le="{bound}"}} '
+                    f"{cumulative}"
+                )
+            hist_lines.append(f"hbnb_latency_seconds_sum{{{labels}}} {total}")
+            hist_lines.append(
+                f"hbnb_latency_seconds_count{{{labels}}} {calls}"
+            )
+
+            for q in QUANTILES:
+                quantile_lines.append(
+                    f'hbnb_latency_quantile_seconds{{{labels},quantile="{q}"}}'
+                    f" {quantile(buckets, calls, q)}"
+                )
+
+        return "\n".join(
+            [
+                "# HELP hbnb_calls_total Calls per decorated function.",
+                "# TYPE hbnb_calls_total counter",
+                *calls_lines,
+                "# HELP hbnb_errors_total Calls that raised an exception.",
+                "# TYPE hbnb_errors_total counter",
+                *errors_lines,
+                "# HELP hbnb_latency_seconds Call latency in seconds.",
+                "# TYPE hbnb_latency_seconds histogram",
+                *hist_lines,
+                "# HELP hbnb_latency_quantile_seconds "
+                "Latency p50/p95/p99 estimated from the histogram.",
+                "# TYPE hbnb_latency_quantile_seconds gauge",
+                *quantile_lines,
+            ]
+        ) + "\n"
+
+
+# Créer une instance globale
+haunted_metrics = HauntedMetrics()
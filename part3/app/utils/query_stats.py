@@ -0,0 +1,138 @@
+"""Per-request SQL accounting: how many spells did this request cast? 🧮"""
+
+import re
+import time
+from collections import Counter
+from typing import List, Tuple
+
+from flask import Flask, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.haunted_logger import haunted_logger
+
+STATS_KEY = "_db_stats"
+# Expanded IN lists: "IN (?, ?, ?)" and "IN (?)" share one shape
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+def shape(statement: str) -> str:
+    """The statement with its variable parts folded! 🧩
+
+    Values are already bound parameters, so only whitespace and the
+    length of IN lists tell two runs of the same query apart.
+    """
+    return _IN_LIST.sub("(?)", _SPACES.sub(" ", statement).strip())
+
+
+class RequestQueries:
+    """The statements of one request: count, time and shapes! 📊"""
+
+    __slots__ = ("count", "seconds", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        """Account for one statement! ✍️"""
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Shapes run at least ``threshold`` times: N+1 suspects! 🔁"""
+        counts = Counter()
+        for statement, times in self.shapes.items():
+            counts[shape(statement)] += times
+        return [
+            (statement, times)
+            for statement, times in counts.most_common()
+            if times >= threshold
+        ]
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start(conn, cursor, statement, parameters, context, executemany):
+    """Start the clock of a statement! ⏱️"""
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop(conn, cursor, statement, parameters, context, executemany):
+    """Stop the clock, and charge the running request! 🧾"""
+    clocks = conn.info.get("query_started")
+    if not clocks:
+        return  # Listener added mid-statement
+    started = clocks.pop()
+    if not has_request_context():
+        return
+    stats = g.get(STATS_KEY)
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+@event.listens_for(Engine, "handle_error")
+def _failed(context):
+    """A failed statement never reaches after_cursor_execute! 💀"""
+    connection = context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def init_query_stats(app: Flask) -> None:
+    """Count the statements and DB time of every request! 🧮
+
+    Responses carry ``X-DB-Queries`` and ``X-DB-Time`` (milliseconds)
+    when ``DB_STATS_HEADERS`` is on. A request going over
+    ``DB_QUERY_THRESHOLD`` statements or ``DB_TIME_THRESHOLD_MS``, or
+    running one statement shape ``DB_REPEAT_THRESHOLD`` times (an N+1
+    loop), is logged on the api logger. Statements run while a
+    streamed body is written come after the headers, so they are not
+    counted.
+    """
+    if not app.config.get("DB_STATS_ENABLED", True):
+        return
+    headers = app.config.get("DB_STATS_HEADERS", True)
+    max_queries = app.config.get("DB_QUERY_THRESHOLD", 25)
+    max_ms = app.config.get("DB_TIME_THRESHOLD_MS", 250.0)
+    max_repeats = app.config.get("DB_REPEAT_THRESHOLD", 5)
+
+    @app.before_request
+    def open_ledger():
+        """A fresh ledger for each request! 📒"""
+        setattr(g, STATS_KEY, RequestQueries())
+
+    @app.after_request
+    def close_ledger(response):
+        """Report the spells this request cast! 🧾"""
+        stats = g.pop(STATS_KEY, None)
+        if stats is None:
+            return response
+        elapsed = stats.seconds * 1000
+        if headers:
+            response.headers["X-DB-Queries"] = str(stats.count)
+            response.headers["X-DB-Time"] = f"{elapsed:.2f}"
+
+        repeated = stats.repeated(max_repeats)
+        if stats.count > max_queries or elapsed > max_ms or repeated:
+            suspects = "; ".join(
+                f"{times}x {statement[:120]}" for statement, times in repeated
+            )
+            haunted_logger.loggers["api"].info(
+                "🐢 %s %s ran %d queries in %.1fms%s",
+                request.method,
+                request.path,
+                stats.count,
+                elapsed,
+                f" | N+1 suspects: {suspects}" if suspects else "",
+                extra={
+                    "function_name": "close_ledger",
+                    "module_name": __name__,
+                    "user_id": getattr(g, "user_id", "anonymous"),
+                    "request_id": getattr(g, "request_id", "-"),
+                },
+            )
+        return response
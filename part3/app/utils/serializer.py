@@ -0,0 +1,58 @@
+"""Bounded, cycle-safe serializer for our haunted entities! 📚"""
+
+from typing import Any, Dict, Optional
+
+from flask import current_app, has_app_context
+
+DEFAULT_MAX_DEPTH = 1
+
+
+class HauntedSerializer:
+    """Turn an entity graph into dictionaries without getting lost! 🧭
+
+    Relations come from each model's ``__serialize_plan__`` and are only
+    followed down to ``max_depth``. An entity met twice in the same payload
+    is emitted once, then referenced by its id.
+    """
+
+    def __init__(self, max_depth: Optional[int] = None):
+        """Prepare the spell, with a depth taken from config if needed! ⚙️"""
+        if max_depth is None:
+            max_depth = DEFAULT_MAX_DEPTH
+            if has_app_context():
+                max_depth = current_app.config.get(
+                    "SERIALIZE_MAX_DEPTH", DEFAULT_MAX_DEPTH
+                )
+        if max_depth < 0:
+            raise ValueError("max_depth must be a positive integer")
+        self.max_depth = max_depth
+        self._emitted = set()
+
+    def serialize(self, obj) -> Dict[str, Any]:
+        """Serialize one entity and the relations within reach! ✨"""
+        return self._serialize(obj, 0)
+
+    def _serialize(self, obj, depth: int) -> Dict[str, Any]:
+        """Walk the graph, one haunted level at a time! 🚶"""
+        if id(obj) in self._emitted:
+            return {"id": obj.id}
+        self._emitted.add(id(obj))
+
+        data = obj._columns_dict()
+        if depth >= self.max_depth:
+            return data
+
+        for name in obj.__serialize_plan__:
+            value = obj._related(name)
+            if value is None:
+                data[name] = None
+            elif isinstance(value, (list, tuple)):
+                data[name] = [self._serialize(v, depth + 1) for v in value]
+            else:
+                data[name] = self._serialize(value, depth + 1)
+        return data
+
+
+def serialize(obj, max_depth: Optional[int] = None) -> Dict[str, Any]:
+    """Serialize an entity with a fresh serializer! 📚"""
+    return HauntedSerializer(max_depth).serialize(obj)
@@ -14,6 +14,49 @@ class Config:
     )
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     BCRYPT_LOG_ROUNDS = 12
+    PAGE_SIZE_DEFAULT = 20
+    PAGE_SIZE_MAX = 100
+    SERIALIZE_MAX_DEPTH = 1
+    # Background thread for log file I/O
+    LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() == "true"
+    # Per-component log levels: DEBUG, INFO, ERROR or OFF
+    LOG_LEVELS = {
+        "api": os.getenv("LOG_LEVEL_API", "DEBUG"),
+        "business": os.getenv("LOG_LEVEL_BUSINESS", "DEBUG"),
+        "persistence": os.getenv("LOG_LEVEL_PERSISTENCE", "DEBUG"),
+    }
+    # Share of calls logged per function, e.g. {"Place._validate_price": 0.01}
+    LOG_SAMPLING = {}
+    # Call counts and latency histograms served on /api/v1/metrics
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    # Process-wide LRU of get_by_id (0 disables it), TTL in seconds
+    IDENTITY_CACHE_SIZE = int(os.getenv("IDENTITY_CACHE_SIZE", "1024"))
+    IDENTITY_CACHE_TTL = float(os.getenv("IDENTITY_CACHE_TTL", "30"))
+    # Result cache of find/get_by_attribute, invalidated per table version
+    QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "512"))
+    QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", "30"))
+    # Rows per transaction for bulk inserts
+    BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "500"))
+    # Rows fetched per round trip by the streaming /export endpoints
+    EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+    # Largest array accepted by the /batch endpoints
+    BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "1000"))
+    # JSON encoder: "orjson", "json", or "auto" (orjson when installed)
+    JSON_ENGINE = os.getenv("JSON_ENGINE", "auto")
+    # Response compression, per Accept-Encoding; zstd and br need the
+    # optional zstandard and brotli packages
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+    COMPRESS_ALGORITHMS = ("zstd", "br", "gzip")
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "500"))
+    COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", "6"))
+    # Per-request SQL accounting: X-DB-Queries/X-DB-Time headers (off in
+    # production), and a log line past these thresholds (a shape repeated
+    # is an N+1 loop)
+    DB_STATS_ENABLED = os.getenv("DB_STATS_ENABLED", "true").lower() == "true"
+    DB_STATS_HEADERS = os.getenv("DB_STATS_HEADERS", "true").lower() == "true"
+    DB_QUERY_THRESHOLD = int(os.getenv("DB_QUERY_THRESHOLD", "25"))
+    DB_TIME_THRESHOLD_MS = float(os.getenv("DB_TIME_THRESHOLD_MS", "250"))
+    DB_REPEAT_THRESHOLD = int(os.getenv("DB_REPEAT_THRESHOLD", "5"))
 
 
 class DevelopmentConfig(Config):
@@ -39,6 +82,15 @@ class ProductionConfig(Config):
 
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
+    LOG_LEVELS = {
+        "api": os.getenv("LOG_LEVEL_API", "INFO"),
+        "business": os.getenv("LOG_LEVEL_BUSINESS", "INFO"),
+        "persistence": os.getenv("LOG_LEVEL_PERSISTENCE", "OFF"),
+    }
+    # Query counts and timings are for our logs, not for every client
+    DB_STATS_HEADERS = (
+        os.getenv("DB_STATS_HEADERS", "false").lower() == "true"
+    )
 
 
 config = {
@@ -0,0 +1,111 @@
+"""Benchmark fixtures: a synthetic realm at several sizes! ⏱️
+
+The benchmarks need pytest-benchmark and only run on demand::
+
+    pip install -r requirements-bench.txt
+    pytest tests/benchmarks --benchmark-only --no-cov \
+        --benchmark-save=baseline
+    pytest tests/benchmarks --benchmark-only --no-cov \
+        --benchmark-compare=0001_baseline --benchmark-compare-fail=mean:10%
+
+Results are saved as JSON under ``.benchmarks/<machine>/``: keep the
+baseline of your machine there, and compare every change against it.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import create_app, db
+from app.persistence import importer, synthetic
+from app.persistence.cache import identity_cache, query_cache
+from app.utils import haunted_logger
+from config import ProductionConfig
+
+# Places per realm; users, reviews and amenities scale along
+SIZES = (100, 2000)
+# Hash of "Haunted123" at 4 rounds: the realm itself is not about bcrypt
+HASH = "$2b$04$0DTEqne3xzi3UVShqXeVFOtDuNVKBxs/seUAigXwxPTFpmaMY5EkC"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Benchmarks only run when asked for (--benchmark-only)! 🚦"""
+    if config.getoption("benchmark_only", False):
+        return
+    skip = pytest.mark.skip(reason="run with --benchmark-only")
+    for item in items:
+        if "benchmarks" in item.path.parts:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda n: f"{n}places")
+def realm(request):
+    """An app with a generated realm, shared by a whole module! 🏘️
+
+    Logging runs at the production levels, so that benchmarks measure
+    what a deployed API pays.
+    """
+    app = create_app("testing")
+    haunted_logger.configure(levels=ProductionConfig.LOG_LEVELS)
+    places = request.param
+    shape = synthetic.Shape(
+        users=max(10, places // 2),
+        places=places,
+        reviews_per_place=5,
+        amenities=20,
+        seed=42,
+    )
+    owner_of = synthetic.owners(shape)
+    rows = {
+        "users": synthetic.users(shape, HASH),
+        "amenities": synthetic.amenities(shape),
+        "places": synthetic.places(shape, owner_of),
+        "reviews": synthetic.reviews(
+            shape, owner_of, synthetic.review_counts(shape)
+        ),
+        "links": synthetic.links(shape),
+    }
+
+    with app.app_context():
+        db.create_all()
+        reports = {
+            kind: importer.import_rows(kind, rows[kind], validate=False)
+            for kind in importer.KINDS
+        }
+        importer.finish(reports)
+        user_id = synthetic.entity_id(shape, "users", 0)
+        token = create_access_token(
+            identity=user_id,
+            additional_claims={
+                "is_admin": False,
+                "is_active": True,
+                "user_id": user_id,
+            },
+        )
+        yield SimpleNamespace(
+            app=app,
+            shape=shape,
+            client=app.test_client(),
+            headers={"Authorization": f"Bearer {token}"},
+            user_id=user_id,
+            owner_id=synthetic.entity_id(shape, "users", owner_of[0]),
+            place_id=synthetic.entity_id(shape, "places", 0),
+            amenity_id=synthetic.entity_id(shape, "amenities", 0),
+        )
+        db.session.remove()
+        db.drop_all()
+    identity_cache.clear()
+    query_cache.clear()
+
+
+@pytest.fixture
+def cold():
+    """Empty both caches, to time the database rather than memory! 🧊"""
+
+    def clear():
+        identity_cache.clear()
+        query_cache.clear()
+        db.session.expire_all()
+
+    return clear
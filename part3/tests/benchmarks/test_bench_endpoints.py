@@ -0,0 +1,61 @@
+"""Benchmarks of API round trips through the test client! 🌐"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _get(realm, url, **kwargs):
+    """One GET, checked: a failing endpoint is not fast 🚦"""
+    response = realm.client.get(url, **kwargs)
+    assert response.status_code == 200, response.data
+    return response
+
+
+def test_place_list_page(benchmark, realm):
+    """Public list, first page of 20 📄"""
+    benchmark(_get, realm, "/api/v1/places/?limit=20")
+
+
+def test_place_page(benchmark, realm):
+    """The one-request place page 🏰"""
+    benchmark(_get, realm, f"/api/v1/places/{realm.place_id}/page")
+
+
+def test_user_detail_with_jwt(benchmark, realm):
+    """A JWT-protected detail: token decoding included 🔐"""
+    benchmark(
+        _get, realm, f"/api/v1/users/{realm.user_id}", headers=realm.headers
+    )
+
+
+def test_place_reviews_with_jwt(benchmark, realm):
+    """A JWT-protected list 🔐"""
+    benchmark(
+        _get,
+        realm,
+        f"/api/v1/places/{realm.place_id}/reviews",
+        headers=realm.headers,
+    )
+
+
+@pytest.mark.parametrize("rounds", [4, 12], ids=lambda r: f"bcrypt{r}")
+def test_login(benchmark, realm, rounds):
+    """Login pays one bcrypt check, at the cost of the stored hash 🔑"""
+    from app import bcrypt, db
+    from app.models.user import User
+
+    user = User.query.get(realm.user_id)
+    user.password_hash = bcrypt.generate_password_hash(
+        "Haunted123", rounds=rounds
+    ).decode("utf-8")
+    db.session.commit()
+
+    def login():
+        response = realm.client.post(
+            "/api/v1/login/",
+            json={"email": user.email, "password": "Haunted123"},
+        )
+        assert response.status_code == 200, response.data
+
+    benchmark.pedantic(login, rounds=10 if rounds > 10 else 50)
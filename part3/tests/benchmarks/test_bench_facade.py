@@ -0,0 +1,53 @@
+"""Benchmarks of facade.find and its filters! 🔮"""
+
+import pytest
+
+from app.models.place import Place
+from app.models.review import Review
+from app.services.facade import HBnBFacade
+
+pytest.importorskip("pytest_benchmark")
+
+facade = HBnBFacade()
+
+
+def test_find_by_owner(benchmark, realm, cold):
+    """Equality filter on an indexed foreign key 🔑"""
+    benchmark.pedantic(
+        facade.find,
+        (Place,),
+        {"owner_id": realm.owner_id},
+        setup=cold,
+        rounds=100,
+    )
+
+
+def test_find_reviews_of_place(benchmark, realm, cold):
+    """The reviews of the most reviewed place 💬"""
+    benchmark.pedantic(
+        facade.find,
+        (Review,),
+        {"place_id": realm.place_id},
+        setup=cold,
+        rounds=100,
+    )
+
+
+@pytest.mark.parametrize("eager", [False, True], ids=["lazy", "eager"])
+def test_find_page(benchmark, realm, cold, eager):
+    """A first page of 20 places, with or without the plan relations 📄"""
+    benchmark.pedantic(
+        facade.find,
+        (Place,),
+        {"limit": 20, "eager": eager},
+        setup=cold,
+        rounds=100,
+    )
+
+
+def test_find_sparse_fields(benchmark, realm, cold):
+    """Map pins: five columns of every place 📍"""
+    fields = ["name", "price_by_night", "latitude", "longitude"]
+    benchmark.pedantic(
+        facade.find, (Place,), {"fields": fields}, setup=cold, rounds=20
+    )
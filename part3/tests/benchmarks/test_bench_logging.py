@@ -0,0 +1,28 @@
+"""Benchmarks of the log_me overhead, per level! 📜"""
+
+import pytest
+
+from app.utils import haunted_logger, log_me
+
+pytest.importorskip("pytest_benchmark")
+
+
+def spell(a, b=1):
+    """A cheap function, so that only the decorator is timed ✨"""
+    return a + b
+
+
+def test_undecorated(benchmark):
+    """The baseline: a plain call 🪶"""
+    benchmark(spell, 1, b=2)
+
+
+@pytest.mark.parametrize("level", ["OFF", "ERROR", "INFO", "DEBUG"])
+def test_log_me(benchmark, realm, level):
+    """The same call through log_me, at each business level 🎚️"""
+    haunted_logger.configure(levels={"business": level})
+    logged = log_me(component="business")(spell)
+    try:
+        benchmark(logged, 1, b=2)
+    finally:
+        haunted_logger.configure(levels={"business": "INFO"})
@@ -0,0 +1,83 @@
+"""Benchmarks of SQLAlchemyRepository CRUD, warm and cold! 🗄️"""
+
+import itertools
+
+import pytest
+
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.user import User
+
+pytest.importorskip("pytest_benchmark")
+
+COUNTER = itertools.count()
+
+
+def test_get_by_id_warm(benchmark, realm):
+    """get_by_id served by the identity cache 🔥"""
+    repo = Place._get_repo()
+    benchmark(repo.get, realm.place_id)
+
+
+def test_get_by_id_cold(benchmark, realm, cold):
+    """get_by_id down to the database 🧊"""
+    repo = Place._get_repo()
+    benchmark.pedantic(repo.get, (realm.place_id,), setup=cold, rounds=200)
+
+
+def test_get_by_attribute_warm(benchmark, realm):
+    """get_by_attribute served by the query cache 🔥"""
+    repo = Place._get_repo()
+    benchmark(repo.get_by_attribute, multiple=True, owner_id=realm.owner_id)
+
+
+def test_get_by_attribute_cold(benchmark, realm, cold):
+    """get_by_attribute down to the database 🧊"""
+    repo = Place._get_repo()
+
+    def run():
+        repo.get_by_attribute(multiple=True, owner_id=realm.owner_id)
+
+    benchmark.pedantic(run, setup=cold, rounds=200)
+
+
+def test_get_all(benchmark, realm, cold):
+    """Every place, no cache 📚"""
+    benchmark.pedantic(Place._get_repo().get_all, setup=cold, rounds=20)
+
+
+def test_add(benchmark, realm):
+    """One insert, one commit ✨"""
+    repo = Amenity._get_repo()
+
+    def run():
+        repo.add(
+            Amenity(
+                name=f"Bench Feature {next(COUNTER)}",
+                description="Benchmarked",
+            )
+        )
+
+    benchmark(run)
+
+
+def test_update(benchmark, realm):
+    """One update, one commit 🌟"""
+    repo = User._get_repo()
+    benchmark(
+        lambda: repo.update(realm.user_id, {"city": f"Salem{next(COUNTER)}"})
+    )
+
+
+def test_delete(benchmark, realm):
+    """Soft delete of fresh amenities ⚡"""
+    repo = Amenity._get_repo()
+
+    def setup():
+        amenity = Amenity(
+            name=f"Doomed Feature {next(COUNTER)}", description="Doomed"
+        )
+        repo.add(amenity)
+        return (amenity.id,), {}
+
+    benchmark.pedantic(repo.delete, setup=setup, rounds=100)
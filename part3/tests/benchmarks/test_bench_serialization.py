@@ -0,0 +1,27 @@
+"""Benchmarks of to_dict, model by model! 📦"""
+
+import pytest
+
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.placeamenity import PlaceAmenity
+from app.models.review import Review
+from app.models.user import User
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize(
+    "model_class", [User, Place, Review, Amenity, PlaceAmenity]
+)
+def test_to_dict(benchmark, realm, model_class):
+    """Serialize one loaded entity, relations included 🧾"""
+    entity = model_class.query.filter(model_class.id.isnot(None)).first()
+    benchmark(entity.to_dict)
+
+
+def test_place_list_to_json(benchmark, realm):
+    """A page of places down to a JSON string, as the API sends it 📨"""
+    places = Place.query.limit(20).all()
+    dumps = realm.app.json.dumps
+    benchmark(lambda: dumps([place.to_dict() for place in places]))
@@ -81,3 +81,39 @@ def test_delete_amenity_admin(client, admin_headers):
         f"/api/v1/amenities/{amenity_id}", headers=admin_headers
     )
     assert response.status_code == 204
+
+
+def test_list_amenities_paginated(client, admin_headers):
+    """Test GET /amenities?limit= - Pagination par curseur 📜"""
+    for i in range(3):
+        client.post(
+            "/api/v1/amenities",
+            json={
+                "name": f"Ghost Feature {i}",
+                "description": "A paginated supernatural feature",
+                "category": "supernatural",
+            },
+            headers=admin_headers,
+        )
+
+    first = client.get("/api/v1/amenities?limit=2")
+    assert first.status_code == 200
+    assert len(first.json["items"]) == 2
+    assert first.json["next_cursor"]
+
+    second = client.get(
+        f"/api/v1/amenities?limit=2&cursor={first.json['next_cursor']}"
+    )
+    assert second.status_code == 200
+    assert len(second.json["items"]) == 1
+    assert second.json["next_cursor"] is None
+
+
+def test_batch_create_amenities_admin_only(client, user_headers):
+    """Test POST /amenities/batch - Non admin 🚫"""
+    response = client.post(
+        "/api/v1/amenities/batch",
+        json=[{"name": "Ghost Detector", "description": "Beeps"}],
+        headers=user_headers,
+    )
+    assert response.status_code == 403
@@ -0,0 +1,15 @@
+def test_metrics_admin(client, admin_headers):
+    """Test GET /metrics - Exposition Prometheus pour l'admin 📊"""
+    client.get("/api/v1/amenities")
+    response = client.get("/api/v1/metrics", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    body = response.get_data(as_text=True)
+    assert "# TYPE hbnb_latency_seconds histogram" in body
+    assert 'component="api",function="AmenityList.get"' in body
+
+
+def test_metrics_not_admin(client, user_headers):
+    """Test GET /metrics - Refusé aux simples fantômes 🚫"""
+    response = client.get("/api/v1/metrics", headers=user_headers)
+    assert response.status_code == 403
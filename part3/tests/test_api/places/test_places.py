@@ -136,3 +136,42 @@ def test_delete_place_admin(client, admin_headers, normal_user):
         f"/api/v1/places/{place_id}", headers=admin_headers
     )
     assert response.status_code == 204
+
+
+def test_rating_aggregates_cannot_be_forged(client, user_headers, normal_user):
+    """Test review_count & co. are ignored on create, refused on update ⭐"""
+    forged = {"review_count": 999, "rating_sum": 4995, "rating_avg": 5.0}
+    place_data = {
+        "name": "Forged Manor",
+        "description": "A very haunted test place",
+        "number_rooms": 3,
+        "number_bathrooms": 2,
+        "max_guest": 6,
+        "price_by_night": 100.0,
+        "owner_id": normal_user.id,
+    }
+    response = client.post(
+        "/api/v1/places", json={**place_data, **forged}, headers=user_headers
+    )
+    assert response.status_code == 201
+    place_id = response.json["id"]
+
+    batch = client.post(
+        "/api/v1/places/batch",
+        json=[{**place_data, "name": "Forged Batch Manor", **forged}],
+        headers=user_headers,
+    )
+    assert batch.status_code == 201
+
+    response = client.put(
+        f"/api/v1/places/{place_id}", json=forged, headers=user_headers
+    )
+    assert response.status_code == 400
+
+    listed = client.get("/api/v1/places?min_rating=4.9")
+    assert listed.status_code == 200
+    assert listed.json == []
+    for place in client.get("/api/v1/places").json:
+        assert client.get(f"/api/v1/places/{place['id']}").json[
+            "review_count"
+        ] == 0
@@ -0,0 +1,99 @@
+# tests/test_api/places/test_places_batch.py
+
+
+def _place(owner_id, name="Batch Manor"):
+    return {
+        "name": name,
+        "description": "A very haunted batch place",
+        "number_rooms": 3,
+        "number_bathrooms": 2,
+        "max_guest": 6,
+        "price_by_night": 100.0,
+        "owner_id": owner_id,
+    }
+
+
+def test_batch_create_places(client, user_headers, normal_user):
+    """Test POST /places/batch - Tous créés 🏘️"""
+    items = [_place(normal_user.id, f"Batch Manor {i}") for i in range(3)]
+    response = client.post(
+        "/api/v1/places/batch", json=items, headers=user_headers
+    )
+    assert response.status_code == 201
+    assert [r["status"] for r in response.json] == ["created"] * 3
+    assert response.json[2]["item"]["name"] == "Batch Manor 2"
+
+    listed = client.get("/api/v1/places")
+    assert len(listed.json) == 3
+
+
+def test_batch_create_places_partial(
+    client, user_headers, normal_user, other_user
+):
+    """Test POST /places/batch - Statut par élément ⚠️"""
+    items = [
+        _place(normal_user.id),
+        {"name": "No"},
+        _place(other_user.id, "Stolen Manor"),
+        "not an object",
+    ]
+    response = client.post(
+        "/api/v1/places/batch", json=items, headers=user_headers
+    )
+    assert response.status_code == 207
+    statuses = [(r["index"], r["status"]) for r in response.json]
+    assert statuses == [
+        (0, "created"),
+        (1, "error"),
+        (2, "error"),
+        (3, "error"),
+    ]
+    assert "your haunt" in response.json[2]["message"]
+
+
+def test_batch_rejects_invalid_payload(client, app, user_headers):
+    """Test POST /places/batch - Tableau vide ou trop grand 🚫"""
+    response = client.post(
+        "/api/v1/places/batch", json=[], headers=user_headers
+    )
+    assert response.status_code == 400
+
+    app.config["BATCH_MAX_ITEMS"] = 1
+    response = client.post(
+        "/api/v1/places/batch", json=[{}, {}], headers=user_headers
+    )
+    assert response.status_code == 400
+
+
+def test_batch_link_amenities(
+    client, admin_headers, user_headers, other_user_headers, test_place
+):
+    """Test POST /places/<id>/amenities/batch - Liens en masse ✨"""
+    amenities = client.post(
+        "/api/v1/amenities/batch",
+        json=[
+            {"name": "Ghost Detector", "description": "Beeps"},
+            {"name": "Cursed Mirror", "description": "Stares"},
+        ],
+        headers=admin_headers,
+    )
+    assert amenities.status_code == 201
+    ids = [r["item"]["id"] for r in amenities.json]
+
+    url = f"/api/v1/places/{test_place}/amenities/batch"
+    items = [{"amenity_id": i} for i in ids] + [{"amenity_id": "nope"}]
+
+    response = client.post(url, json=items, headers=other_user_headers)
+    assert response.status_code == 403
+
+    response = client.post(url, json=items, headers=user_headers)
+    assert response.status_code == 207
+    assert [r["status"] for r in response.json] == [
+        "created",
+        "created",
+        "error",
+    ]
+    assert response.json[0]["item"]["place_id"] == test_place
+
+    linked = client.get(f"/api/v1/places/{test_place}/amenities")
+    assert {a["id"] for a in linked.json} == set(ids)
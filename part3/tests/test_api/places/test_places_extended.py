@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_create_place_invalid_data(client, user_headers):
     """Test POST /places avec des données invalides ⚠️"""
     invalid_data = {
@@ -116,3 +119,92 @@ def test_get_place_reviews_nonexistent(client):
     """Test GET /places/<id>/reviews avec un ID inexistant ⚠️"""
     response = client.get("/api/v1/places/nonexistent-id/reviews")
     assert response.status_code == 404
+
+
+def test_nearest_places(client, user_headers, normal_user):
+    """Test GET /places/nearest - Les k plus proches 🧭"""
+    for name, lat in [("Near Manor", 45.501), ("Far Manor", 45.6)]:
+        data = {
+            "name": name,
+            "description": "A very haunted test place",
+            "number_rooms": 3,
+            "number_bathrooms": 2,
+            "max_guest": 6,
+            "price_by_night": 100.0,
+            "latitude": lat,
+            "longitude": -73.5,
+            "owner_id": normal_user.id,
+        }
+        client.post("/api/v1/places", json=data, headers=user_headers)
+
+    response = client.get("/api/v1/places/nearest?lat=45.5&lon=-73.5&k=1")
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json] == ["Near Manor"]
+    assert response.json[0]["distance_km"] == pytest.approx(0.111, abs=0.01)
+
+    response = client.get("/api/v1/places/nearest?lat=95&lon=0")
+    assert response.status_code == 400
+
+
+def test_list_places_combined_filters(client, user_headers, normal_user):
+    """Test GET /places - Plusieurs filtres à la fois 🧩"""
+    for name, price, kind in [
+        ("Cheap House", 50.0, "house"),
+        ("Pricey House", 250.0, "house"),
+        ("Cheap Flat", 60.0, "apartment"),
+    ]:
+        data = {
+            "name": name,
+            "description": "A very haunted test place",
+            "number_rooms": 3,
+            "number_bathrooms": 2,
+            "max_guest": 6,
+            "price_by_night": price,
+            "owner_id": normal_user.id,
+            "property_type": kind,
+        }
+        client.post("/api/v1/places", json=data, headers=user_headers)
+
+    response = client.get(
+        "/api/v1/places?price_min=10&price_max=100&property_type=house"
+    )
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json] == ["Cheap House"]
+
+    response = client.get("/api/v1/places?sort=-price&limit=2")
+    assert response.status_code == 400  # Pages follow the default order
+
+    response = client.get("/api/v1/places?price_max=100&limit=1")
+    assert response.status_code == 200
+    assert len(response.json["items"]) == 1
+    assert response.json["next_cursor"]
+
+
+def test_search_places(client, user_headers, normal_user):
+    """Test GET /places/search - Recherche plein texte paginée 🔍"""
+    for i, price in enumerate([50.0, 80.0, 400.0]):
+        data = {
+            "name": f"Haunted Manor {i}",
+            "description": "A very haunted test place",
+            "number_rooms": 3,
+            "number_bathrooms": 2,
+            "max_guest": 6,
+            "price_by_night": price,
+            "owner_id": normal_user.id,
+        }
+        client.post("/api/v1/places", json=data, headers=user_headers)
+
+    response = client.get("/api/v1/places/search?q=haunted&price_max=100")
+    assert response.status_code == 200
+    assert len(response.json["items"]) == 2
+    assert "<mark>" in response.json["items"][0]["snippet"]
+
+    response = client.get("/api/v1/places/search?q=haunted&limit=2")
+    assert len(response.json["items"]) == 2
+    cursor = response.json["next_cursor"]
+    response = client.get(f"/api/v1/places/search?q=haunted&cursor={cursor}")
+    assert len(response.json["items"]) == 1
+    assert response.json["next_cursor"] is None
+
+    response = client.get("/api/v1/places/search?q=%21%21")
+    assert response.status_code == 400
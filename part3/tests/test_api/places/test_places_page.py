@@ -0,0 +1,165 @@
+"""Tests for the one-request place page! 📰"""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.placeamenity import PlaceAmenity
+from app.models.review import Review
+from app.models.user import User
+from app.persistence.cache import identity_cache
+
+
+@pytest.fixture
+def brochure(normal_user):
+    """A place with two amenities and five reviews by five ghosts! 🏚️"""
+    place = Place(
+        name="Brochure Manor",
+        description="A very haunted test place",
+        owner_id=normal_user.id,
+        price_by_night=100.0,
+    ).save()
+    for name in ("Spectral WiFi", "Crystal Orb"):
+        amenity = Amenity(name=name, description="Shiny").save()
+        PlaceAmenity(place_id=place.id, amenity_id=amenity.id).save()
+    for i, name in enumerate(("one", "two", "three", "four", "five")):
+        ghost = User(
+            username=f"ghost_{name}",
+            email=f"{name}@test.com",
+            password="Ghost123!",
+            first_name="Ghost",
+            last_name=name.title(),
+        ).save()
+        Review(
+            place_id=place.id,
+            user_id=ghost.id,
+            text="Spooky and comfortable!",
+            rating=str(i % 5 + 1),
+        ).save()
+    db.session.expire_all()  # Every request has to read its rows again
+    identity_cache.clear()
+    return place.id
+
+
+@contextmanager
+def count_queries():
+    """Count the SQL statements sent while the block runs! 🧮"""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+
+def test_place_page_gathers_everything(
+    client, brochure, normal_user, user_headers
+):
+    """The place, owner, amenities and authored reviews come together 📰"""
+    response = client.get(
+        f"/api/v1/places/{brochure}/page", headers=user_headers
+    )
+    assert response.status_code == 200
+    assert "Authorization" in response.headers["Vary"]
+
+    page = response.json
+    assert page["place"]["id"] == brochure
+    assert page["owner"] == {
+        "id": normal_user.id,
+        "first_name": "Normal",
+        "last_name": "Ghost",
+    }
+    assert sorted(a["name"] for a in page["amenities"]) == [
+        "Crystal Orb",
+        "Spectral WiFi",
+    ]
+    reviews = page["reviews"]["items"]
+    assert len(reviews) == 5
+    assert page["reviews"]["next_cursor"] is None
+    for review in reviews:
+        assert review["author"]["id"] == review["user_id"]
+        assert review["author"]["first_name"] == "Ghost"
+        assert "email" not in review["author"]
+
+
+@pytest.mark.parametrize(
+    "headers", [{}, {"Authorization": "Bearer undefined"}]
+)
+def test_place_page_hides_names_from_visitors(
+    client, brochure, normal_user, headers
+):
+    """Anonymous visitors see the page, not who haunts it 🙈"""
+    response = client.get(f"/api/v1/places/{brochure}/page", headers=headers)
+    assert response.status_code == 200
+    page = response.json
+    assert page["owner"] == {
+        "id": normal_user.id,
+        "first_name": None,
+        "last_name": None,
+    }
+    reviews = page["reviews"]["items"]
+    assert len(reviews) == 5
+    for review in reviews:
+        assert review["author"]["id"] == review["user_id"]
+        assert review["author"]["first_name"] is None
+        assert review["author"]["last_name"] is None
+
+
+def test_place_page_query_count_is_fixed(client, brochure, normal_user):
+    """More reviews do not mean more queries 🧮"""
+    with count_queries() as few:
+        client.get(f"/api/v1/places/{brochure}/page?limit=2")
+    with count_queries() as many:
+        client.get(f"/api/v1/places/{brochure}/page?limit=5")
+    assert len(few) == len(many) == 3
+
+
+def test_place_page_paginates_reviews(client, brochure):
+    """Reviews come page by page, without repeats 📜"""
+    url = f"/api/v1/places/{brochure}/page"
+    first = client.get(f"{url}?limit=3").json["reviews"]
+    assert len(first["items"]) == 3
+    second = client.get(f"{url}?cursor={first['next_cursor']}&limit=3")
+    rest = second.json["reviews"]
+    assert len(rest["items"]) == 2
+    assert rest["next_cursor"] is None
+    ids = {r["id"] for r in first["items"] + rest["items"]}
+    assert len(ids) == 5
+
+
+def test_place_page_etag(client, brochure):
+    """A fresh ETag earns a bodiless 304, a stale one a new page 🏷️"""
+    url = f"/api/v1/places/{brochure}/page"
+    first = client.get(url)
+    etag = first.headers["ETag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert cached.headers["ETag"] == etag
+
+    Place.get_by_id(brochure).update({"name": "Renamed Manor"})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_place_page_missing_place(client):
+    """Unknown places are 404 📭"""
+    response = client.get("/api/v1/places/nonexistent-id/page")
+    assert response.status_code == 404
+
+
+def test_place_page_invalid_cursor(client, brochure):
+    """A forged cursor is a 400 🔮"""
+    response = client.get(f"/api/v1/places/{brochure}/page?cursor=nope")
+    assert response.status_code == 400
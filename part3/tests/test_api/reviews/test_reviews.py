@@ -144,3 +144,52 @@ def test_update_review_owner(client, reviewer, test_place):
     print(f"Update response data: {response.json}")
     assert response.status_code == 200
     assert response.json["text"] == "Review modifiée"
+
+
+def test_batch_create_reviews(
+    client, reviewer, reviewer_headers, user_headers, test_place
+):
+    """Test POST /reviews/batch - Signées par l'auteur du token ✍️"""
+    items = [
+        {
+            "text": "Super endroit hanté !",
+            "rating": 5,
+            "place_id": test_place,
+            "user_id": "someone-else",
+        },
+        {"text": "Trop court", "rating": 9, "place_id": test_place},
+    ]
+    response = client.post(
+        "/api/v1/reviews/batch", json=items, headers=reviewer_headers
+    )
+    assert response.status_code == 207
+    assert response.json[0]["status"] == "created"
+    assert response.json[0]["item"]["user_id"] == reviewer.id
+    assert response.json[1]["status"] == "error"
+
+    # Le propriétaire ne peut pas noter sa propre maison
+    response = client.post(
+        "/api/v1/reviews/batch", json=items[:1], headers=user_headers
+    )
+    assert response.status_code == 207
+    assert "own place" in response.json[0]["message"]
+
+
+def test_batch_rejects_same_place_twice(
+    client, reviewer, reviewer_headers, test_place
+):
+    """Test POST /reviews/batch - Une seule critique par lieu, même en lot 🚫"""
+    items = [
+        {"text": "Premier frisson hanté", "rating": 4, "place_id": test_place},
+        {"text": "Second frisson hanté", "rating": 2, "place_id": test_place},
+    ]
+    response = client.post(
+        "/api/v1/reviews/batch", json=items, headers=reviewer_headers
+    )
+    assert response.status_code == 207
+    assert response.json[0]["status"] == "created"
+    assert response.json[1]["status"] == "error"
+    assert "already reviewed" in response.json[1]["message"]
+
+    response = client.get(f"/api/v1/places/{test_place}/reviews")
+    assert len(response.json) == 1
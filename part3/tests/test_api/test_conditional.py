@@ -0,0 +1,132 @@
+"""Tests for conditional GETs: ETag, Last-Modified and 304s! 🏷️"""
+
+import pytest
+
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+
+
+@pytest.fixture
+def manor(normal_user):
+    """A place to revalidate! 🏚️"""
+    return Place(
+        name="Etag Manor",
+        description="A very haunted test place",
+        owner_id=normal_user.id,
+        price_by_night=100.0,
+    ).save()
+
+
+def test_single_get_carries_validators(client, manor):
+    """Single GETs send an ETag and a Last-Modified 🏷️"""
+    response = client.get(f"/api/v1/places/{manor.id}")
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('"')
+    assert response.headers["Last-Modified"].endswith("GMT")
+
+
+def test_if_none_match_short_circuits(client, manor):
+    """A matching ETag earns an empty 304, a change a new tag ♻️"""
+    url = f"/api/v1/places/{manor.id}"
+    etag = client.get(url).headers["ETag"]
+
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert cached.headers["ETag"] == etag
+
+    manor.update({"name": "Renamed Manor"})
+    fresh = client.get(url, headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["ETag"] != etag
+    assert fresh.json["name"] == "Renamed Manor"
+
+
+def test_if_modified_since(client, manor):
+    """Last-Modified works as a validator too 📅"""
+    url = f"/api/v1/places/{manor.id}"
+    last_modified = client.get(url).headers["Last-Modified"]
+
+    cached = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert cached.status_code == 304
+
+    stale = client.get(
+        url, headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+    )
+    assert stale.status_code == 200
+
+
+def test_new_review_changes_place_etag(client, manor, other_user):
+    """Rating aggregates moving is a change of the place 📝"""
+    url = f"/api/v1/places/{manor.id}"
+    etag = client.get(url).headers["ETag"]
+    Review(
+        place_id=manor.id,
+        user_id=other_user.id,
+        text="Spooky and comfortable!",
+        rating="5",
+    ).save()
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json["review_count"] == 1
+
+
+def test_list_validators(client, manor, normal_user):
+    """Lists change their tag on writes and per query string 📜"""
+    etag = client.get("/api/v1/places/").headers["ETag"]
+    assert (
+        client.get("/api/v1/places/", headers={"If-None-Match": etag})
+    ).status_code == 304
+
+    filtered = client.get("/api/v1/places/?capacity=2").headers["ETag"]
+    assert filtered != etag
+
+    Place(
+        name="Second Manor",
+        description="Another very haunted place",
+        owner_id=normal_user.id,
+        price_by_night=80.0,
+    ).save()
+    response = client.get("/api/v1/places/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json) == 2
+
+
+def test_authenticated_get_is_validated(client, normal_user, user_headers):
+    """Auth still comes first, then the 304 🔒"""
+    url = f"/api/v1/users/{normal_user.id}"
+    assert client.get(url).status_code == 401
+
+    etag = client.get(url, headers=user_headers).headers["ETag"]
+    cached = client.get(url, headers={**user_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_missing_entity_has_no_validators(client):
+    """404s are not cached 📭"""
+    response = client.get("/api/v1/amenities/nonexistent-id")
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
+
+
+def test_amenity_and_review_details(client, manor, other_user):
+    """Every single-resource GET is validated 🎭"""
+    amenity = Amenity(name="Spectral WiFi", description="Fast").save()
+    review = Review(
+        place_id=manor.id,
+        user_id=other_user.id,
+        text="Spooky and comfortable!",
+        rating="4",
+    ).save()
+    for url in (
+        f"/api/v1/amenities/{amenity.id}",
+        f"/api/v1/reviews/{review.id}",
+    ):
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.json["id"] in url
+        etag = response.headers["ETag"]
+        cached = client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
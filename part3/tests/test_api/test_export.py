@@ -0,0 +1,93 @@
+"""Tests for the streaming NDJSON/CSV exports! 🌊"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from app.models.place import Place
+from app.models.review import Review
+
+
+@pytest.fixture
+def estate(normal_user, other_user):
+    """Five places, one of them reviewed, one of them blocked! 🏘️"""
+    places = [
+        Place(
+            name=f"Export Manor {'I' * (i + 1)}",
+            description="A very haunted test place",
+            owner_id=normal_user.id,
+            price_by_night=100.0 + i,
+        ).save()
+        for i in range(5)
+    ]
+    Review(
+        place_id=places[0].id,
+        user_id=other_user.id,
+        text="Spooky and comfortable!",
+        rating="5",
+    ).save()
+    places[4].delete()
+    return places
+
+
+def test_ndjson_export(app, client, admin_headers, estate):
+    """One JSON document per line, chunk after chunk 📜"""
+    app.config["EXPORT_CHUNK_SIZE"] = 2  # Several round trips
+    response = client.get("/api/v1/places/export", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/x-ndjson"
+    assert "place.ndjson" in response.headers["Content-Disposition"]
+
+    rows = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [row["name"] for row in rows] == [
+        place.name for place in estate
+    ]
+    assert rows[0]["review_count"] == 1
+    assert rows[0]["status"] == "active"
+    assert rows[4]["status"] == "blocked"  # Analytics want them all
+
+
+def test_csv_export_with_fields(client, admin_headers, estate):
+    """CSV gets a header line and the requested columns 📊"""
+    response = client.get(
+        "/api/v1/reviews/export?format=csv&fields=place_id,rating",
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    rows = list(csv.reader(io.StringIO(response.data.decode())))
+    assert rows == [["place_id", "rating"], [estate[0].id, "5"]]
+
+
+def test_empty_csv_export_keeps_its_header(client, admin_headers):
+    """An empty table still names its columns 🪶"""
+    response = client.get(
+        "/api/v1/amenities/export?format=csv", headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert response.data.decode().splitlines() == [
+        "id,name,description,category"
+    ]
+
+
+def test_export_is_admin_only(client, user_headers, admin_headers):
+    """Exports stay behind the admin door 🔒"""
+    assert client.get("/api/v1/users/export").status_code == 401
+    response = client.get("/api/v1/users/export", headers=user_headers)
+    assert response.status_code == 403
+
+    response = client.get("/api/v1/users/export", headers=admin_headers)
+    lines = response.data.decode().splitlines()
+    assert "password_hash" not in lines[0]
+
+
+def test_export_refuses_bad_parameters(client, admin_headers):
+    """Unknown formats and fields are a 400 ⚠️"""
+    for query in ("format=xml", "fields=password_hash"):
+        response = client.get(
+            f"/api/v1/users/export?{query}", headers=admin_headers
+        )
+        assert response.status_code == 400
@@ -0,0 +1,101 @@
+"""Tests for sparse fieldsets (?fields=)! ✂️"""
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models.place import Place
+
+PIN = "id,name,price_by_night,latitude,longitude"
+
+
+@pytest.fixture
+def pins(normal_user):
+    """Three places for a map! 📍"""
+    for i, name in enumerate(("Alpha Manor", "Beta Manor", "Gamma Manor")):
+        Place(
+            name=name,
+            description="A very haunted test place",
+            owner_id=normal_user.id,
+            price_by_night=100.0 + i,
+            latitude=48.85 + i / 100,
+            longitude=2.35,
+        ).save()
+    db.session.expire_all()
+
+
+@pytest.fixture
+def statements(app):
+    """Record the SQL sent to the database! 🧮"""
+    sent = []
+
+    def record(conn, cursor, statement, *args):
+        sent.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    yield sent
+    event.remove(db.engine, "before_cursor_execute", record)
+
+
+def test_list_returns_only_requested_fields(client, pins, statements):
+    """Map pins get five fields, and SQL reads no more 📍"""
+    response = client.get(f"/api/v1/places/?fields={PIN}")
+    assert response.status_code == 200
+    assert len(response.json) == 3
+    for place in response.json:
+        assert set(place) == set(PIN.split(","))
+
+    selects = [s for s in statements if "place.name" in s]
+    assert selects and all("place.description" not in s for s in selects)
+    assert not any("FROM amenity" in s for s in statements)
+
+
+def test_fields_with_filters_and_pages(client, pins):
+    """Fieldsets combine with filters, radius and cursors 🧩"""
+    filtered = client.get(
+        "/api/v1/places/?fields=id,name&price_min=101"
+        "&latitude=48.86&longitude=2.35&radius=50"
+    )
+    assert filtered.status_code == 200
+    assert sorted(p["name"] for p in filtered.json) == [
+        "Beta Manor",
+        "Gamma Manor",
+    ]
+    assert set(filtered.json[0]) == {"id", "name"}
+
+    page = client.get("/api/v1/places/?fields=name&limit=2").json
+    assert len(page["items"]) == 2 and set(page["items"][0]) == {"name"}
+    rest = client.get(
+        f"/api/v1/places/?fields=name&limit=2&cursor={page['next_cursor']}"
+    ).json
+    assert len(rest["items"]) == 1
+
+
+def test_detail_fields_and_etag(client, pins):
+    """Detail GETs narrow too, each fieldset with its own tag 🏷️"""
+    place_id = Place.find_by(name="Alpha Manor").id
+    url = f"/api/v1/places/{place_id}"
+    full = client.get(url)
+    narrow = client.get(f"{url}?fields=name")
+    assert narrow.json == {"name": "Alpha Manor"}
+    assert narrow.headers["ETag"] != full.headers["ETag"]
+
+
+def test_unknown_or_hidden_fields_are_refused(
+    client, pins, normal_user, admin_headers
+):
+    """Only public columns can be asked for ⚠️"""
+    response = client.get("/api/v1/places/?fields=name,ghosts")
+    assert response.status_code == 400
+    assert "ghosts" in response.json["message"]
+
+    response = client.get(
+        "/api/v1/users/?fields=id,password_hash", headers=admin_headers
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        f"/api/v1/users/{normal_user.id}?fields=first_name",
+        headers=admin_headers,
+    )
+    assert response.json == {"first_name": "Normal"}
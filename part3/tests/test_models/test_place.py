@@ -0,0 +1,146 @@
+"""Test module for our haunted Place model! 🏰"""
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.placeamenity import PlaceAmenity
+from app.models.review import Review
+from app.utils import geo
+
+
+@pytest.fixture
+def haunted_places(normal_user, reviewer):
+    """Summon places with reviews and amenities! 🏚️"""
+    amenity = Amenity(name="Ouija Board", description="Talk to us").save()
+    places = []
+    for i in range(3):
+        place = Place(
+            name=f"Manor {i}",
+            description="A very haunted test place",
+            owner_id=normal_user.id,
+            price_by_night=100.0 + i,
+        ).save()
+        Review(
+            place_id=place.id,
+            user_id=reviewer.id,
+            text="Spooky and comfortable!",
+            rating=5,
+        ).save()
+        PlaceAmenity(place_id=place.id, amenity_id=amenity.id).save()
+        places.append(place)
+    db.session.expire_all()
+    return places
+
+
+@pytest.fixture
+def count_queries(app):
+    """Count the SQL statements sent to the database! 🧮"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _touch_relations(places):
+    """Walk every relation the serialization plan declares! 🚶"""
+    for place in places:
+        assert place.owner is not None
+        assert place.amenities
+        for review in place.reviews:
+            assert review.author is not None
+            assert review.place is place
+
+
+def test_eager_options_follow_serialization_plan(app):
+    """Test the plan becomes one loader option per relation! 🔮"""
+    assert len(Place.eager_options()) == len(Place.__serialize_plan__)
+
+
+def test_eager_find_uses_constant_queries(haunted_places, count_queries):
+    """Test a list of places loads its relations without N+1! ⚡"""
+    places = Place.get_all(eager=True)
+    _touch_relations(places)
+    eager_count = len(count_queries)
+
+    db.session.expire_all()
+    count_queries.clear()
+    _touch_relations(Place.get_all())
+
+    assert eager_count <= len(Place.__serialize_plan__) + 1
+    assert eager_count < len(count_queries)
+
+
+def test_to_dict_is_bounded_on_cycles(haunted_places):
+    """Test place -> review -> place no longer recurses forever! 🌀"""
+    place = haunted_places[0]
+    data = place.to_dict()
+
+    assert data["owner"]["id"] == place.owner_id
+    assert len(data["reviews"]) == 1
+    assert "place" not in data["reviews"][0]  # Beyond max_depth
+    assert data["amenities"][0]["name"] == "Ouija Board"
+
+
+def test_to_dict_references_emitted_entities(haunted_places):
+    """Test an entity already emitted comes back as a reference! 🔗"""
+    place = haunted_places[0]
+    data = place.to_dict(max_depth=2)
+
+    review = data["reviews"][0]
+    assert review["place"] == {"id": place.id}
+    assert review["author"]["username"] == "reviewer"
+    assert "password_hash" not in review["author"]
+
+
+def _place_at(owner_id, name, lat, lon):
+    return Place(
+        name=name,
+        description="A very haunted test place",
+        owner_id=owner_id,
+        price_by_night=100.0,
+        latitude=lat,
+        longitude=lon,
+    ).save()
+
+
+def test_geohash_follows_coordinates(normal_user):
+    """Test the geohash is refreshed when a place moves! 🧭"""
+    place = _place_at(normal_user.id, "Drifting Manor", 45.5, -73.5)
+    assert place.geohash == geo.encode(45.5, -73.5)
+
+    place.update({"latitude": 48.85, "longitude": 2.35})
+    assert place.geohash == geo.encode(48.85, 2.35)
+
+
+def test_get_by_location_ranks_by_true_distance(normal_user):
+    """Test radius search drops box corners and sorts nearest first! 🗺️"""
+    far = _place_at(normal_user.id, "Far Manor", 45.55, -73.5)  # ~5.6 km
+    near = _place_at(normal_user.id, "Near Manor", 45.51, -73.5)  # ~1.1 km
+    # Inside the bounding box, but ~7.8 km away diagonally
+    _place_at(normal_user.id, "Corner Manor", 45.55, -73.57)
+    _place_at(normal_user.id, "Remote Manor", 48.85, 2.35)
+
+    places = Place.get_by_location(45.5, -73.5, 6.0)
+    assert [p.id for p in places] == [near.id, far.id]
+
+    assert Place.get_by_location(45.5, -73.5, 6.0, limit=1) == [near]
+
+
+def test_nearest_returns_k_closest_active(normal_user):
+    """Test kNN expands its rings until the k closest are certain! 🧭"""
+    near = _place_at(normal_user.id, "Near Manor", 45.501, -73.5)
+    mid = _place_at(normal_user.id, "Mid Manor", 45.6, -73.5)
+    far = _place_at(normal_user.id, "Far Manor", 48.85, 2.35)
+    closed = _place_at(normal_user.id, "Closed Manor", 45.5, -73.5)
+    closed.update({"status": "maintenance"})
+
+    assert Place.nearest(45.5, -73.5, k=2) == [near, mid]
+    # More than the realm holds: falls back to a full scan
+    assert Place.nearest(45.5, -73.5, k=5) == [near, mid, far]
@@ -0,0 +1,193 @@
+"""Test module for our composable haunted search! 🔎"""
+
+import pytest
+from sqlalchemy import update
+
+from app import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.place_query import PlaceQuery
+from app.models.placeamenity import PlaceAmenity
+from app.models.review import Review
+
+
+@pytest.fixture
+def catalog(normal_user):
+    """Summon a small catalog of places to search! 🏚️"""
+
+    def place(name, price, guests, kind, lat, lon):
+        return Place(
+            name=name,
+            description="A very haunted test place",
+            owner_id=normal_user.id,
+            price_by_night=price,
+            max_guest=guests,
+            property_type=kind,
+            latitude=lat,
+            longitude=lon,
+        ).save()
+
+    places = {
+        "cheap": place("Cheap Shack", 40.0, 2, "house", 45.50, -73.50),
+        "villa": place("Grand Villa", 300.0, 8, "villa", 45.51, -73.51),
+        "flat": place("Cursed Flat", 120.0, 4, "apartment", 45.52, -73.49),
+        "far": place("Far House", 110.0, 6, "house", 48.85, 2.35),
+    }
+    wifi = Amenity(name="Spectral WiFi", description="Fast").save()
+    orb = Amenity(name="Crystal Orb", description="Shiny").save()
+    for key in ("villa", "flat"):
+        PlaceAmenity(place_id=places[key].id, amenity_id=wifi.id).save()
+    PlaceAmenity(place_id=places["villa"].id, amenity_id=orb.id).save()
+    return places, wifi, orb
+
+
+def test_filters_combine(catalog):
+    """Test every filter narrows the same search! 🧩"""
+    places, _, _ = catalog
+
+    found = (
+        PlaceQuery()
+        .price(100, 200)
+        .capacity(4)
+        .within(45.5, -73.5, 10)
+        .all()
+    )
+    assert found == [places["flat"]]
+
+    found = PlaceQuery().property_type("house").order_by("-price").all()
+    assert found == [places["far"], places["cheap"]]
+
+
+def test_amenities_means_has_all(catalog):
+    """Test the amenity filter keeps places offering every one! ✨"""
+    places, wifi, orb = catalog
+
+    assert set(PlaceQuery().amenities([wifi.id]).all()) == {
+        places["villa"],
+        places["flat"],
+    }
+    assert PlaceQuery().amenities([wifi.id, orb.id]).all() == [
+        places["villa"]
+    ]
+
+
+def test_status_and_bbox(catalog):
+    """Test blocked places hide unless asked for, and boxes clip! 📦"""
+    places, _, _ = catalog
+    places["cheap"].update({"status": "blocked"})
+
+    in_box = PlaceQuery().bbox(45.0, -74.0, 46.0, -73.0).all()
+    assert places["cheap"] not in in_box
+    assert len(in_box) == 2
+    assert PlaceQuery().status("blocked").all() == [places["cheap"]]
+
+
+def test_invalid_filters_raise(catalog):
+    """Test unknown values are refused! ⚠️"""
+    with pytest.raises(ValueError):
+        PlaceQuery().property_type("castle")
+    with pytest.raises(ValueError):
+        PlaceQuery().order_by("spookiness")
+    with pytest.raises(ValueError):
+        PlaceQuery().order_by("distance").all()
+    with pytest.raises(ValueError):
+        PlaceQuery().order_by("price").page(10)
+
+
+def test_amenity_bits_are_unique(catalog):
+    """Test each amenity gets its own mask bit! 🔢"""
+    _, wifi, orb = catalog
+    assert {wifi.bit, orb.bit} == {0, 1}
+
+
+def test_mask_follows_links(catalog):
+    """Test links, add_amenity and remove_amenity keep the mask right! 💡"""
+    places, wifi, orb = catalog
+    assert places["villa"].amenity_mask == wifi.mask | orb.mask
+    assert places["cheap"].amenity_mask == 0
+
+    places["cheap"].add_amenity(orb)
+    assert places["cheap"].amenity_mask == orb.mask
+    places["villa"].remove_amenity(wifi)
+    assert places["villa"].amenity_mask == orb.mask
+
+    assert set(PlaceQuery().amenities([orb.id]).all()) == {
+        places["villa"],
+        places["cheap"],
+    }
+
+
+def test_hard_deleted_amenity_leaves_masks(catalog):
+    """Test a banished amenity frees its bit in every mask! 🧹"""
+    places, wifi, orb = catalog
+    orb.hard_delete()
+    assert places["villa"].amenity_mask == wifi.mask
+
+
+def test_banished_bit_is_reused(catalog):
+    """Test a new amenity takes the lowest free bit, on clean masks! ♻️"""
+    places, wifi, orb = catalog
+    freed = wifi.bit
+    wifi.hard_delete()
+    candle = Amenity(name="Black Candle", description="Smoky").save()
+    assert candle.bit == freed
+    assert PlaceQuery().amenities([candle.id]).all() == []
+    assert Amenity(name="Old Mirror", description="Empty").save().bit == 2
+
+
+def test_rebuild_amenity_masks(catalog):
+    """Test masks are rebuilt from the link table! 🔧"""
+    places, wifi, orb = catalog
+    db.session.execute(update(Place).values(amenity_mask=0))
+    db.session.execute(update(Amenity).values(bit=None))
+    db.session.commit()
+
+    assert Place.rebuild_amenity_masks() == 2
+    assert places["flat"].amenity_mask == wifi.mask
+    assert PlaceQuery().amenities([wifi.id, orb.id]).all() == [
+        places["villa"]
+    ]
+
+
+def test_sort_and_filter_by_rating(catalog, reviewer):
+    """Test top-rated places come first without scanning reviews! ⭐"""
+    places, _, _ = catalog
+    for key, rating in [("villa", 5), ("flat", 3)]:
+        Review(
+            place_id=places[key].id,
+            user_id=reviewer.id,
+            text="Spooky and comfortable!",
+            rating=rating,
+        ).save()
+
+    top = PlaceQuery().order_by("-rating").limit(2).all()
+    assert top == [places["villa"], places["flat"]]
+    assert PlaceQuery().min_rating(4).all() == [places["villa"]]
+    assert places["villa"].to_dict()["rating_avg"] == 5.0
+
+
+def test_amenity_mask_cannot_be_forged(catalog, client, user_headers):
+    """Test a client-sent mask is ignored on create, refused on update! 🎭"""
+    places, wifi, orb = catalog
+    response = client.post(
+        "/api/v1/places",
+        json={
+            "name": "Masked Manor",
+            "description": "A very haunted test place",
+            "number_rooms": 1,
+            "number_bathrooms": 1,
+            "max_guest": 2,
+            "price_by_night": 90.0,
+            "owner_id": places["cheap"].owner_id,
+            "amenity_mask": -1,
+        },
+        headers=user_headers,
+    )
+    assert response.status_code == 201
+    forged = Place.get_by_id(response.json["id"])
+    assert forged.amenity_mask == 0
+    assert forged not in PlaceQuery().amenities([wifi.id, orb.id]).all()
+
+    with pytest.raises(ValueError, match="protected"):
+        places["cheap"].update({"amenity_mask": -1})
+    assert places["cheap"] not in PlaceQuery().amenities([wifi.id]).all()
@@ -0,0 +1,90 @@
+"""Test module for our haunted Review model! 📝"""
+
+import pytest
+from sqlalchemy import update
+
+from app import db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+
+
+@pytest.fixture
+def rated_place(normal_user):
+    """Summon a place with an empty guestbook! 🏚️"""
+    return Place(
+        name="Rated Manor",
+        description="A very haunted test place",
+        owner_id=normal_user.id,
+        price_by_night=100.0,
+    ).save()
+
+
+def _ghost(name):
+    return User(
+        username=name,
+        email=f"{name}@test.com",
+        password="Ghost123!",
+        first_name="Ghost",
+        last_name=name.title(),
+    ).save()
+
+
+def _review(place, name, rating):
+    return Review(
+        place_id=place.id,
+        user_id=_ghost(name).id,
+        text="Spooky and comfortable!",
+        rating=rating,
+    ).save()
+
+
+def _aggregates(place):
+    db.session.refresh(place)
+    return place.review_count, place.rating_sum, place.rating_avg
+
+
+def test_new_reviews_feed_the_aggregates(rated_place):
+    """Test creating reviews counts them on the place! ⭐"""
+    assert _aggregates(rated_place) == (0, 0, None)
+
+    _review(rated_place, "casper", 5)
+    _review(rated_place, "boo", 2)
+    assert _aggregates(rated_place) == (2, 7, 3.5)
+
+
+def test_update_and_soft_delete_adjust_aggregates(rated_place):
+    """Test edits move the points and soft deletes drop the review! 🔄"""
+    review = _review(rated_place, "casper", 5)
+    _review(rated_place, "boo", 3)
+
+    review.update({"rating": 1})
+    assert _aggregates(rated_place) == (2, 4, 2.0)
+
+    review.delete()
+    assert _aggregates(rated_place) == (1, 3, 3.0)
+
+
+def test_anonymize_and_hard_delete(rated_place):
+    """Test anonymized reviews still count, banished ones do not! 🎭"""
+    review = _review(rated_place, "casper", 4)
+
+    review.anonymize()
+    assert _aggregates(rated_place) == (1, 4, 4.0)
+
+    review.hard_delete()
+    assert _aggregates(rated_place) == (0, 0, None)
+
+
+def test_rebuild_ratings_command(app, rated_place):
+    """Test the CLI recounts aggregates from the reviews! 🔧"""
+    _review(rated_place, "casper", 5)
+    _review(rated_place, "boo", 4)
+    db.session.execute(
+        update(Place).values(review_count=0, rating_sum=0, rating_avg=None)
+    )
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["rebuild-ratings"])
+    assert "rebuilt" in result.output
+    assert _aggregates(rated_place) == (2, 9, 4.5)
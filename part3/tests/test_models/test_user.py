@@ -124,6 +124,28 @@ def test_invalid_passwords(app, valid_user_data, password, error):
             User(**valid_user_data)
 
 
+# Tests import avec hash déjà calculé
+def test_from_import_keeps_the_hash(app, valid_user_data):
+    """Test imports keep a bcrypt hash, the constructor never takes one! 📥"""
+    secret = valid_user_data.pop("password")
+    password_hash = bcrypt.generate_password_hash(secret, rounds=4).decode()
+
+    user = User.from_import(password_hash=password_hash, **valid_user_data)
+    assert user.password_hash == password_hash
+    assert user.check_password(secret)
+
+    with pytest.raises(ValueError, match="bcrypt"):
+        User.from_import(password_hash="plain-text", **valid_user_data)
+    with pytest.raises(TypeError):
+        User(password_hash=password_hash, **valid_user_data)
+    with pytest.raises(TypeError):
+        User.from_import(
+            password_hash=password_hash,
+            username="Casper_bis",
+            email="bis@ghost.com",
+        )
+
+
 # Tests gestion du compte
 def test_delete_user(app, valid_user_data):
     """Test deleting an existing user! ⚰️"""
@@ -0,0 +1,130 @@
+"""Test module for our haunted identity cache! 🧠"""
+
+import pytest
+from flask import g
+from sqlalchemy import event
+
+from app import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.persistence.cache import identity_cache, query_cache
+
+
+@pytest.fixture
+def amenity_id(app):
+    """Summon a cached-to-be amenity, in a request of its own! 🎭"""
+    identity_cache.clear()
+    amenity_id = (
+        Amenity(name="Crystal Ball", description="See beyond").save().id
+    )
+    _new_request()
+    return amenity_id
+
+
+@pytest.fixture
+def count_queries(app):
+    """Count the SQL statements sent to the database! 🧮"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _new_request():
+    """Pretend a brand new request just started! 🚪"""
+    g.pop("haunted_identity_map", None)
+    db.session.remove()
+
+
+def test_same_request_hits_identity_map(amenity_id, count_queries):
+    """Test the second lookup of a request is free! 📌"""
+    first = Amenity.get_by_id(amenity_id)
+    count_queries.clear()
+    assert Amenity.get_by_id(amenity_id) is first
+    assert count_queries == []
+
+
+def test_next_request_hits_process_cache(amenity_id, count_queries):
+    """Test another request gets a snapshot without SQL! 🏰"""
+    Amenity.get_by_id(amenity_id)
+    _new_request()
+    count_queries.clear()
+
+    cached = Amenity.get_by_id(amenity_id)
+    assert cached.name == "Crystal Ball"
+    assert cached in db.session
+    assert count_queries == []
+
+
+def test_update_invalidates(amenity_id):
+    """Test a saved change is never hidden by the cache! ⚡"""
+    Amenity.get_by_id(amenity_id).update({"name": "Tarot Deck"})
+    _new_request()
+    assert Amenity.get_by_id(amenity_id).name == "Tarot Deck"
+
+
+def test_direct_commit_invalidates(amenity_id):
+    """Test writes bypassing the repository are caught too! 🕵️"""
+    Amenity.get_by_id(amenity_id)
+    _new_request()
+    loaded = Amenity.get_by_id(amenity_id)
+    loaded.description = "See far beyond"
+    db.session.commit()
+    _new_request()
+    assert Amenity.get_by_id(amenity_id).description == "See far beyond"
+
+
+def test_hard_delete_invalidates(amenity_id):
+    """Test a banished entity stays banished! ⚰️"""
+    Amenity.get_by_id(amenity_id).hard_delete()
+    _new_request()
+    assert Amenity.get_by_id(amenity_id) is None
+
+
+def test_load_racing_a_write_is_not_shared(amenity_id, count_queries):
+    """Test a row loaded before a concurrent write stays off the shelf! 🏁"""
+    generation = identity_cache.generation(Amenity)
+    loaded = db.session.get(Amenity, amenity_id)
+    identity_cache.invalidate("Amenity", amenity_id)  # Écriture concurrente
+    identity_cache.put(Amenity, loaded, generation)
+    assert Amenity.get_by_id(amenity_id) is loaded  # Cette requête seulement
+
+    _new_request()
+    count_queries.clear()
+    Amenity.get_by_id(amenity_id)
+    assert len(count_queries) == 1
+
+
+def test_mid_flush_core_writes_invalidate_again_at_commit(
+    app, normal_user, other_user
+):
+    """Test readers between flush and commit cannot keep old ratings! ⭐"""
+    place = Place(
+        name="Rated Manor",
+        description="A very haunted test place",
+        owner_id=normal_user.id,
+        price_by_night=80.0,
+    ).save()
+    place_id, author_id = place.id, other_user.id
+    _new_request()
+    db.session.add(
+        Review(
+            place_id=place_id,
+            user_id=author_id,
+            text="Spooky and comfortable!",
+            rating="5",
+        )
+    )
+    db.session.flush()  # adjust_ratings écrit la place en SQL brut
+
+    # Jetons lus par un lecteur qui voit encore l'ancien agrégat
+    generation = identity_cache.generation(Place)
+    version = query_cache.version("place")
+    db.session.commit()
+    assert identity_cache.generation(Place) > generation
+    assert query_cache.version("place") > version
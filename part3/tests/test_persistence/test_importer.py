@@ -0,0 +1,230 @@
+"""Tests for the streaming bulk import! 📥"""
+
+import json
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.placeamenity import PlaceAmenity
+from app.models.review import Review
+from app.models.user import User
+from app.persistence import importer
+
+HASH = "$2b$04$" + "a" * 53
+
+
+def _ndjson(path, rows):
+    """Write rows, one JSON document per line! 📜"""
+    path.write_text("".join(f"{json.dumps(row)}\n" for row in rows))
+    return str(path)
+
+
+def _ghost(i):
+    """A user row with a ready-made hash (no bcrypt cost)! 👻"""
+    return {
+        "username": f"ghost_{i}",
+        "email": f"ghost{i}@haunted.io",
+        "password_hash": HASH,
+        "first_name": "Bulk",
+        "last_name": "Ghost",
+    }
+
+
+def test_sql_statements_respect_literals_and_triggers(tmp_path):
+    """Semicolons in strings and trigger bodies don't split 📜"""
+    script = tmp_path / "script.sql"
+    script.write_text(
+        "-- header\n"
+        "INSERT INTO t VALUES ('a;b');\n"
+        "CREATE TRIGGER tr AFTER INSERT ON t BEGIN\n"
+        "  DELETE FROM u; DELETE FROM v;\n"
+        "END;\n"
+        "-- trailing comment\n"
+    )
+    statements = list(importer.sql_statements(str(script)))
+    assert len(statements) == 2
+    assert statements[0].endswith("VALUES ('a;b');")
+    assert "DELETE FROM v;\nEND;" in statements[1]
+
+
+def test_import_validates_rows_in_chunks(app, tmp_path):
+    """Valid rows land, bad ones are reported by line ⚠️"""
+    rows = [_ghost(i) for i in range(5)]
+    rows[1]["email"] = "not-an-email"
+    rows[3] = _ghost(0)  # Doublon : contrainte UNIQUE
+    path = _ndjson(tmp_path / "users.ndjson", rows)
+
+    report = importer.import_file("users", path, chunk_size=2)
+    assert (report.read, report.inserted) == (5, 3)
+    assert [number for number, _ in report.errors] == [2, 4]
+    assert "email" in report.errors[0][1]
+    assert User.find_by(username="ghost_4").password_hash == HASH
+    assert not (tmp_path / "users.ndjson.progress").exists()
+
+
+def test_csv_import_and_derived_columns(app, tmp_path, normal_user):
+    """CSV cells are typed, geohash, bits and ratings are rebuilt 🔧"""
+    places = tmp_path / "places.csv"
+    places.write_text(
+        "id,name,description,owner_id,price_by_night,latitude,longitude,"
+        "max_guest\n"
+        f"p1,Bulk Manor,A very haunted place,{normal_user.id},120.5,"
+        "48.85,2.35,4\n"
+    )
+    amenities = _ndjson(
+        tmp_path / "amenities.ndjson",
+        [{"id": "a1", "name": "Ectoplasm", "description": "Slimy"}],
+    )
+    links = _ndjson(
+        tmp_path / "links.ndjson", [{"place_id": "p1", "amenity_id": "a1"}]
+    )
+    result = app.test_cli_runner().invoke(
+        args=["import-data", "--links", links, "--places", str(places)]
+        + ["--amenities", amenities]
+    )
+    assert result.exit_code == 0, result.output
+    assert "rows/s" in result.output
+    assert PlaceAmenity.find_by(place_id="p1") is not None
+
+    db.session.expire_all()
+    place = Place.get_by_id("p1")
+    assert place.price_by_night == 120.5 and place.max_guest == 4
+    assert place.geohash
+    assert place.amenity_mask == Amenity.get_by_id("a1").mask
+
+
+def test_import_resumes_after_a_failure(
+    app, tmp_path, other_user, monkeypatch
+):
+    """A crash keeps committed chunks; --resume skips them 🔁"""
+    place = Place(
+        name="Resume Manor",
+        description="A very haunted place",
+        owner_id=other_user.id,
+        price_by_night=90.0,
+    ).save()
+    reviewers = [User.from_import(**_ghost(i)) for i in range(4)]
+    User.save_many(reviewers)
+    rows = [
+        {
+            "place_id": place.id,
+            "user_id": user.id,
+            "text": "Spooky and comfortable!",
+            "rating": "4",
+        }
+        for user in reviewers
+    ]
+    path = _ndjson(tmp_path / "reviews.ndjson", rows)
+
+    calls = []
+    original = importer._insert
+
+    def crash_on_second_chunk(table, rows, report):
+        calls.append(len(rows))
+        if len(calls) == 2:
+            raise RuntimeError("disk full")
+        original(table, rows, report)
+
+    monkeypatch.setattr(importer, "_insert", crash_on_second_chunk)
+    with pytest.raises(RuntimeError):
+        importer.import_file("reviews", path, chunk_size=2)
+    monkeypatch.undo()
+    assert importer.read_checkpoint(path) == 2
+    assert Review.query.count() == 2
+
+    result = app.test_cli_runner().invoke(
+        args=["import-data", "--reviews", path, "--chunk-size", "2"]
+        + ["--resume"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "2 inserted, 0 rejected, 2 skipped" in result.output
+    assert Review.query.count() == 4
+    db.session.expire_all()
+    assert Place.get_by_id(place.id).review_count == 4
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_import_rejects_a_repeated_review(
+    app, normal_user, other_user, validate
+):
+    """Same ghost, same place, same run: only the first row lands 🚫"""
+    place = Place(
+        name="Twice Manor",
+        description="A very haunted place",
+        owner_id=other_user.id,
+        price_by_night=90.0,
+    ).save()
+    row = {
+        "place_id": place.id,
+        "user_id": normal_user.id,
+        "text": "Spooky and comfortable!",
+        "rating": "4",
+    }
+    report = importer.import_rows(
+        "reviews", [(1, dict(row)), (2, dict(row))], validate=validate
+    )
+    assert (report.read, report.inserted) == (2, 1)
+    assert [number for number, _ in report.errors] == [2]
+    assert "Duplicate" in report.errors[0][1]
+    assert Review.query.count() == 1
+
+
+def test_import_needs_a_file(app):
+    """No file, no import 🚫"""
+    result = app.test_cli_runner().invoke(args=["import-data"])
+    assert result.exit_code != 0
+
+
+def test_import_checks_a_chunk_in_a_few_queries(
+    app, normal_user, other_user
+):
+    """References are fetched per chunk, never per row 📦"""
+    places = [
+        Place(
+            name=f"Chunk Manor {i}",
+            description="A very haunted place",
+            owner_id=other_user.id,
+            price_by_night=90.0,
+        ).save()
+        for i in range(6)
+    ]
+    Review(
+        place_id=places[0].id,
+        user_id=normal_user.id,
+        text="Already been there!",
+        rating="3",
+    ).save()
+    rows = [
+        {
+            "place_id": place.id,
+            "user_id": normal_user.id,
+            "text": "Spooky and comfortable!",
+            "rating": "4",
+        }
+        for place in places
+    ]
+    rows += [
+        dict(rows[1], user_id=other_user.id),
+        dict(rows[1], place_id="no-such-place"),
+    ]
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    report = importer.import_rows("reviews", enumerate(rows, start=1))
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+    assert report.inserted == 5
+    assert dict(report.errors) == {
+        1: "User already reviewed this place!",
+        7: "Cannot review your own place",
+        8: "Invalid place_id: no-such-place does not exist!",
+    }
+    selects = [s for s in statements if s.lstrip().startswith("SELECT")]
+    # Lieux, auteurs, critiques existantes : une requête chacun
+    assert len(selects) == 3
@@ -0,0 +1,100 @@
+"""Test module for our haunted query cache! 📚"""
+
+import pytest
+from flask import g
+from sqlalchemy import event
+
+from app import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.placeamenity import PlaceAmenity
+from app.persistence.cache import MISSING, query_cache
+from app.services.facade import HBnBFacade
+
+facade = HBnBFacade()
+
+
+@pytest.fixture
+def count_queries(app):
+    """Count the SQL statements sent to the database! 🧮"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _new_request():
+    """Pretend a brand new request just started! 🚪"""
+    g.pop("haunted_identity_map", None)
+    db.session.remove()
+
+
+def test_repeated_find_is_served_from_cache(app, count_queries):
+    """Test the same find twice only reaches the database once! 🔁"""
+    Amenity(name="Candle", description="Flickers").save()
+    _new_request()
+    facade.find(Amenity, category="supernatural")
+    _new_request()
+
+    count_queries.clear()
+    before = query_cache.stats()["hits"]
+    amenities = facade.find(Amenity, category="supernatural")
+
+    assert [a.name for a in amenities] == ["Candle"]
+    assert count_queries == []
+    assert query_cache.stats()["hits"] == before + 1
+
+
+def test_write_bumps_table_version(app):
+    """Test a new row shows up right away! ⚡"""
+    Amenity(name="Candle", description="Flickers").save()
+    assert len(facade.find(Amenity)) == 1
+    version = query_cache.version("amenity")
+
+    Amenity(name="Mirror", description="Shows nobody").save()
+    assert query_cache.version("amenity") > version
+    assert len(facade.find(Amenity)) == 2
+
+
+def test_association_writes_invalidate_links(app, normal_user):
+    """Test Place.add_amenity invalidates the placeamenity queries! 🔗"""
+    place = Place(
+        name="Linked Manor",
+        description="A very haunted test place",
+        owner_id=normal_user.id,
+        price_by_night=80.0,
+    ).save()
+    amenity = Amenity(name="Candle", description="Flickers").save()
+    assert facade.find(PlaceAmenity, place_id=place.id) == []
+
+    place.add_amenity(amenity)
+    assert len(facade.find(PlaceAmenity, place_id=place.id)) == 1
+
+
+def test_unhashable_criteria_are_not_cached(app):
+    """Test SQL expressions never become cache keys! 🚫"""
+    assert query_cache.key(Place, "many", {"filters": [1, 2]}) is None
+
+
+def test_write_during_query_is_not_cached(app):
+    """Test a result computed across a write is never stored! 🏁"""
+    Amenity(name="Candle", description="Flickers").save()
+    _new_request()
+    repo = Amenity._get_repo()
+
+    def racing_query():
+        result = Amenity.query.all()
+        query_cache.bump("amenity")  # Un autre écrivain passe
+        return result
+
+    repo._cached("many", {"racing": True}, racing_query)
+    key = query_cache.key(Amenity, "many", {"racing": True})
+    assert query_cache.get(key) is MISSING
+
+    _new_request()
+    repo._cached("many", {"racing": True}, Amenity.query.all)
+    assert query_cache.get(key) is not MISSING
@@ -0,0 +1,80 @@
+"""Test module for our haunted full-text search! 🔍"""
+
+import pytest
+from sqlalchemy import text
+
+from app import db
+from app.models.place import Place
+from app.models.place_query import PlaceQuery
+from app.persistence import search
+
+
+def _place(owner_id, name, description, city="Salem", price=100.0):
+    return Place(
+        name=name,
+        description=description,
+        owner_id=owner_id,
+        price_by_night=price,
+        city=city,
+    ).save()
+
+
+def test_match_expression_is_safe():
+    """Test user input cannot smuggle FTS5 operators! 🛡️"""
+    assert search.match_expression('haunted OR "manor') == (
+        '"haunted" "OR" "manor"*'
+    )
+    with pytest.raises(ValueError):
+        search.match_expression("  ?! ")
+
+
+def test_offset_cursor_round_trip():
+    """Test search cursors seal and unseal offsets! 🔒"""
+    assert search.decode_offset(search.encode_offset(40)) == 40
+    assert search.decode_offset(None) == 0
+    with pytest.raises(ValueError):
+        search.decode_offset("not-a-cursor")
+
+
+def test_search_ranks_and_follows_writes(normal_user):
+    """Test BM25 ranking, snippets, and trigger-synced updates! 🎯"""
+    manor = _place(
+        normal_user.id, "Haunted Manor", "Creaky floors and cold rooms"
+    )
+    cabin = _place(
+        normal_user.id, "Lake Cabin", "A quiet cabin, slightly haunted"
+    )
+    _place(normal_user.id, "Sunny Loft", "Bright and cheerful, no ghosts")
+
+    hits = search.search_places("haunt")
+    assert [hit.place for hit in hits] == [manor, cabin]  # Names weigh more
+    assert "<mark>" in hits[1].snippet
+
+    cabin.update({"description": "A quiet cabin by the water"})
+    assert [hit.place for hit in search.search_places("haunted")] == [manor]
+
+    manor.hard_delete()
+    assert search.search_places("haunted") == []
+
+
+def test_search_combines_with_filters(normal_user):
+    """Test text search runs under the other place filters! 🧩"""
+    _place(normal_user.id, "Haunted Manor", "Very spooky", price=300.0)
+    cheap = _place(normal_user.id, "Haunted Shack", "Spooky too", price=50.0)
+
+    hits = PlaceQuery().price(max_price=100).matching("spooky").search()
+    assert [hit.place for hit in hits] == [cheap]
+
+
+def test_rebuild_reindexes_places(app, normal_user):
+    """Test the rebuild command restores a lost index! 🔧"""
+    _place(normal_user.id, "Haunted Manor", "Very spooky")
+    db.session.execute(
+        text("INSERT INTO place_fts(place_fts) VALUES ('delete-all')")
+    )
+    db.session.commit()
+    assert search.search_places("spooky") == []
+
+    result = app.test_cli_runner().invoke(args=["rebuild-search"])
+    assert "rebuilt" in result.output
+    assert len(search.search_places("spooky")) == 1
@@ -0,0 +1,56 @@
+"""Test module for our haunted repository! 👻"""
+
+import pytest
+
+from app.models.amenity import Amenity
+from app.persistence.repository import (
+    SQLAlchemyRepository,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.fixture
+def amenities(app):
+    """Summon a handful of amenities! 🎭"""
+    return [
+        Amenity(name=f"Feature {i}", description="A spooky feature").save()
+        for i in range(5)
+    ]
+
+
+def test_get_page_walks_every_row_once(amenities):
+    """Test keyset pagination covers the table without duplicates! 📜"""
+    repo = SQLAlchemyRepository(Amenity)
+    seen, cursor = [], None
+    while True:
+        page = repo.get_page(2, cursor=cursor)
+        seen.extend(a.id for a in page)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert len(seen) == 5
+    assert set(seen) == {a.id for a in amenities}
+
+
+def test_get_page_last_page_has_no_cursor(amenities):
+    """Test a page holding the remaining rows has no next_cursor! 🔚"""
+    page = SQLAlchemyRepository(Amenity).get_page(5)
+    assert len(page) == 5
+    assert page.next_cursor is None
+
+
+def test_cursor_round_trip(amenities):
+    """Test the cursor hides (created_at, id) and gives it back! 🔒"""
+    amenity = amenities[0]
+    created_at, obj_id = decode_cursor(encode_cursor(amenity))
+    assert obj_id == amenity.id
+    assert created_at.replace(tzinfo=None) == amenity.created_at.replace(
+        tzinfo=None
+    )
+
+
+def test_invalid_cursor(app):
+    """Test a forged cursor is rejected! 🚫"""
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        SQLAlchemyRepository(Amenity).get_page(2, cursor="not-a-cursor")
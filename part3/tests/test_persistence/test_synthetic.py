@@ -0,0 +1,96 @@
+"""Tests for the synthetic data generator! 🎲"""
+
+from statistics import median
+
+from app import db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.persistence import synthetic
+
+HASH = "$2b$04$" + "a" * 53
+
+
+def _realm(seed=0):
+    """Every row of a small realm, as lists! 📋"""
+    shape = synthetic.Shape(
+        users=50, places=200, reviews_per_place=3, amenities=5, seed=seed
+    )
+    owner_of = synthetic.owners(shape)
+    counts = synthetic.review_counts(shape)
+    return {
+        "users": list(synthetic.users(shape, HASH)),
+        "places": list(synthetic.places(shape, owner_of)),
+        "reviews": list(synthetic.reviews(shape, owner_of, counts)),
+        "links": list(synthetic.links(shape)),
+    }
+
+
+def test_same_seed_same_realm():
+    """The seed alone decides every row 🎲"""
+    assert _realm(seed=1) == _realm(seed=1)
+    assert _realm(seed=1)["places"] != _realm(seed=2)["places"]
+
+
+def test_distributions_are_skewed():
+    """Hotspots, log-normal prices and Zipfian reviews 📉"""
+    realm = _realm()
+    places = [row for _, row in realm["places"]]
+    prices = [place["price_by_night"] for place in places]
+    assert min(prices) >= 10 and median(prices) < sum(prices) / len(prices)
+
+    near_a_city = [
+        place
+        for place in places
+        if any(
+            abs(place["latitude"] - lat) < 1
+            and abs(place["longitude"] - lon) < 1
+            for lat, lon, _, _ in synthetic.CLUSTERS
+        )
+    ]
+    assert len(near_a_city) == len(places)
+
+    per_place = {}
+    for _, review in realm["reviews"]:
+        per_place[review["place_id"]] = (
+            per_place.get(review["place_id"], 0) + 1
+        )
+    busiest = sorted(per_place.values(), reverse=True)
+    assert busiest[0] > 5 * median(busiest)  # Longue traîne
+
+
+def test_reviews_respect_the_rules():
+    """Nobody reviews their own place, nor the same place twice ⚖️"""
+    realm = _realm()
+    owner = {row["id"]: row["owner_id"] for _, row in realm["places"]}
+    seen = set()
+    for _, review in realm["reviews"]:
+        assert review["user_id"] != owner[review["place_id"]]
+        pair = (review["user_id"], review["place_id"])
+        assert pair not in seen
+        seen.add(pair)
+
+
+def test_gen_data_command(app):
+    """The command fills every table through the bulk path 🏗️"""
+    app.config["BCRYPT_LOG_ROUNDS"] = 4
+    result = app.test_cli_runner().invoke(
+        args=[
+            "gen-data",
+            "--users", "20",
+            "--places", "30",
+            "--reviews-per-place", "2",
+            "--amenities", "4",
+            "--seed", "3",
+        ]  # fmt: skip
+    )
+    assert result.exit_code == 0, result.output
+    assert "0 rejected" in result.output and "rows/s" in result.output
+    assert User.query.count() == 20 and Place.query.count() == 30
+
+    db.session.expire_all()
+    reviewed = Place.find_where(Place.review_count > 0)
+    assert (
+        sum(place.review_count for place in reviewed) == Review.query.count()
+    )
+    assert User.authenticate("ghost0.3@haunted.test", "Haunted123")
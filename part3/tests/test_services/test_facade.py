@@ -0,0 +1,69 @@
+"""Test module for our haunted facade! 🚪"""
+
+import logging
+
+import pytest
+
+from app.models.amenity import Amenity
+from app.services.facade import HBnBFacade
+from app.utils import haunted_logger
+
+facade = HBnBFacade()
+
+
+def _rows(count):
+    """Some amenity rows to summon! 🎭"""
+    return [
+        {"name": f"Feature {i}", "description": "Bulk supernatural"}
+        for i in range(count)
+    ]
+
+
+def test_create_many_in_chunks(app):
+    """Test every valid row is created across several chunks! 📦"""
+    results = facade.create_many(Amenity, _rows(5), chunk_size=2)
+
+    assert [r["status"] for r in results] == ["created"] * 5
+    assert [r["index"] for r in results] == list(range(5))
+    assert len(Amenity.get_all()) == 5
+
+
+def test_create_many_reports_invalid_rows(app):
+    """Test a row failing validation does not stop the others! 💀"""
+    rows = _rows(3)
+    rows[1]["name"] = "Bad!Name"
+    results = facade.create_many(Amenity, rows)
+
+    assert [r["status"] for r in results] == ["created", "error", "created"]
+    assert "Name can only contain" in results[1]["message"]
+    assert len(Amenity.get_all()) == 2
+
+
+def test_create_many_isolates_database_errors(app):
+    """Test a unique violation only rejects the faulty row! 🔒"""
+    rows = _rows(3)
+    rows[2]["name"] = rows[0]["name"]  # Both pass validation, not the DB
+    records = []
+    handler = logging.Handler(logging.ERROR)
+    handler.emit = records.append
+    logger = haunted_logger.loggers["persistence"]
+    logger.addHandler(handler)
+    try:
+        results = facade.create_many(Amenity, rows, chunk_size=10)
+    finally:
+        logger.removeHandler(handler)
+
+    assert [r["status"] for r in results] == ["created", "created", "error"]
+    assert len(Amenity.get_all()) == 2
+    # Ni SQL ni paramètres pour le client, tout reste dans les logs
+    assert results[2]["message"].endswith("constraint violated")
+    assert "INSERT" not in results[2]["message"]
+    assert any(
+        "UNIQUE constraint failed" in record.getMessage() for record in records
+    )
+
+
+def test_create_many_rejects_non_list(app):
+    """Test rows must come as a list! 🚫"""
+    with pytest.raises(ValueError, match="Rows must be a list"):
+        facade.create_many(Amenity, {"name": "Nope"})
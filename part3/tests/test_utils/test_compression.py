@@ -0,0 +1,86 @@
+"""Test module for negotiated response compression! 🗜️"""
+
+import gzip
+
+import pytest
+
+from app.models.place import Place
+
+
+@pytest.fixture
+def catalog(normal_user):
+    """Enough places for a list worth compressing! 🏘️"""
+    for i in range(10):
+        Place(
+            name=f"Manor {'I' * (i + 1)}",
+            description="A very haunted test place",
+            owner_id=normal_user.id,
+            price_by_night=100.0,
+        ).save()
+
+
+def test_gzip_when_asked(client, catalog):
+    """Large JSON is gzipped for clients accepting it 📦"""
+    plain = client.get("/api/v1/places/")
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers["Vary"]
+
+    squeezed = client.get(
+        "/api/v1/places/", headers={"Accept-Encoding": "gzip"}
+    )
+    assert squeezed.headers["Content-Encoding"] == "gzip"
+    assert len(squeezed.data) < len(plain.data)
+    assert gzip.decompress(squeezed.data) == plain.data
+
+
+def test_etag_turns_weak_and_still_validates(client, catalog):
+    """Compressed bytes keep a weak tag that still earns 304s 🏷️"""
+    headers = {"Accept-Encoding": "gzip"}
+    response = client.get("/api/v1/places/", headers=headers)
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get(
+        "/api/v1/places/", headers={**headers, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert "Content-Encoding" not in cached.headers
+
+
+def test_small_or_refused_bodies_stay_plain(client, catalog):
+    """Tiny bodies and identity-only clients are left alone 🪶"""
+    missing = client.get(
+        "/api/v1/places/nonexistent-id", headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in missing.headers
+
+    refused = client.get(
+        "/api/v1/places/", headers={"Accept-Encoding": "gzip;q=0"}
+    )
+    assert "Content-Encoding" not in refused.headers
+
+
+def test_unknown_codecs_are_skipped(client, catalog):
+    """Codecs we cannot speak are passed over for one we can 🥇"""
+    response = client.get(
+        "/api/v1/places/", headers={"Accept-Encoding": "deflate, gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+@pytest.mark.parametrize(
+    "codec, module", [("zstd", "zstandard"), ("br", "brotli")]
+)
+def test_optional_codecs(client, catalog, codec, module):
+    """Each optional codec, when installed, round-trips the body 🧪"""
+    library = pytest.importorskip(module)
+    plain = client.get("/api/v1/places/")
+    squeezed = client.get(
+        "/api/v1/places/", headers={"Accept-Encoding": codec}
+    )
+    assert squeezed.headers["Content-Encoding"] == codec
+    if codec == "zstd":
+        data = library.ZstdDecompressor().decompress(squeezed.data)
+    else:
+        data = library.decompress(squeezed.data)
+    assert data == plain.data
@@ -0,0 +1,54 @@
+"""Test module for our haunted geohash helpers! 🗺️"""
+
+import pytest
+
+from app.utils import geo
+
+
+def test_encode_known_geohash():
+    """Test the textbook example lands in the right cell! 🎯"""
+    assert geo.encode(42.6, -5.6, 5) == "ezs42"
+    assert geo.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_bounds_contain_the_point():
+    """Test a cell's box holds the point it was built from! 📦"""
+    lat_min, lat_max, lon_min, lon_max = geo.bounds(geo.encode(48.85, 2.35))
+    assert lat_min <= 48.85 <= lat_max
+    assert lon_min <= 2.35 <= lon_max
+
+
+def test_neighbours_wrap_at_antimeridian():
+    """Test the east neighbour of a far-east cell is far west! 🧭"""
+    cells = geo.neighbours(geo.encode(0.0, 179.99, 4))
+    assert len(cells) == 8
+    assert any(geo.bounds(cell)[2] == -180.0 for cell in cells)
+
+
+def test_haversine_paris_london():
+    """Test the great-circle distance between two haunted capitals! 📐"""
+    distance = geo.haversine(48.8566, 2.3522, 51.5074, -0.1278)
+    assert distance == pytest.approx(343.5, abs=1.0)
+
+
+def test_cover_contains_the_whole_circle():
+    """Test points on the circle edge fall in a covering cell! 🕸️"""
+    cells = geo.cover(45.5, -73.5, 10.0)
+    edge_points = [(45.5 + 0.089, -73.5), (45.5, -73.5 + 0.127)]
+    for lat, lon in edge_points:
+        assert geo.haversine(45.5, -73.5, lat, lon) < 10.0
+        assert any(geo.encode(lat, lon).startswith(c) for c in cells)
+
+
+def test_cover_gives_up_on_huge_circles():
+    """Test a circle larger than the coarsest cells means a full scan! 🌍"""
+    assert geo.cover(0.0, 0.0, 8000.0) is None
+    assert geo.cover(89.9, 0.0, 50.0) is None
+
+
+def test_rings_grow_from_fine_to_coarse():
+    """Test each ring is sure to cover a wider radius! 🌀"""
+    radii = [radius for _, radius in geo.rings(45.5, -73.5)]
+    assert len(radii) == geo.PRECISION
+    assert radii == sorted(radii)
+    assert radii[0] < 0.01 < 1000 < radii[-1]
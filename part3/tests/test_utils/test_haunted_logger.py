@@ -0,0 +1,93 @@
+"""Test module for our haunted logger! 📖"""
+
+from logging.handlers import QueueHandler
+
+import pytest
+
+from app.utils.haunted_logger import HauntedLogger
+
+
+class Spy:
+    """A spirit that tells us when it is rendered! 🕵️"""
+
+    rendered = 0
+
+    def __repr__(self):
+        Spy.rendered += 1
+        return "spy"
+
+
+def test_async_mode_uses_queue_handlers(app):
+    """Test request threads only push on a queue in async mode! 📬"""
+    logger = HauntedLogger()
+    try:
+        logger.setup_logging(async_mode=True)
+        for component_logger in logger.loggers.values():
+            assert all(
+                isinstance(h, QueueHandler) for h in component_logger.handlers
+            )
+        assert len(logger.listeners) == 3
+    finally:
+        logger.stop()
+        logger.setup_logging()
+
+
+def test_arguments_rendered_only_when_emitted(app):
+    """Test disabled levels never pay for str(args)! 💤"""
+    logger = HauntedLogger()
+
+    @logger.log_me(component="persistence")
+    def haunt(spirit):
+        return spirit
+
+    Spy.rendered = 0
+    logger.configure(levels={"persistence": "ERROR"})
+    try:
+        haunt(Spy())
+        assert Spy.rendered == 0
+
+        logger.configure(levels={"persistence": "DEBUG"})
+        haunt(Spy())
+        assert Spy.rendered > 0
+    finally:
+        logger.setup_logging()
+
+
+def test_muted_component_is_a_passthrough(app):
+    """Test OFF skips the logger entirely, even on errors! 🔇"""
+    logger = HauntedLogger()
+    logger.configure(levels={"persistence": "OFF"})
+
+    @logger.log_me(component="persistence")
+    def haunt(spirit):
+        return spirit
+
+    logger.loggers = {}  # Any logger access would now blow up
+    try:
+        assert haunt("boo") == "boo"
+    finally:
+        logger.setup_logging()
+
+
+def test_sampling_skips_verbose_records(app):
+    """Test a 0 sampling rate keeps only the errors! 🎲"""
+    logger = HauntedLogger()
+
+    @logger.log_me(component="business")
+    def haunt(spirit):
+        return spirit
+
+    logger.configure(sampling={haunt.__qualname__: 0})
+    Spy.rendered = 0
+    try:
+        haunt(Spy())
+        assert Spy.rendered == 0
+    finally:
+        logger.setup_logging()
+
+
+def test_configure_rejects_unknown_level(app):
+    """Test typos in the config are caught early! 🚫"""
+    logger = HauntedLogger()
+    with pytest.raises(ValueError, match="Unknown log level"):
+        logger.configure(levels={"api": "LOUD"})
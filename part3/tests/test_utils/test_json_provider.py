@@ -0,0 +1,95 @@
+"""Test module for our fast JSON provider! ⚡"""
+
+from datetime import datetime, timezone
+from enum import Enum
+
+import pytest
+
+from app.models.place import Place
+from app.utils import json_provider
+from app.utils.json_provider import HauntedJSONProvider
+
+
+class Mood(str, Enum):
+    GLOOMY = "gloomy"
+
+
+PAYLOAD = {
+    "when": datetime(2024, 10, 31, 23, 59, tzinfo=timezone.utc),
+    "mood": Mood.GLOOMY,
+    "tags": {"spooky"},
+    "name": "Mañoir",
+}
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+def test_engines_agree(app, engine):
+    """Both engines speak datetimes, enums and sets alike 🔮"""
+    if engine == "orjson":
+        pytest.importorskip("orjson")
+    app.config["JSON_ENGINE"] = engine
+    provider = HauntedJSONProvider(app)
+    assert provider.engine == engine
+
+    data = provider.loads(provider.dumps(PAYLOAD))
+    assert data == {
+        "when": "2024-10-31T23:59:00+00:00",
+        "mood": "gloomy",
+        "tags": ["spooky"],
+        "name": "Mañoir",
+    }
+
+
+def test_stdlib_fallback(app, monkeypatch):
+    """Without orjson, auto falls back to the standard library 🐢"""
+    monkeypatch.setattr(json_provider, "orjson", None)
+    assert HauntedJSONProvider(app).engine == "json"
+
+    app.config["JSON_ENGINE"] = "orjson"
+    with pytest.raises(ValueError):
+        HauntedJSONProvider(app)
+
+
+def test_unknown_engine(app):
+    """Typos in JSON_ENGINE fail at startup ⚠️"""
+    app.config["JSON_ENGINE"] = "simdjson"
+    with pytest.raises(ValueError):
+        HauntedJSONProvider(app)
+
+
+def test_api_encodes_entities(client, normal_user):
+    """Raw to_dict payloads, datetimes and all, go through the API 🏚️"""
+    place = Place(
+        name="Json Manor",
+        description="A very haunted test place",
+        owner_id=normal_user.id,
+        price_by_night=100.0,
+    ).save()
+    body = client.application.json.dumps(place.to_dict())
+    assert '"status":"active"' in body
+    assert place.created_at.isoformat() in body
+
+    response = client.get(f"/api/v1/places/{place.id}")
+    assert response.status_code == 200
+    assert response.json["name"] == "Json Manor"
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+def test_api_speaks_each_engine(app, client, normal_user, engine):
+    """The API answers alike whichever engine is forced 🔁"""
+    if engine == "orjson":
+        pytest.importorskip("orjson")
+    app.config["JSON_ENGINE"] = engine
+    app.json = HauntedJSONProvider(app)
+    assert app.json.engine == engine
+
+    place = Place(
+        name="Engine Manor",
+        description="A very haunted test place",
+        owner_id=normal_user.id,
+        price_by_night=100.0,
+    ).save()
+    response = client.get(f"/api/v1/places/{place.id}")
+    assert response.status_code == 200
+    assert response.json["name"] == "Engine Manor"
+    assert response.json["price_by_night"] == 100.0
@@ -0,0 +1,47 @@
+"""Test module for our haunted metrics registry! 📊"""
+
+import pytest
+
+from app.utils.haunted_logger import HauntedLogger
+from app.utils.metrics import HauntedMetrics, haunted_metrics, quantile
+
+
+def test_quantiles_from_buckets():
+    """Test p50/p99 land in the right bucket! 🎯"""
+    stats = HauntedMetrics().stats("business", "haunt")
+    for _ in range(98):
+        stats.observe(0.002)
+    stats.observe(0.3)
+    stats.observe(0.3)
+
+    calls, errors, total, buckets = stats.snapshot()
+    assert calls == 100
+    assert quantile(buckets, calls, 0.5) == 0.0025
+    assert quantile(buckets, calls, 0.99) == 0.5
+
+
+def test_log_me_records_calls_and_errors(app):
+    """Test log_me counts every call, failing ones included! 💀"""
+    logger = HauntedLogger()
+
+    @logger.log_me(component="business")
+    def haunt(spirit):
+        if spirit is None:
+            raise ValueError("No spirit!")
+        return spirit
+
+    haunt("boo")
+    with pytest.raises(ValueError):
+        haunt(None)
+
+    stats = haunted_metrics.stats("business", haunt.__qualname__)
+    calls, errors, _, _ = stats.snapshot()
+    assert (calls, errors) == (2, 1)
+    logger.setup_logging()
+
+
+def test_render_escapes_labels():
+    """Test label values stay valid Prometheus text! 🏷️"""
+    metrics = HauntedMetrics()
+    metrics.stats("api", 'say "boo"').observe(0.01)
+    assert 'function="say \\"boo\\""' in metrics.render()
@@ -0,0 +1,133 @@
+"""Test module for the per-request SQL accounting! 🧮"""
+
+import logging
+
+import pytest
+from flask import Flask
+from sqlalchemy import select
+
+from app import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.placeamenity import PlaceAmenity
+from app.persistence.cache import identity_cache, query_cache
+from app.utils import haunted_logger
+from app.utils.query_stats import RequestQueries, init_query_stats, shape
+from config import ProductionConfig
+
+
+@pytest.fixture
+def furnished(normal_user):
+    """A place with five amenities, caches emptied! 🛋️"""
+    place = Place(
+        name="Ledger Manor",
+        description="A very haunted test place",
+        owner_id=normal_user.id,
+        price_by_night=100.0,
+    ).save()
+    for name in ("Fog", "Chains", "Portrait", "Cauldron", "Bats"):
+        amenity = Amenity(name=name, description="Spooky").save()
+        PlaceAmenity(place_id=place.id, amenity_id=amenity.id).save()
+    db.session.expire_all()
+    identity_cache.clear()
+    query_cache.clear()
+    return place.id
+
+
+@pytest.fixture
+def api_records():
+    """Capture what the api logger writes! 📝"""
+    records = []
+    handler = logging.Handler(logging.DEBUG)
+    handler.emit = records.append
+    logger = haunted_logger.loggers["api"]
+    logger.addHandler(handler)
+    yield records
+    logger.removeHandler(handler)
+
+
+def test_shape_folds_whitespace_and_in_lists():
+    """Same query, same shape, whatever the IN list 🧩"""
+    assert shape("SELECT *\n  FROM t WHERE id IN (?, ?,?)") == shape(
+        "SELECT * FROM t WHERE id IN (?)"
+    )
+    assert shape("SELECT 1 WHERE a = ?") != shape("SELECT 1 WHERE b = ?")
+
+
+def test_repeated_shapes_are_suspects():
+    """A shape past the threshold is an N+1 suspect 🔁"""
+    stats = RequestQueries()
+    for _ in range(3):
+        stats.record("SELECT * FROM amenity WHERE id = ?", 0.001)
+    stats.record("SELECT * FROM place", 0.002)
+    assert stats.count == 4
+    assert stats.seconds == pytest.approx(0.005)
+    assert stats.repeated(3) == [("SELECT * FROM amenity WHERE id = ?", 3)]
+    assert stats.repeated(4) == []
+
+
+def test_headers_count_the_request_statements(client, furnished):
+    """Every response tells its query count and DB time 📨"""
+    response = client.get(f"/api/v1/places/{furnished}")
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Queries"]) >= 1
+    assert float(response.headers["X-DB-Time"]) >= 0
+
+    # Same request, now served by the caches
+    again = client.get(f"/api/v1/places/{furnished}")
+    assert int(again.headers["X-DB-Queries"]) < int(
+        response.headers["X-DB-Queries"]
+    )
+
+
+def test_n_plus_one_is_logged(app, client, furnished, api_records):
+    """One lookup per amenity, in a loop, gets flagged 🐢"""
+
+    @app.route("/_haunted_loop")
+    def haunted_loop():
+        for amenity_id in db.session.scalars(select(Amenity.id)).all():
+            db.session.execute(select(Amenity).where(Amenity.id == amenity_id))
+        return "", 204
+
+    response = client.get("/_haunted_loop")
+    assert response.headers["X-DB-Queries"] == "6"
+    flagged = [
+        record.getMessage()
+        for record in api_records
+        if "N+1 suspects" in record.getMessage()
+    ]
+    assert len(flagged) == 1
+    assert "GET /_haunted_loop ran 6 queries" in flagged[0]
+    assert "5x SELECT amenity" in flagged[0]
+
+
+def test_quiet_requests_are_not_logged(client, furnished, api_records):
+    """Under every threshold, nothing is written 🤫"""
+    client.get(f"/api/v1/places/{furnished}")
+    assert not [r for r in api_records if "🐢" in r.getMessage()]
+
+
+def test_stats_can_be_switched_off(app):
+    """DB_STATS_ENABLED=False adds no hook at all 🔌"""
+    app.config["DB_STATS_ENABLED"] = False
+    before = len(app.after_request_funcs[None])
+    init_query_stats(app)
+    assert len(app.after_request_funcs[None]) == before
+
+
+def test_production_keeps_the_counts_to_itself(api_records):
+    """No X-DB-* headers in production, the log line still speaks 🤐"""
+    assert ProductionConfig.DB_STATS_HEADERS is False
+    app = Flask(__name__)
+    app.config.from_object(ProductionConfig)
+    app.config["DB_QUERY_THRESHOLD"] = -1  # Tout est signalé
+    init_query_stats(app)
+
+    @app.route("/_haunted_quiet")
+    def haunted_quiet():
+        return "", 204
+
+    response = app.test_client().get("/_haunted_quiet")
+    assert "X-DB-Queries" not in response.headers
+    assert "X-DB-Time" not in response.headers
+    assert any("/_haunted_quiet" in r.getMessage() for r in api_records)
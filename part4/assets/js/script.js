@@ -105,121 +105,110 @@ async function handlePlaceDetails() {
     const placeId = urlParams.get('id');
     if (!placeId) return;
 
-    const token = getCookie('token');
     try {
-        const response = await fetch(`http://localhost:5000/api/v1/places/${placeId}`, {
-            headers: {
-                'Authorization': `Bearer ${token}`
-            }
-        });
-        if (response.ok) {
-            const place = await response.json();
-            await displayPlaceDetails(place);
-            setupReviewForm(place);
+        // Une seule requête : place, hôte, équipements et avis avec auteurs
+        const page = await fetchPlacePage(placeId);
+        if (page) {
+            displayPlaceDetails(page, placeId);
+            setupReviewForm(page.place);
         }
     } catch (error) {
         console.error('Error:', error);
     }
 }
 
+// Une page de la fiche d'une place, à partir d'un curseur d'avis
+async function fetchPlacePage(placeId, cursor) {
+    const token = getCookie('token');
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+    const response = await fetch(`http://localhost:5000/api/v1/places/${placeId}/page${query}`, {
+        headers: token ? { 'Authorization': `Bearer ${token}` } : {}
+    });
+    return response.ok ? response.json() : null;
+}
+
+// Nom d'un fantôme, masqué par l'API sans jeton valide
+function ghostName(person, anonymous) {
+    if (!person) return anonymous;
+    if (!person.first_name) return 'You must be logged in to see this name...';
+    return `${person.first_name} ${person.last_name}`;
+}
+
 // Affichage des détails d'une place
-async function displayPlaceDetails(place) {
+function displayPlaceDetails(page, placeId) {
     const placeInfo = document.querySelector('.place-info');
-    const token = getCookie('token');
+    const { place, owner, amenities } = page;
+
+    const host = ghostName(owner, 'You must be logged in to see this name...');
+    const amenityNames = amenities.map(amenity => amenity.name);
 
     placeInfo.innerHTML = `
         <h2>${place.name}</h2>
-        <p><strong>Host:</strong> You must be logged in to see this name...</p>
+        <p><strong>Host:</strong> ${host}</p>
         <p><strong>Price per night:</strong> $${place.price_by_night}</p>
         <p><strong>Description:</strong> ${place.description}</p>
-        <p><strong>Amenities:</strong> ${place.amenities ? place.amenities.join(', ') : 'None'}</p>
+        <p><strong>Amenities:</strong> ${amenityNames.length ? amenityNames.join(', ') : 'None'}</p>
     `;
 
-    // Récupérer les infos du host
-    try {
-        const ownerResponse = await fetch(`http://localhost:5000/api/v1/users/${place.owner_id}`, {
-            headers: {
-                'Authorization': `Bearer ${token}`,
-                'Content-Type': 'application/json'
-            }
-        });
-
-        if (ownerResponse.ok) {
-            const owner = await ownerResponse.json();
-            const hostElement = placeInfo.querySelector('p:nth-child(2)');
-            hostElement.innerHTML = `<strong>Host:</strong> ${owner.first_name} ${owner.last_name}`;
-        }
-    } catch (error) {
-        console.error('Error fetching owner details:', error);
-    }
-
-    // Récupérer les reviews séparément
-    try {
-        const reviewsResponse = await fetch(`http://localhost:5000/api/v1/places/${place.id}/reviews`, {
-            headers: {
-                'Authorization': `Bearer ${token}`,
-                'Content-Type': 'application/json'
-            }
-        });
-
-        if (reviewsResponse.ok) {
-            const reviews = await reviewsResponse.json();
-            displayReviews(reviews);
-        }
-    } catch (error) {
-        console.error('Error fetching reviews:', error);
-        displayReviews([]); // Afficher "No reviews yet!" en cas d'erreur
-    }
+    displayReviews(page.reviews, placeId);
 }
 
-// Affichage des reviews
-async function displayReviews(reviews) {
+// Affichage des reviews, page après page
+function displayReviews(reviews, placeId) {
     const reviewsSection = document.getElementById('reviews');
     if (!reviewsSection) return;
 
-    if (reviews && reviews.length > 0) {
-        const token = getCookie('token');
-        const reviewsWithUserNames = await Promise.all(reviews.map(async review => {
-            try {
-                const userResponse = await fetch(`http://localhost:5000/api/v1/users/${review.user_id}`, {
-                    headers: {
-                        'Authorization': `Bearer ${token}`,
-                        'Content-Type': 'application/json'
-                    }
-                });
+    const items = reviews ? reviews.items : [];
+    if (!items.length) {
+        reviewsSection.innerHTML = '<h2>Reviews</h2><p>No reviews yet!</p>';
+        return;
+    }
 
-                if (userResponse.ok) {
-                    const user = await userResponse.json();
-                    return {
-                        ...review,
-                        userName: `${user.first_name} ${user.last_name}`
-                    };
-                }
-                return review;
-            } catch (error) {
-                console.error('Error fetching user details:', error);
-                return review;
-            }
-        }));
+    reviewsSection.innerHTML = '<h2>Reviews</h2><div class="review-list"></div>';
+    appendReviews(reviewsSection, reviews, placeId);
+}
 
-        const reviewsHTML = reviewsWithUserNames.map(review => `
+// Ajoute une page d'avis, et le bouton pour la suivante s'il y en a une
+function appendReviews(reviewsSection, reviews, placeId) {
+    const list = reviewsSection.querySelector('.review-list');
+    list.insertAdjacentHTML('beforeend', reviews.items.map(review => {
+        const author = ghostName(review.author, 'Anonymous ghost');
+        const date = review.created_at
+            ? new Date(review.created_at).toLocaleDateString()
+            : 'Unknown';
+        return `
             <div class="review-card">
-                <p><strong>${token ? (review.userName || review.user_id) : 'You must be logged in to see this name'}</strong></p>
+                <p><strong>${author}</strong></p>
                 <p>${review.text}</p>
                 <hr>
-                <p><em>Date: not implemented yet, come back in a few years if it really upsets you 👻<br> Yup, i didn't serialized the created_at from my API review output.</em></p>
+                <p><em>Date: ${date}</em></p>
                 <hr>
                 <p><strong>Rating:</strong> ${'❤️'.repeat(review.rating)}</p>
             </div>
-        `).join('');
-
-        reviewsSection.innerHTML = `
-            <h2>Reviews</h2>
-            ${reviewsHTML}
         `;
-    } else {
-        reviewsSection.innerHTML = '<h2>Reviews</h2><p>No reviews yet!</p>';
-    }
+    }).join(''));
+
+    const previous = reviewsSection.querySelector('.more-reviews');
+    if (previous) previous.remove();
+    if (!reviews.next_cursor) return;
+
+    const more = document.createElement('button');
+    more.className = 'more-reviews';
+    more.textContent = 'More reviews';
+    more.addEventListener('click', async () => {
+        more.disabled = true;
+        try {
+            const page = await fetchPlacePage(placeId, reviews.next_cursor);
+            if (page) {
+                appendReviews(reviewsSection, page.reviews, placeId);
+                return;
+            }
+        } catch (error) {
+            console.error('Error:', error);
+        }
+        more.disabled = false;
+    });
+    reviewsSection.appendChild(more);
 }
 
 // Configuration du formulaire de review